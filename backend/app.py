@@ -9,14 +9,37 @@ import time
 import hmac
 import hashlib
 import secrets
+import base64
+import threading
+import socket
+import gc
+import io
+import importlib.util
+import sys
+from collections import Counter, deque
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import parse_qs, quote, urlparse
 
-import requests
-from flask import Flask, Response, jsonify, request, send_from_directory
+from flask import Flask, Response, g, jsonify, request, send_from_directory
 from flask_cors import CORS
 
+from export import (
+    ExportError,
+    plan_export_concat,
+    splice_wav_clips,
+    stream_encoded_export,
+    stream_wav_export,
+    stream_zip_export,
+    wav_export_header,
+    with_cleanup,
+)
+from jobs import DocumentJobs, document_format_for
+from prefork import forward_to_owner_process, process_scoped_id, serve_preforked, supervisor_pid
+from scheduler import InferenceScheduler, available_cpus, process_cpu_share
+from storage import read_json_file, shared_lock, unique_tmp_path, write_json_file
+
 app = Flask(__name__)
 CORS(app)
 
@@ -26,6 +49,12 @@ STATE_DIR = Path(os.getenv("OPEN_TTS_STATE_DIR", "/data/state"))
 SETTINGS_FILE = STATE_DIR / "settings.json"
 HISTORY_FILE = STATE_DIR / "history.json"
 CLIENT_STATE_DIR = STATE_DIR / "clients"
+PHONETIC_FILE = STATE_DIR / "phonetic.json"
+PHONETIC_MAX_ENTRIES = 5000
+PHONETIC_MAX_WORD_CHARS = 100
+PHONETIC_MAX_REPLACEMENT_CHARS = 300
+PHONETIC_MATCHER_CACHE_SIZE = 256
+METADATA_CACHE_SIZE = 512
 SUPERTONIC_STATE_FILE = STATE_DIR / "supertonic_voices.json"
 DEFAULT_VOICE = os.getenv("PIPER_DEFAULT_VOICE", "en_US-lessac-medium")
 DEFAULT_VOICE_BASE = os.getenv(
@@ -35,27 +64,109 @@ DEFAULT_VOICE_BASE = os.getenv(
 PIPER_BIN = os.getenv("PIPER_BIN", "piper")
 SPEAK_TIMEOUT_SECONDS = int(os.getenv("PIPER_TIMEOUT_SECONDS", "60"))
 PREPEND_SILENCE_MS = int(os.getenv("OPEN_TTS_PREPEND_SILENCE_MS", "0"))
-VOICE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+$")
+VOICE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+(@[a-z0-9]+)?$")
+# Locally generated model variants, addressed as "<voice>@<variant>" and stored as <voice>@<variant>.onnx.
+QUANTIZED_VARIANTS = {"int8"}
+BENCHMARK_MAX_RUNS = 10
+BENCHMARK_DEFAULT_TEXT = "The quick brown fox jumps over the lazy dog. This sentence measures how fast the voice renders."
 CLIENT_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{8,128}$")
 ALLOWED_DOWNLOAD_FORMATS = {"wav", "mp3", "ogg"}
+EXPORT_MAX_ITEMS = max(1, int(os.getenv("OPEN_TTS_EXPORT_MAX_ITEMS", "500")))
+EXPORT_MAX_GAP_MS = 10000
+EXPORT_TITLE_CHARS = 60
 CLIENT_ID_HEADER = "X-OpenTTS-Client"
 DEFAULT_AUDIO_URL_TOKEN_TTL_SECONDS = 24 * 60 * 60
 AUDIO_URL_TOKEN_TTL_SECONDS = int(os.getenv("OPEN_TTS_AUDIO_URL_TOKEN_TTL_SECONDS", str(DEFAULT_AUDIO_URL_TOKEN_TTL_SECONDS)))
 _token_secret_text = (os.getenv("OPEN_TTS_TOKEN_SECRET") or "").strip()
 if not _token_secret_text:
     _token_secret_text = secrets.token_hex(32)
-    print("[open-tts] warning: OPEN_TTS_TOKEN_SECRET is not set; generated ephemeral token secret for this runtime")
+    print(
+        "[open-tts] warning: OPEN_TTS_TOKEN_SECRET is not set; generated ephemeral token secret for this runtime "
+        "(audio URLs will not validate across replicas)"
+    )
 AUDIO_TOKEN_SECRET = _token_secret_text.encode("utf-8")
 SUPERTONIC_VOICE_NAMES = ["M1", "M2", "M3", "M4", "M5", "F1", "F2", "F3", "F4", "F5"]
 SUPERTONIC_LANGS = {"en", "ko", "es", "pt", "fr"}
 SUPERTONIC_PREINSTALLED = {"supertonic:en:M1", "supertonic:en:F1"}
-
-try:
-    from supertonic import TTS as SupertonicTTS
-except Exception:
-    SupertonicTTS = None
+STREAM_SESSION_IDLE_SECONDS = int(os.getenv("OPEN_TTS_STREAM_IDLE_SECONDS", "300"))
+STREAM_KEEPALIVE_SECONDS = 15
+STREAM_EVENT_BACKLOG = 256
+STREAM_MAX_SEGMENTS = 500
+SYNTH_CACHE_ENABLED = os.getenv("OPEN_TTS_SYNTH_CACHE", "1").strip().lower() not in {"0", "false", "no", "off"}
+PREFETCH_MAX_SEGMENTS = int(os.getenv("OPEN_TTS_PREFETCH_MAX_SEGMENTS", "50"))
+PREFETCH_RETENTION_SECONDS = 15 * 60
+PIPER_ENGINE = os.getenv("OPEN_TTS_PIPER_ENGINE", "auto").strip().lower()
+SENTENCE_CACHE_ENABLED = os.getenv("OPEN_TTS_SENTENCE_CACHE", "1").strip().lower() not in {"0", "false", "no", "off"}
+JOBS_DIR = STATE_DIR / "jobs"
+JOB_MAX_INPUT_BYTES = int(os.getenv("OPEN_TTS_JOB_MAX_INPUT_BYTES", str(20 * 1024 * 1024)))
+JOB_CHUNK_CHARS = int(os.getenv("OPEN_TTS_JOB_CHUNK_CHARS", "1200"))
+JOB_WORKERS = max(1, int(os.getenv("OPEN_TTS_JOB_WORKERS", "2")))
+SENTENCE_PATTERN = re.compile(r"[^.!?]+(?:[.!?]+[\"')\]]*|$)")
+LOCKS_DIR = STATE_DIR / "locks"
+AUDIO_LOCKS_DIR = AUDIO_DIR / ".locks"
+PREFETCH_MARKER_DIR = AUDIO_DIR / ".prefetch"
+OPEN_TTS_ROLE = os.getenv("OPEN_TTS_ROLE", "api").strip().lower()
+WORKER_SECRET = (os.getenv("OPEN_TTS_WORKER_SECRET") or "").strip()
+WORKERS_DIR = STATE_DIR / "workers"
+WORKER_ID_PATTERN = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+WORKER_TTL_SECONDS = int(os.getenv("OPEN_TTS_WORKER_TTL_SECONDS", "20"))
+WORKER_FAILURE_COOLDOWN_SECONDS = 30
+WORKER_SECRET_HEADER = "X-OpenTTS-Worker-Secret"
+WORKER_API_URL = (os.getenv("OPEN_TTS_WORKER_API") or "").strip().rstrip("/")
+WORKER_PORT = int(os.getenv("OPEN_TTS_WORKER_PORT", "5001"))
+WORKER_CAPACITY = max(1, int(os.getenv("OPEN_TTS_WORKER_CAPACITY", "2")))
+WORKER_HEARTBEAT_SECONDS = max(1, int(os.getenv("OPEN_TTS_WORKER_HEARTBEAT_SECONDS", "5")))
+SERVER_PROCESSES = max(1, int(os.getenv("OPEN_TTS_PROCESSES", "1")))
+ADMIN_TOKEN = (os.getenv("OPEN_TTS_ADMIN_TOKEN") or "").strip()
+ADMIN_TOKEN_HEADER = "X-OpenTTS-Admin-Token"
+# Internal nginx location that maps to AUDIO_DIR; empty keeps serving files from Flask.
+AUDIO_ACCEL_PREFIX = (os.getenv("OPEN_TTS_AUDIO_ACCEL_PREFIX") or "").strip().rstrip("/")
+# Set by the bundled nginx on proxied requests; direct API-port clients never get an empty redirect body.
+AUDIO_ACCEL_HEADER = "X-OpenTTS-Accel"
+# Fresh /api/speak clips go to a tmpfs ring with this budget until pinned or downloaded; 0 writes them to AUDIO_DIR.
+EPHEMERAL_AUDIO_BYTES = max(0, int(os.getenv("OPEN_TTS_EPHEMERAL_AUDIO_MB", "0"))) * 1024 * 1024
+EPHEMERAL_AUDIO_DIR = Path(os.getenv("OPEN_TTS_EPHEMERAL_AUDIO_DIR", "/dev/shm/open-tts-audio"))
+# Sentence clips are intermediates of the spliced clip; with the ring they stay in tmpfs, within its budget.
+SENTENCE_CACHE_DIR = (EPHEMERAL_AUDIO_DIR if EPHEMERAL_AUDIO_BYTES else AUDIO_DIR) / ".sentences"
+SENTENCE_CACHE_MAX_BYTES = max(0, int(os.getenv("OPEN_TTS_SENTENCE_CACHE_MB", "256"))) * 1024 * 1024
+if EPHEMERAL_AUDIO_BYTES:
+    SENTENCE_CACHE_MAX_BYTES = min(SENTENCE_CACHE_MAX_BYTES, EPHEMERAL_AUDIO_BYTES)
+SCHEDULER_MODE = os.getenv("OPEN_TTS_SCHEDULER_MODE", "latency").strip().lower()
+SYNTHESIS_SLOTS = max(0, int(os.getenv("OPEN_TTS_SYNTHESIS_SLOTS", "0")))
+INTRA_OP_THREADS = max(0, int(os.getenv("OPEN_TTS_INTRA_OP_THREADS", "0")))
+INTER_OP_THREADS = max(1, int(os.getenv("OPEN_TTS_INTER_OP_THREADS", "1")))
+CPU_AFFINITY_ENABLED = os.getenv("OPEN_TTS_CPU_AFFINITY", "0").strip().lower() in {"1", "true", "yes", "on"}
+# Beyond this width a single Piper/Supertonic render gains little from more intra-op threads.
+LATENCY_SLOT_THREADS = 4
+# Always-on background sampling rate for /api/admin/profile; 0 leaves only on-demand profiling.
+PROFILE_ALWAYS_ON_HZ = max(0.0, float(os.getenv("OPEN_TTS_PROFILE_HZ", "0")))
+PROFILE_DEFAULT_HZ = 100
+PROFILE_MAX_HZ = 1000
+PROFILE_MAX_SECONDS = 300
+PROFILE_MAX_STACKS = 20000
+# `python app.py --check-startup` fails when a fresh `import app` exceeds this.
+STARTUP_BUDGET_MS = int(os.getenv("OPEN_TTS_STARTUP_BUDGET_MS", "1000"))
+# Set by --check-startup for its probe interpreter: import the module without starting background work.
+STARTUP_PROBE = os.getenv("OPEN_TTS_STARTUP_PROBE") == "1"
+FIRST_AUDIO_TARGET_MS = int(os.getenv("OPEN_TTS_FIRST_AUDIO_TARGET_MS", "800"))
+CHUNK_MIN_CHARS = 40
+CHUNK_MAX_CHARS = max(CHUNK_MIN_CHARS, int(os.getenv("OPEN_TTS_MAX_CHUNK_CHARS", "600")))
+# Steady-state chunks stay short enough that one render never blocks the queue for long.
+CHUNK_STEADY_RENDER_MS = 4000
+# Used until a voice has been measured: a cautious real-time factor and ~15 characters per second of speech.
+DEFAULT_VOICE_RTF = 0.2
+DEFAULT_MS_PER_CHAR = 65.0
+VOICE_RTF_EWMA_ALPHA = 0.2
+
+# Engine packages (supertonic, piper, onnxruntime) pull in ONNX Runtime and numpy, which dominate
+# cold start; they are imported on first synthesis, warm or preload instead of at module load.
+LAZY_ENGINE_MODULES = ("supertonic", "piper", "onnxruntime")
+_LAZY_MODULES = {}
+_LAZY_MODULES_LOCK = threading.Lock()
 
 _SUPERTONIC_INSTANCE = None
+_PIPER_VOICES = {}
+_PIPER_VOICES_LOCK = threading.Lock()
 
 VOICE_CATALOG = [
     {
@@ -106,10 +217,25 @@ VOICE_CATALOG = [
 ]
 VOICE_CATALOG_BY_ID = {v["id"]: v for v in VOICE_CATALOG}
 
-VOICES_DIR.mkdir(parents=True, exist_ok=True)
-AUDIO_DIR.mkdir(parents=True, exist_ok=True)
-STATE_DIR.mkdir(parents=True, exist_ok=True)
-CLIENT_STATE_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def ensure_dirs() -> None:
+    """Create the data directories; called at server startup, not on import."""
+    for directory in (
+        VOICES_DIR,
+        AUDIO_DIR,
+        SENTENCE_CACHE_DIR,
+        STATE_DIR,
+        CLIENT_STATE_DIR,
+        JOBS_DIR,
+        LOCKS_DIR,
+        AUDIO_LOCKS_DIR,
+        PREFETCH_MARKER_DIR,
+        WORKERS_DIR,
+    ):
+        directory.mkdir(parents=True, exist_ok=True)
+    if EPHEMERAL_AUDIO_BYTES:
+        EPHEMERAL_AUDIO_DIR.mkdir(parents=True, exist_ok=True)
 
 DEFAULT_SETTINGS = {
     "voice": DEFAULT_VOICE,
@@ -123,21 +249,6 @@ DEFAULT_SETTINGS = {
 }
 
 
-def read_json_file(path: Path, default_value):
-    if not path.exists():
-        return default_value
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return default_value
-
-
-def write_json_file(path: Path, data) -> None:
-    tmp_path = path.with_suffix(path.suffix + ".tmp")
-    tmp_path.write_text(json.dumps(data, ensure_ascii=True, indent=2), encoding="utf-8")
-    tmp_path.replace(path)
-
-
 def normalized_client_id(raw_value: str) -> str:
     value = str(raw_value or "").strip()
     if not value:
@@ -219,6 +330,115 @@ def save_history(items: list, client_id: str = "") -> list:
     return history
 
 
+def phonetic_dictionary_path(state_key: str = "") -> Path:
+    # Keyed by client_state_key() so document jobs, which only keep the hashed key, can use it too.
+    if not state_key:
+        return PHONETIC_FILE
+    return CLIENT_STATE_DIR / f"{state_key}.phonetic.json"
+
+
+def normalize_phonetic_entries(incoming) -> list:
+    """Clean {word, replacement} entries; for case-insensitive duplicates the later entry wins."""
+    if not isinstance(incoming, list):
+        return []
+    latest = {}
+    for item in incoming:
+        if not isinstance(item, dict):
+            continue
+        word = " ".join(str(item.get("word") or "").split())[:PHONETIC_MAX_WORD_CHARS]
+        replacement = " ".join(str(item.get("replacement") or "").split())[:PHONETIC_MAX_REPLACEMENT_CHARS]
+        if word and replacement:
+            latest.pop(word.lower(), None)
+            latest[word.lower()] = {"word": word, "replacement": replacement}
+    return list(latest.values())[-PHONETIC_MAX_ENTRIES:]
+
+
+def load_phonetic_entries(state_key: str = "") -> list:
+    return normalize_phonetic_entries(read_json_file(phonetic_dictionary_path(state_key), []))
+
+
+def save_phonetic_entries(entries, state_key: str = "") -> list:
+    entries = normalize_phonetic_entries(entries)
+    write_json_file(phonetic_dictionary_path(state_key), entries)
+    return entries
+
+
+def trie_regex(words: list) -> str:
+    """Regex source matching any of `words`, factored into a character trie; the longest entry wins."""
+    # A flat a|b|c alternation costs O(entries) at every text position; the trie only follows shared prefixes.
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        group = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{group})?"
+        return group
+
+    return build(trie)
+
+
+_PHONETIC_MATCHERS = {}
+_PHONETIC_MATCHERS_LOCK = threading.Lock()
+
+
+def path_signature(path: Path) -> int:
+    # Files here are replaced atomically, so a new mtime means new content (on every replica sharing the volume).
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def phonetic_matcher(state_key: str = ""):
+    """Compiled (pattern, replacements) for the global dictionary overlaid with the client's, or None."""
+    signature = (
+        path_signature(PHONETIC_FILE),
+        path_signature(phonetic_dictionary_path(state_key)) if state_key else 0,
+    )
+    with _PHONETIC_MATCHERS_LOCK:
+        cached = _PHONETIC_MATCHERS.get(state_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    replacements = {item["word"].lower(): item["replacement"] for item in load_phonetic_entries()}
+    if state_key:
+        replacements.update((item["word"].lower(), item["replacement"]) for item in load_phonetic_entries(state_key))
+    matcher = None
+    if replacements:
+        # Whole words only, with the same word characters as the web UI's highlighter.
+        pattern = re.compile(
+            rf"(?<![A-Za-z0-9_]){trie_regex(list(replacements))}(?![A-Za-z0-9_])", re.IGNORECASE
+        )
+        matcher = (pattern, replacements)
+    with _PHONETIC_MATCHERS_LOCK:
+        _PHONETIC_MATCHERS.pop(state_key, None)
+        _PHONETIC_MATCHERS[state_key] = (signature, matcher)
+        while len(_PHONETIC_MATCHERS) > PHONETIC_MATCHER_CACHE_SIZE:
+            _PHONETIC_MATCHERS.pop(next(iter(_PHONETIC_MATCHERS)))
+    return matcher
+
+
+def apply_phonetic_dictionary(text: str, state_key: str = "") -> str:
+    """Rewrite dictionary words in one pass, so a replacement is never itself replaced again."""
+    matcher = phonetic_matcher(state_key)
+    if matcher is None:
+        return text
+    pattern, replacements = matcher
+    return pattern.sub(lambda match: replacements.get(match.group(0).lower(), match.group(0)), text)
+
+
+def normalize_speech_text(text: str, client_id: str = "") -> str:
+    """Server-side text normalization applied before synthesis, so cache keys see the spoken text."""
+    return apply_phonetic_dictionary(text, client_state_key(client_id) if client_id else "")
+
+
 def ensure_default_voice() -> None:
     model_path = VOICES_DIR / f"{DEFAULT_VOICE}.onnx"
     config_path = VOICES_DIR / f"{DEFAULT_VOICE}.onnx.json"
@@ -231,10 +451,7 @@ def ensure_default_voice() -> None:
         download_voice(default_info["id"], default_info["base_url"])
         return
 
-    model_url = f"{DEFAULT_VOICE_BASE}/{DEFAULT_VOICE}.onnx"
-    config_url = f"{DEFAULT_VOICE_BASE}/{DEFAULT_VOICE}.onnx.json"
-    download_file(model_url, model_path)
-    download_file(config_url, config_path)
+    download_voice(DEFAULT_VOICE, DEFAULT_VOICE_BASE)
 
 
 def ensure_preinstalled_piper_voices() -> None:
@@ -256,27 +473,108 @@ def ensure_preinstalled_piper_voices() -> None:
 
 
 def download_file(url: str, target: Path) -> None:
-    response = requests.get(url, timeout=60)
-    response.raise_for_status()
-    target.write_bytes(response.content)
+    # requests is imported where it is used so startup does not pay for it.
+    import requests
+
+    # Stream into a private temp file; the final name only appears once the download is complete.
+    tmp_path = unique_tmp_path(target)
+    try:
+        with requests.get(url, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            with tmp_path.open("wb") as handle:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    handle.write(chunk)
+        tmp_path.replace(target)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
 def download_voice(voice_id: str, base_url: str) -> None:
     model_path = VOICES_DIR / f"{voice_id}.onnx"
     config_path = VOICES_DIR / f"{voice_id}.onnx.json"
-    if not model_path.exists():
-        download_file(f"{base_url}/{voice_id}.onnx", model_path)
-    if not config_path.exists():
-        download_file(f"{base_url}/{voice_id}.onnx.json", config_path)
+    if model_path.exists() and config_path.exists():
+        return
+    # One download per voice across all replicas; the others wait and then find the files present.
+    with shared_lock(f"voice-{voice_id}", LOCKS_DIR):
+        if not model_path.exists():
+            download_file(f"{base_url}/{voice_id}.onnx", model_path)
+        if not config_path.exists():
+            download_file(f"{base_url}/{voice_id}.onnx.json", config_path)
+
+
+def split_voice_variant(voice_id: str) -> tuple:
+    base, _sep, variant = voice_id.partition("@")
+    return base, variant
+
+
+def module_available(name: str) -> bool:
+    """Whether an optional engine module can be used, without importing it when it has not been yet."""
+    with _LAZY_MODULES_LOCK:
+        if name in _LAZY_MODULES:
+            return _LAZY_MODULES[name] is not None
+    return importlib.util.find_spec(name) is not None
+
+
+def lazy_module(name: str):
+    """Import an optional engine module on first use; None when it is missing or fails to import."""
+    with _LAZY_MODULES_LOCK:
+        if name not in _LAZY_MODULES:
+            try:
+                _LAZY_MODULES[name] = importlib.import_module(name)
+            except Exception as exc:
+                if importlib.util.find_spec(name) is not None:
+                    print(f"[open-tts] warning: could not import {name}: {exc}")
+                _LAZY_MODULES[name] = None
+        return _LAZY_MODULES[name]
+
+
+def quantization_available() -> bool:
+    # onnxruntime.quantization needs the onnx package, which piper-tts does not pull in.
+    return module_available("onnxruntime") and importlib.util.find_spec("onnx") is not None
+
+
+def quantize_voice(voice_id: str) -> str:
+    """Write a dynamically int8-quantized copy of an installed Piper voice; returns the variant id."""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    variant_id = f"{voice_id}@int8"
+    model_path = VOICES_DIR / f"{variant_id}.onnx"
+    config_path = VOICES_DIR / f"{variant_id}.onnx.json"
+    with shared_lock(f"voice-{variant_id}", LOCKS_DIR):
+        if not model_path.exists():
+            tmp_path = unique_tmp_path(model_path)
+            try:
+                # Weights become int8, activations are quantized per call; no calibration data needed.
+                quantize_dynamic(str(VOICES_DIR / f"{voice_id}.onnx"), str(tmp_path), weight_type=QuantType.QInt8)
+                tmp_path.replace(model_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        if not config_path.exists():
+            tmp_path = unique_tmp_path(config_path)
+            try:
+                shutil.copyfile(VOICES_DIR / f"{voice_id}.onnx.json", tmp_path)
+                tmp_path.replace(config_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+    return variant_id
+
+
+def installed_voice_variants(voice_id: str) -> list:
+    return sorted(
+        variant
+        for variant in QUANTIZED_VARIANTS
+        if (VOICES_DIR / f"{voice_id}@{variant}.onnx").exists()
+    )
 
 
 def list_voice_models():
     voices = []
     for model_file in sorted(VOICES_DIR.glob("*.onnx")):
+        base, variant = split_voice_variant(model_file.stem)
         voices.append(
             {
                 "id": model_file.stem,
-                "label": model_file.stem.replace("_", " "),
+                "label": base.replace("_", " ") + (f" ({variant})" if variant else ""),
                 "model": str(model_file.name),
             }
         )
@@ -286,12 +584,15 @@ def list_voice_models():
 
 def list_catalog_with_status():
     installed = {voice["id"] for voice in list_voice_models()}
+    quantizable = quantization_available()
     catalog = [
         {
             "id": item["id"],
             "label": item["label"],
             "installed": item["id"] in installed,
             "isDefault": item["id"] == DEFAULT_VOICE,
+            "variants": installed_voice_variants(item["id"]),
+            "quantizable": quantizable,
         }
         for item in VOICE_CATALOG
     ]
@@ -360,7 +661,7 @@ def set_enabled_supertone_voice_ids(voice_ids):
 
 
 def list_supertone_models():
-    if SupertonicTTS is None:
+    if not module_available("supertonic"):
         return []
     enabled = get_enabled_supertone_voice_ids()
     return [
@@ -374,12 +675,56 @@ def list_supertone_models():
     ]
 
 
-def get_supertone_tts():
+INFERENCE_SCHEDULER = InferenceScheduler(
+    SCHEDULER_MODE,
+    slots=SYNTHESIS_SLOTS,
+    intra_threads=INTRA_OP_THREADS,
+    inter_threads=INTER_OP_THREADS,
+    latency_threads=LATENCY_SLOT_THREADS,
+    affinity=CPU_AFFINITY_ENABLED,
+)
+
+
+def inference_session_options():
+    """SessionOptions sized to one scheduler slot, or None when Piper's own defaults should be kept."""
+    threads = INFERENCE_SCHEDULER.session_threads()
+    if threads is None:
+        return None
+    onnxruntime = lazy_module("onnxruntime")
+    if onnxruntime is None:
+        return None
+    options = onnxruntime.SessionOptions()
+    options.intra_op_num_threads, options.inter_op_num_threads = threads
+    if INFERENCE_SCHEDULER.slots > 1:
+        # Idle pool threads spin by default; with several slots that spinning steals cores from the others.
+        options.add_session_config_entry("session.intra_op.allow_spinning", "0")
+    return options
+
+
+def get_supertone_tts(require_thread_limits: bool = False):
+    """Process-wide Supertonic instance; require_thread_limits refuses releases that cannot survive fork()."""
     global _SUPERTONIC_INSTANCE
-    if SupertonicTTS is None:
-        raise RuntimeError("supertonic package is not installed")
     if _SUPERTONIC_INSTANCE is None:
-        _SUPERTONIC_INSTANCE = SupertonicTTS(auto_download=True)
+        supertonic = lazy_module("supertonic")
+        if supertonic is None:
+            raise RuntimeError("supertonic package is not installed")
+        tts_class = supertonic.TTS
+        # auto_download may fetch model files; let one replica (and one thread) do it at a time.
+        with shared_lock("supertonic-models", LOCKS_DIR):
+            if _SUPERTONIC_INSTANCE is None:
+                threads = INFERENCE_SCHEDULER.session_threads()
+                if threads is None:
+                    _SUPERTONIC_INSTANCE = tts_class(auto_download=True)
+                else:
+                    try:
+                        _SUPERTONIC_INSTANCE = tts_class(
+                            auto_download=True, intra_op_num_threads=threads[0], inter_op_num_threads=threads[1]
+                        )
+                    except TypeError:
+                        # Older supertonic releases do not take thread counts.
+                        if require_thread_limits:
+                            raise RuntimeError("this supertonic release cannot limit its ONNX thread pools")
+                        _SUPERTONIC_INSTANCE = tts_class(auto_download=True)
     return _SUPERTONIC_INSTANCE
 
 
@@ -431,6 +776,1019 @@ def prepend_wav_silence(path: Path, silence_ms: int) -> None:
     tmp_path.replace(path)
 
 
+class SynthesisError(Exception):
+    def __init__(self, message: str, status: int = 500, details: dict = None):
+        super().__init__(message)
+        self.status = status
+        self.details = details or {}
+
+    def payload(self) -> dict:
+        return {"error": str(self), **self.details}
+
+    def to_response(self):
+        return jsonify(self.payload()), self.status
+
+
+def resolve_silence_ms(requested, client_id: str = "") -> int:
+    current_settings = load_settings(client_id)
+    silence_ms = int(current_settings.get("prependSilenceMs", PREPEND_SILENCE_MS))
+    if requested is not None:
+        try:
+            silence_ms = int(requested)
+        except (TypeError, ValueError):
+            silence_ms = int(current_settings.get("prependSilenceMs", PREPEND_SILENCE_MS))
+    return max(0, min(silence_ms, 3000))
+
+
+def resolve_piper_voice(voice: str) -> str:
+    if (VOICES_DIR / f"{voice}.onnx").exists():
+        return voice
+    if (VOICES_DIR / f"{DEFAULT_VOICE}.onnx").exists():
+        return DEFAULT_VOICE
+    raise SynthesisError(f"voice not found: {voice}", 400)
+
+
+def resident_piper_enabled() -> bool:
+    if PIPER_ENGINE == "subprocess":
+        return False
+    return module_available("piper")
+
+
+def get_piper_voice(voice: str):
+    """Load a Piper model once per process and keep it resident; reloads when the .onnx changes."""
+    model_path = VOICES_DIR / f"{voice}.onnx"
+    mtime = model_path.stat().st_mtime_ns
+    with _PIPER_VOICES_LOCK:
+        cached = _PIPER_VOICES.get(voice)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        piper = lazy_module("piper")
+        if piper is None:
+            raise RuntimeError("piper package could not be imported")
+        loaded = piper.PiperVoice.load(str(model_path))
+        options = inference_session_options()
+        if options is not None:
+            # PiperVoice.load() builds a session with ONNX Runtime defaults (one thread per core);
+            # rebuild it sized to a scheduler slot.
+            loaded.session = lazy_module("onnxruntime").InferenceSession(
+                str(model_path), sess_options=options, providers=["CPUExecutionProvider"]
+            )
+        _PIPER_VOICES[voice] = (mtime, loaded)
+        return loaded
+
+
+def preload_models() -> None:
+    """Load every installed model into this process before forking so children share its pages."""
+    if resident_piper_enabled():
+        for model_path in sorted(VOICES_DIR.glob("*.onnx")):
+            try:
+                get_piper_voice(model_path.stem)
+            except Exception as exc:
+                print(f"[open-tts] warning: could not preload {model_path.stem}: {exc}")
+    if module_available("supertonic") and get_enabled_supertone_voice_ids():
+        # All Supertonic voices share one model; like Piper it is sized by session_threads(), which
+        # returns single-threaded pools under prefork.
+        try:
+            get_supertone_tts(require_thread_limits=True)
+        except Exception as exc:
+            print(f"[open-tts] warning: could not preload supertonic, each process loads its own: {exc}")
+    # Move everything allocated so far out of the collector's reach; otherwise GC passes in the
+    # children write to these objects' headers and un-share their pages.
+    gc.collect()
+    gc.freeze()
+
+
+def evict_piper_voice(voice: str) -> None:
+    with _PIPER_VOICES_LOCK:
+        _PIPER_VOICES.pop(voice, None)
+
+
+def alignment_word_durations(alignments, sample_rate: int):
+    """Sum Piper phoneme alignments into per-word durations (ms); spaces in the phoneme stream separate words."""
+    words = []
+    current = 0
+    for alignment in alignments or []:
+        if alignment.phoneme == " ":
+            if current:
+                words.append(current)
+            current = 0
+        current += alignment.num_samples
+    if current:
+        words.append(current)
+    return [samples * 1000.0 / sample_rate for samples in words]
+
+
+def synthesize_with_resident_piper(text: str, voice: str, speed: float, output_path: Path):
+    try:
+        piper_voice = get_piper_voice(voice)
+        syn_config = lazy_module("piper").SynthesisConfig(length_scale=normalize_speed(speed))
+        with wave.open(str(output_path), "wb") as wav_file:
+            try:
+                alignments = piper_voice.synthesize_wav(text, wav_file, syn_config=syn_config, include_alignments=True)
+            except TypeError:
+                # piper-tts without alignment support.
+                alignments = piper_voice.synthesize_wav(text, wav_file, syn_config=syn_config)
+    except Exception as exc:
+        raise SynthesisError("piper synthesis failed", 500, {"stderr": str(exc)}) from exc
+    # Only models exported with alignment output report phoneme durations.
+    if not alignments:
+        return None
+    return alignment_word_durations(alignments, piper_voice.config.sample_rate)
+
+
+def synthesize_with_piper(text: str, voice: str, speed: float, output_path: Path):
+    if resident_piper_enabled():
+        return synthesize_with_resident_piper(text, voice, speed, output_path)
+
+    cmd = [
+        PIPER_BIN,
+        "--model",
+        str(VOICES_DIR / f"{voice}.onnx"),
+        "--output_file",
+        str(output_path),
+        "--length_scale",
+        str(normalize_speed(speed)),
+    ]
+
+    try:
+        subprocess.run(
+            cmd,
+            input=text.encode("utf-8"),
+            capture_output=True,
+            check=True,
+            timeout=SPEAK_TIMEOUT_SECONDS,
+        )
+    except subprocess.CalledProcessError as exc:
+        raise SynthesisError(
+            "piper synthesis failed",
+            500,
+            {"stderr": exc.stderr.decode("utf-8", errors="ignore")},
+        ) from exc
+    except subprocess.TimeoutExpired as exc:
+        raise SynthesisError("piper synthesis timed out", 504) from exc
+    return None
+
+
+_VOICE_RTF = {}
+_VOICE_RTF_LOCK = threading.Lock()
+
+
+def record_voice_rtf(voice: str, text: str, speed: float, elapsed_ms: float, audio_ms: float) -> None:
+    """Fold one render into the voice's moving averages of real-time factor and audio length per character."""
+    chars = len(text.strip())
+    if audio_ms <= 0 or chars <= 0:
+        return
+    rtf = elapsed_ms / audio_ms
+    # Normalize to speed 1.0 so clients at any speed share one estimate.
+    ms_per_char = audio_ms * max(speed, 0.1) / chars
+    with _VOICE_RTF_LOCK:
+        stats = _VOICE_RTF.get(voice)
+        if stats is None:
+            _VOICE_RTF[voice] = {"rtf": rtf, "msPerChar": ms_per_char, "samples": 1}
+            return
+        stats["rtf"] += VOICE_RTF_EWMA_ALPHA * (rtf - stats["rtf"])
+        stats["msPerChar"] += VOICE_RTF_EWMA_ALPHA * (ms_per_char - stats["msPerChar"])
+        stats["samples"] += 1
+
+
+def synthesis_slowdown() -> float:
+    """How much slower than an idle node a new render runs right now (1.0 = a slot is free)."""
+    queue = INFERENCE_SCHEDULER.describe()
+    if queue["mode"] == "off":
+        return float(max(1, FOREGROUND_SYNTHESIS.active))
+    return max(1.0, (queue["active"] + queue["waiting"] + 1) / max(1, queue["slots"]))
+
+
+def chunk_advice(voice: str, slowdown: float) -> dict:
+    """Recommended narrator chunk sizes (characters) for minimal time-to-first-audio without gaps."""
+    with _VOICE_RTF_LOCK:
+        stats = dict(_VOICE_RTF.get(voice) or {})
+    rtf = stats.get("rtf", DEFAULT_VOICE_RTF)
+    ms_per_char = stats.get("msPerChar", DEFAULT_MS_PER_CHAR)
+    render_ms_per_char = max(ms_per_char * rtf * slowdown, 0.01)
+
+    def bucket(chars: float) -> int:
+        # Coarse buckets keep segmentation (and therefore cache keys) stable between requests.
+        return int(max(CHUNK_MIN_CHARS, min(chars, CHUNK_MAX_CHARS)) // 20 * 20)
+
+    return {
+        "realTimeFactor": round(rtf, 3),
+        "msPerChar": round(ms_per_char, 1),
+        "samples": stats.get("samples", 0),
+        "firstChunkChars": bucket(FIRST_AUDIO_TARGET_MS / render_ms_per_char),
+        "chunkChars": bucket(CHUNK_STEADY_RENDER_MS / render_ms_per_char),
+        # Later chunks render while the previous one plays, so at an effective RTF of r they can be 1/r times longer.
+        "growth": round(max(1.25, min(1.0 / max(rtf * slowdown, 0.01), 4.0)), 2),
+    }
+
+
+def render_with_engine(text: str, voice: str, speed: float, output_path: Path):
+    """Render one clip; returns per-word durations (ms) when the engine reports them, else None."""
+    in_process = voice.startswith("supertonic:") or resident_piper_enabled()
+    with INFERENCE_SCHEDULER.slot(pin=INFERENCE_SCHEDULER.pinnable(in_process)):
+        started = time.perf_counter()
+        if voice.startswith("supertonic:"):
+            try:
+                synthesize_with_supertone(text, voice, speed, output_path)
+            except Exception as exc:
+                raise SynthesisError(f"supertonic synthesis failed: {exc}", 500) from exc
+            word_ms = None
+        else:
+            word_ms = synthesize_with_piper(text, voice, speed, output_path)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+    try:
+        record_voice_rtf(voice, text, speed, elapsed_ms, wav_duration_ms(output_path))
+    except (OSError, wave.Error, EOFError):
+        pass
+    return word_ms
+
+
+def sentence_spans(text: str) -> list:
+    """Return (start, end, normalized sentence) for each sentence, with offsets into `text`."""
+    spans = []
+    offset = 0
+    for paragraph in re.split(r"(\n\s*\n)", text):
+        if not paragraph.strip():
+            offset += len(paragraph)
+            continue
+        for match in SENTENCE_PATTERN.finditer(paragraph):
+            sentence = " ".join(match.group(0).split())
+            if sentence:
+                spans.append((offset + match.start(), offset + match.end(), sentence))
+        offset += len(paragraph)
+    return spans
+
+
+def split_sentences(text: str) -> list:
+    return [sentence for _start, _end, sentence in sentence_spans(text)]
+
+
+def sentence_reuse_supported(voice: str) -> bool:
+    # Per-sentence renders are only cheap when the model stays loaded between calls.
+    if voice.startswith("supertonic:"):
+        return module_available("supertonic")
+    return resident_piper_enabled()
+
+
+def sentence_cache_key(sentence: str, voice: str, speed: float) -> str:
+    raw = json.dumps(["sentence", voice, round(float(speed), 3), sentence], ensure_ascii=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def render_sentence_clips(sentences: list, voice: str, speed: float) -> list:
+    """Return cached per-sentence clips, rendering only the sentences not seen before for this voice/speed."""
+    clips = []
+    rendered = False
+    for sentence in sentences:
+        key = sentence_cache_key(sentence, voice, speed)
+
+        def render(path: Path, sentence=sentence, key=key) -> None:
+            word_ms = render_with_engine(sentence, voice, speed, path)
+            if word_ms:
+                write_json_file(SENTENCE_CACHE_DIR / f"{key}.words.json", word_ms)
+
+        path = SENTENCE_CACHE_DIR / f"{key}.wav"
+        if render_cached(key, render, SENTENCE_CACHE_DIR):
+            try:
+                # Reused sentences move to the young end of the cache.
+                os.utime(path)
+            except FileNotFoundError:
+                render_cached(key, render, SENTENCE_CACHE_DIR)
+        else:
+            rendered = True
+        clips.append(path)
+    if rendered:
+        trim_sentence_cache()
+    return clips
+
+
+def trim_sentence_cache() -> None:
+    """Evict least recently used sentence clips until the cache fits SENTENCE_CACHE_MAX_BYTES."""
+    clips = []
+    for path in SENTENCE_CACHE_DIR.glob("*.wav"):
+        if path.name.startswith("."):
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        clips.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _mtime, size, _path in clips)
+    # Clips used this recently may be about to be spliced by a render still in progress.
+    in_use_after = time.time() - SPEAK_TIMEOUT_SECONDS
+    for mtime, size, path in sorted(clips):
+        if total <= SENTENCE_CACHE_MAX_BYTES or mtime >= in_use_after:
+            break
+        path.unlink(missing_ok=True)
+        path.with_suffix(".words.json").unlink(missing_ok=True)
+        total -= size
+
+
+def wav_duration_ms(path: Path) -> float:
+    with wave.open(str(path), "rb") as src:
+        return src.getnframes() * 1000.0 / src.getframerate()
+
+
+def word_weight(word: str) -> float:
+    # Rough speaking-time weight: letters plus a pause after clause and sentence punctuation.
+    weight = len(word) + 1.0
+    if word[-1] in ",;:":
+        weight += 3.0
+    elif word[-1] in ".!?":
+        weight += 6.0
+    return weight
+
+
+def build_speech_timings(text: str, duration_ms: float, silence_ms: int, sentence_ms=None, word_ms=None) -> dict:
+    # Measured sentence clip and aligned word durations win; anything missing is estimated from character weights.
+    spans = sentence_spans(text) or [(0, len(text), " ".join(text.split()))]
+    words = [[] for _ in spans]
+    for match in re.finditer(r"\S+", text):
+        index = next((i for i in range(len(spans) - 1, -1, -1) if spans[i][0] <= match.start()), 0)
+        words[index].append(match)
+
+    measured = sentence_ms is not None and len(sentence_ms) == len(spans)
+    aligned = [
+        bool(word_ms) and len(word_ms) == len(spans) and word_ms[i] is not None and len(word_ms[i]) == len(words[i])
+        for i in range(len(spans))
+    ]
+    if not measured:
+        weights = [sum(word_weight(m.group(0)) for m in group) or 1.0 for group in words]
+        speech_ms = max(0.0, duration_ms - silence_ms)
+        sentence_ms = [speech_ms * weight / sum(weights) for weight in weights]
+
+    timings = {"durationMs": round(duration_ms), "sentences": [], "words": []}
+    cursor = float(silence_ms)
+    for index, ((start, end, sentence), group) in enumerate(zip(spans, words)):
+        length = sentence_ms[index]
+        if aligned[index]:
+            durations = list(word_ms[index])
+            # Alignment covers speech only; any trailing clip silence belongs to the last word.
+            durations[-1] += max(0.0, length - sum(durations))
+        else:
+            weights = [word_weight(m.group(0)) for m in group]
+            durations = [length * weight / (sum(weights) or 1.0) for weight in weights]
+        timings["sentences"].append(
+            {"text": sentence, "start": start, "end": end, "startMs": round(cursor), "endMs": round(cursor + length)}
+        )
+        word_cursor = cursor
+        for match, duration in zip(group, durations):
+            timings["words"].append(
+                {
+                    "text": match.group(0),
+                    "start": match.start(),
+                    "end": match.end(),
+                    "sentence": index,
+                    "startMs": round(word_cursor),
+                    "endMs": round(word_cursor + duration),
+                }
+            )
+            word_cursor += duration
+        cursor += length
+    timings["source"] = "alignment" if all(aligned) else ("sentences" if measured else "estimate")
+    return timings
+
+
+def render_speech(
+    text: str, voice: str, speed: float, silence_ms: int, output_path: Path, reuse_sentences: bool = True
+) -> dict:
+    """Render `text` into output_path and return its timings; reuse_sentences=False bypasses the sentence cache."""
+    # Background renders (jobs, prefetch, stream sessions) run outside a request; sample them too.
+    with profiled_thread():
+        return _render_speech(text, voice, speed, silence_ms, output_path, reuse_sentences)
+
+
+def _render_speech(
+    text: str, voice: str, speed: float, silence_ms: int, output_path: Path, reuse_sentences: bool = True
+) -> dict:
+    sentences = split_sentences(text) if SENTENCE_CACHE_ENABLED and reuse_sentences else []
+    if len(sentences) > 1 and sentence_reuse_supported(voice):
+        # Edited documents only re-render the sentences that changed; the rest is spliced from cache.
+        clips = render_sentence_clips(sentences, voice, speed)
+        try:
+            splice_wav_clips(clips, output_path, silence_ms)
+        except ExportError as exc:
+            raise SynthesisError(f"could not splice sentence clips: {exc}", exc.status) from exc
+        return build_speech_timings(
+            text,
+            wav_duration_ms(output_path),
+            silence_ms,
+            sentence_ms=[wav_duration_ms(clip) for clip in clips],
+            word_ms=[read_json_file(clip.with_suffix(".words.json"), None) for clip in clips],
+        )
+
+    word_ms = render_with_engine(text, voice, speed, output_path)
+    try:
+        prepend_wav_silence(output_path, silence_ms)
+    except Exception as exc:
+        # Do not fail synthesis when silence prepend fails.
+        print(f"[open-tts] warning: could not prepend silence: {exc}")
+        silence_ms = 0
+    timings = build_speech_timings(text, wav_duration_ms(output_path), silence_ms)
+    if word_ms and len(word_ms) == len(timings["words"]):
+        per_sentence = [[] for _ in timings["sentences"]]
+        for word, duration in zip(timings["words"], word_ms):
+            per_sentence[word["sentence"]].append(duration)
+        timings = build_speech_timings(
+            text,
+            timings["durationMs"],
+            silence_ms,
+            sentence_ms=[sum(durations) for durations in per_sentence],
+            word_ms=per_sentence,
+        )
+    return timings
+
+
+class SynthesisGate:
+    """Counts foreground renders so background work (prefetch) only runs when the node is otherwise idle."""
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.active = 0
+
+    def __enter__(self):
+        with self.cond:
+            self.active += 1
+        return self
+
+    def __exit__(self, *_exc):
+        with self.cond:
+            self.active -= 1
+            self.cond.notify_all()
+
+    def wait_idle(self, timeout: float = None) -> bool:
+        with self.cond:
+            return self.cond.wait_for(lambda: self.active == 0, timeout=timeout)
+
+
+FOREGROUND_SYNTHESIS = SynthesisGate()
+_SYNTH_INFLIGHT = {}
+_SYNTH_INFLIGHT_LOCK = threading.Lock()
+
+
+def synthesis_cache_key(text: str, voice: str, speed: float, silence_ms: int) -> str:
+    raw = json.dumps([voice, round(float(speed), 3), int(silence_ms), text], ensure_ascii=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def render_cached(key: str, render, directory: Path = None) -> bool:
+    """Render <directory>/<key>.wav once across threads and replicas; returns True on a cache hit."""
+    directory = directory or AUDIO_DIR
+    path = directory / f"{key}.wav"
+    while True:
+        if path.exists():
+            return True
+        with _SYNTH_INFLIGHT_LOCK:
+            done = _SYNTH_INFLIGHT.get(key)
+            owner = done is None
+            if owner:
+                done = threading.Event()
+                _SYNTH_INFLIGHT[key] = done
+        if not owner:
+            done.wait(SPEAK_TIMEOUT_SECONDS)
+            continue
+        tmp_path = directory / f".{key}.{uuid.uuid4().hex}.tmp.wav"
+        try:
+            with shared_lock(key, AUDIO_LOCKS_DIR, timeout=SPEAK_TIMEOUT_SECONDS * 2):
+                if path.exists():
+                    # Another replica rendered it while we waited for the lock.
+                    return True
+                render(tmp_path)
+                tmp_path.replace(path)
+                return False
+        except TimeoutError as exc:
+            raise SynthesisError("timed out waiting for another replica to render this audio", 504) from exc
+        finally:
+            tmp_path.unlink(missing_ok=True)
+            with _SYNTH_INFLIGHT_LOCK:
+                _SYNTH_INFLIGHT.pop(key, None)
+            done.set()
+
+
+def speech_timings_path(output_name: str, directory: Path = None) -> Path:
+    return (directory or AUDIO_DIR) / f"{Path(output_name).stem}.timings.json"
+
+
+def audio_file_path(output_name: str) -> Path:
+    """Where a clip lives: AUDIO_DIR once it is durable, otherwise the ephemeral ring if it is still there."""
+    path = AUDIO_DIR / output_name
+    if EPHEMERAL_AUDIO_BYTES and not path.exists():
+        ephemeral_path = EPHEMERAL_AUDIO_DIR / output_name
+        if ephemeral_path.exists():
+            return ephemeral_path
+    return path
+
+
+def trim_ephemeral_audio() -> None:
+    """Evict the oldest ring clips until the ring fits EPHEMERAL_AUDIO_BYTES again."""
+    clips = []
+    for path in EPHEMERAL_AUDIO_DIR.glob("*.wav"):
+        if path.name.startswith("."):
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        clips.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _mtime, size, _path in clips)
+    for _mtime, size, path in sorted(clips):
+        if total <= EPHEMERAL_AUDIO_BYTES:
+            break
+        path.unlink(missing_ok=True)
+        speech_timings_path(path.name, EPHEMERAL_AUDIO_DIR).unlink(missing_ok=True)
+        total -= size
+
+
+def persist_audio_file(output_name: str) -> bool:
+    """Move a ring clip and its timings into AUDIO_DIR; returns whether the clip is now durable."""
+    target = AUDIO_DIR / output_name
+    if target.exists():
+        return True
+    if not EPHEMERAL_AUDIO_BYTES:
+        return False
+    source = EPHEMERAL_AUDIO_DIR / output_name
+    timings = read_json_file(speech_timings_path(output_name, EPHEMERAL_AUDIO_DIR), None)
+    tmp_path = unique_tmp_path(target)
+    try:
+        shutil.copyfile(source, tmp_path)
+        # Timings land first so a durable clip is never seen without them.
+        if isinstance(timings, dict):
+            write_json_file(speech_timings_path(output_name), timings)
+        tmp_path.replace(target)
+    except FileNotFoundError:
+        # Evicted before anyone asked to keep it.
+        return target.exists()
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    source.unlink(missing_ok=True)
+    speech_timings_path(output_name, EPHEMERAL_AUDIO_DIR).unlink(missing_ok=True)
+    return True
+
+
+def persist_pinned_audio(items: list) -> None:
+    """Pinned history entries keep their clip beyond the ephemeral ring."""
+    if not EPHEMERAL_AUDIO_BYTES:
+        return
+    for item in items:
+        if isinstance(item, dict) and item.get("pinned") and item.get("audioUrl"):
+            filename = safe_audio_filename(str(item["audioUrl"]))
+            if filename:
+                persist_audio_file(filename)
+
+
+def load_speech_timings(output_name: str, text: str, silence_ms: int) -> dict:
+    audio_path = audio_file_path(output_name)
+    path = speech_timings_path(output_name, audio_path.parent)
+    timings = read_json_file(path, None)
+    if isinstance(timings, dict):
+        return timings
+    # Clips rendered before timings were recorded: estimate once and keep the result.
+    timings = build_speech_timings(text, wav_duration_ms(audio_path), silence_ms)
+    write_json_file(path, timings)
+    return timings
+
+
+def remove_audio_file(output_name: str) -> None:
+    (AUDIO_DIR / output_name).unlink(missing_ok=True)
+    speech_timings_path(output_name).unlink(missing_ok=True)
+    if EPHEMERAL_AUDIO_BYTES:
+        (EPHEMERAL_AUDIO_DIR / output_name).unlink(missing_ok=True)
+        speech_timings_path(output_name, EPHEMERAL_AUDIO_DIR).unlink(missing_ok=True)
+
+
+def synthesize_speech(text: str, voice: str, speed: float, silence_ms: int):
+    """Render `text` into a WAV and return (filename, resolved voice)."""
+    # With an ephemeral audio budget the clip goes into the tmpfs ring instead of AUDIO_DIR.
+    output_name, voice, _hit = synthesize_speech_cached(
+        text, voice, speed, silence_ms, ephemeral=bool(EPHEMERAL_AUDIO_BYTES)
+    )
+    return output_name, voice
+
+
+def synthesize_speech_cached(
+    text: str, voice: str, speed: float, silence_ms: int, background: bool = False, ephemeral: bool = False
+):
+    if not voice.startswith("supertonic:"):
+        voice = resolve_piper_voice(voice)
+
+    directory = EPHEMERAL_AUDIO_DIR if ephemeral else AUDIO_DIR
+    if not SYNTH_CACHE_ENABLED:
+        output_name = f"{uuid.uuid4().hex}.wav"
+        timings = render_speech_foreground(text, voice, speed, silence_ms, directory / output_name)
+        write_json_file(speech_timings_path(output_name, directory), timings)
+        if ephemeral:
+            trim_ephemeral_audio()
+        return output_name, voice, False
+
+    key = synthesis_cache_key(text, voice, speed, silence_ms)
+    if ephemeral and (AUDIO_DIR / f"{key}.wav").exists():
+        # Pinned, downloaded or prefetched clips are already durable; reuse that copy.
+        directory = AUDIO_DIR
+
+    def render(path: Path) -> None:
+        if background:
+            timings = render_speech(text, voice, speed, silence_ms, path)
+        else:
+            timings = render_speech_foreground(text, voice, speed, silence_ms, path)
+        # Stored next to the clip so cache hits return timings without touching the engine.
+        write_json_file(speech_timings_path(f"{key}.wav", directory), timings)
+
+    hit = render_cached(key, render, directory)
+    if hit and not background:
+        claim_prefetched(key)
+        if not (directory / f"{key}.wav").exists():
+            # A prefetch cancel dropped the clip before our claim landed; render it again.
+            hit = render_cached(key, render, directory)
+    if directory == EPHEMERAL_AUDIO_DIR:
+        if hit:
+            try:
+                # Replayed clips move to the young end of the ring.
+                os.utime(directory / f"{key}.wav")
+            except FileNotFoundError:
+                pass
+        else:
+            trim_ephemeral_audio()
+    return f"{key}.wav", voice, hit
+
+
+_WORKER_LOCK = threading.Lock()
+_WORKER_INFLIGHT = {}
+_WORKER_FAILED_UNTIL = {}
+_WORKER_CACHE = {"loadedAt": 0.0, "workers": []}
+
+
+def worker_secret_valid(value: str) -> bool:
+    return bool(WORKER_SECRET) and hmac.compare_digest(str(value or ""), WORKER_SECRET)
+
+
+def register_worker(info: dict) -> None:
+    # Kept on the state volume so every API replica routes to every worker, whichever one it heartbeats to.
+    write_json_file(WORKERS_DIR / f"{info['id']}.json", {**info, "lastSeen": time.time()})
+    with _WORKER_LOCK:
+        _WORKER_CACHE["loadedAt"] = 0.0
+        _WORKER_FAILED_UNTIL.pop(info["id"], None)
+
+
+def unregister_worker(worker_id: str) -> None:
+    (WORKERS_DIR / f"{worker_id}.json").unlink(missing_ok=True)
+    with _WORKER_LOCK:
+        _WORKER_CACHE["loadedAt"] = 0.0
+
+
+def list_workers() -> list:
+    now = time.time()
+    with _WORKER_LOCK:
+        if now - _WORKER_CACHE["loadedAt"] < 1.0:
+            return _WORKER_CACHE["workers"]
+    workers = []
+    for path in WORKERS_DIR.glob("*.json"):
+        info = read_json_file(path, None)
+        if not isinstance(info, dict):
+            continue
+        if now - float(info.get("lastSeen") or 0) > WORKER_TTL_SECONDS:
+            if now - float(info.get("lastSeen") or 0) > WORKER_TTL_SECONDS * 10:
+                path.unlink(missing_ok=True)
+            continue
+        workers.append(info)
+    with _WORKER_LOCK:
+        _WORKER_CACHE.update(loadedAt=now, workers=workers)
+    return workers
+
+
+def pick_worker(voice: str):
+    """Least-loaded live worker with `voice` installed; workers that already have it loaded win ties."""
+    if not WORKER_SECRET:
+        return None
+    now = time.time()
+    best = None
+    for info in list_workers():
+        if voice not in (info.get("voices") or []):
+            continue
+        with _WORKER_LOCK:
+            if _WORKER_FAILED_UNTIL.get(info["id"], 0) > now:
+                continue
+            inflight = _WORKER_INFLIGHT.get(info["id"], 0)
+        capacity = max(1, int(info.get("capacity") or 1))
+        busy = max(int(info.get("active") or 0), inflight)
+        if busy >= capacity:
+            continue
+        score = (voice not in (info.get("warm") or []), busy / capacity)
+        if best is None or score < best[0]:
+            best = (score, info)
+    return best[1] if best else None
+
+
+def render_on_worker(info: dict, text: str, voice: str, speed: float, silence_ms: int, output_path: Path):
+    """Render on a remote worker into output_path; returns timings, or None when the worker could not take it."""
+    import requests
+
+    worker_id = info["id"]
+    with _WORKER_LOCK:
+        _WORKER_INFLIGHT[worker_id] = _WORKER_INFLIGHT.get(worker_id, 0) + 1
+    started = time.perf_counter()
+    try:
+        response = requests.post(
+            f"{info['url']}/worker/synthesize",
+            json={"text": text, "voice": voice, "speed": speed, "prependSilenceMs": silence_ms},
+            headers={WORKER_SECRET_HEADER: WORKER_SECRET},
+            timeout=SPEAK_TIMEOUT_SECONDS,
+        )
+        if response.status_code == 503:
+            # Full right now; not a failure, just try elsewhere.
+            return None
+        response.raise_for_status()
+        payload = response.json()
+        output_path.write_bytes(base64.b64decode(payload["audio"]))
+        timings = payload.get("timings") or build_speech_timings(text, wav_duration_ms(output_path), silence_ms)
+        # Includes the network hop, which is what clients of this node actually wait for.
+        record_voice_rtf(
+            voice, text, speed, (time.perf_counter() - started) * 1000.0, timings["durationMs"] - silence_ms
+        )
+        return timings
+    except (requests.RequestException, ValueError, KeyError) as exc:
+        print(f"[open-tts] warning: worker {worker_id} failed, using local synthesis: {exc}")
+        with _WORKER_LOCK:
+            _WORKER_FAILED_UNTIL[worker_id] = time.time() + WORKER_FAILURE_COOLDOWN_SECONDS
+        return None
+    finally:
+        with _WORKER_LOCK:
+            _WORKER_INFLIGHT[worker_id] = max(0, _WORKER_INFLIGHT.get(worker_id, 1) - 1)
+
+
+def render_speech_foreground(text: str, voice: str, speed: float, silence_ms: int, output_path: Path) -> dict:
+    """Interactive render: prefer a registered worker, fall back to this node."""
+    info = pick_worker(voice)
+    if info is not None:
+        timings = render_on_worker(info, text, voice, speed, silence_ms, output_path)
+        if timings is not None:
+            return timings
+    with FOREGROUND_SYNTHESIS:
+        return render_speech(text, voice, speed, silence_ms, output_path)
+
+
+def warm_voice_ids() -> list:
+    with _PIPER_VOICES_LOCK:
+        warm = list(_PIPER_VOICES)
+    if _SUPERTONIC_INSTANCE is not None:
+        warm.extend(get_enabled_supertone_voice_ids())
+    return sorted(warm)
+
+
+_WORKER_SLOTS = threading.BoundedSemaphore(WORKER_CAPACITY)
+_WORKER_ACTIVE = {"count": 0}
+_WORKER_ID = (os.getenv("OPEN_TTS_WORKER_ID") or "").strip() or f"worker-{secrets.token_hex(6)}"
+
+
+def worker_advertised_url() -> str:
+    configured = (os.getenv("OPEN_TTS_WORKER_URL") or "").strip().rstrip("/")
+    if configured:
+        return configured
+    try:
+        host = socket.gethostbyname(socket.gethostname())
+    except OSError:
+        host = "127.0.0.1"
+    return f"http://{host}:{WORKER_PORT}"
+
+
+def worker_heartbeat_loop() -> None:
+    import requests
+
+    url = worker_advertised_url()
+    warned = False
+    while True:
+        with _WORKER_LOCK:
+            active = _WORKER_ACTIVE["count"]
+        payload = {
+            "workerId": _WORKER_ID,
+            "url": url,
+            "voices": [voice["id"] for voice in list_voice_models()],
+            "warm": warm_voice_ids(),
+            "capacity": WORKER_CAPACITY,
+            "active": active,
+        }
+        try:
+            response = requests.post(
+                f"{WORKER_API_URL}/api/workers/register",
+                json=payload,
+                headers={WORKER_SECRET_HEADER: WORKER_SECRET},
+                timeout=10,
+            )
+            response.raise_for_status()
+            warned = False
+        except requests.RequestException as exc:
+            if not warned:
+                print(f"[open-tts] warning: worker registration with {WORKER_API_URL} failed: {exc}")
+                warned = True
+        time.sleep(WORKER_HEARTBEAT_SECONDS)
+
+
+class StreamSession:
+    """Persistent speak channel: segments go in over POST, audio/completion events come out over SSE."""
+
+    def __init__(self, client_id: str = ""):
+        self.id = process_scoped_id(24)
+        self.client_id = client_id
+        self.cond = threading.Condition()
+        self.pending = deque()
+        self.canceled = set()
+        self.events = deque(maxlen=STREAM_EVENT_BACKLOG)
+        self.next_event_id = 1
+        self.closed = False
+        self.busy = False
+        self.current_id = ""
+        self.last_seen = time.time()
+        self.worker = threading.Thread(target=self._run, name=f"open-tts-stream-{self.id[:8]}", daemon=True)
+        self.worker.start()
+
+    def touch(self) -> None:
+        self.last_seen = time.time()
+
+    def is_idle(self, now: float) -> bool:
+        return self.closed or (now - self.last_seen > STREAM_SESSION_IDLE_SECONDS and not self.busy and not self.pending)
+
+    def emit(self, event: str, data: dict) -> None:
+        with self.cond:
+            self.events.append((self.next_event_id, event, data))
+            self.next_event_id += 1
+            self.cond.notify_all()
+
+    def enqueue(self, segments: list) -> None:
+        with self.cond:
+            for segment in segments:
+                self.canceled.discard(segment["id"])
+                self.pending.append(segment)
+            self.cond.notify_all()
+        self.touch()
+
+    def cancel(self, segment_ids=None) -> list:
+        with self.cond:
+            if segment_ids is None:
+                segment_ids = [segment["id"] for segment in self.pending]
+                if self.busy and self.current_id:
+                    segment_ids.append(self.current_id)
+            active = {segment["id"] for segment in self.pending}
+            if self.busy and self.current_id:
+                active.add(self.current_id)
+            wanted = set(segment_ids) & active
+            self.canceled.update(wanted)
+            dropped = [segment["id"] for segment in self.pending if segment["id"] in wanted]
+            self.pending = deque(segment for segment in self.pending if segment["id"] not in wanted)
+            self.cond.notify_all()
+        for segment_id in dropped:
+            self.emit("canceled", {"id": segment_id})
+        self.touch()
+        return sorted(wanted)
+
+    def close(self) -> None:
+        with self.cond:
+            self.closed = True
+            self.pending.clear()
+            self.cond.notify_all()
+
+    def events_after(self, last_event_id: int) -> list:
+        return [item for item in self.events if item[0] > last_event_id]
+
+    def _run(self) -> None:
+        while True:
+            with self.cond:
+                while not self.pending and not self.closed:
+                    self.cond.wait()
+                if self.closed:
+                    return
+                segment = self.pending.popleft()
+                self.busy = True
+                self.current_id = segment["id"]
+            try:
+                self._process(segment)
+            finally:
+                with self.cond:
+                    self.busy = False
+                    self.current_id = ""
+                    drained = not self.pending
+                if drained:
+                    self.emit("complete", {"lastId": segment["id"]})
+
+    def _process(self, segment: dict) -> None:
+        segment_id = segment["id"]
+        try:
+            output_name, voice = synthesize_speech(
+                segment["text"], segment["voice"], segment["speed"], segment["prependSilenceMs"]
+            )
+        except SynthesisError as exc:
+            self.emit("failed", {"id": segment_id, "status": exc.status, **exc.payload()})
+            return
+        except Exception as exc:
+            self.emit("failed", {"id": segment_id, "status": 500, "error": f"synthesis failed: {exc}"})
+            return
+
+        with self.cond:
+            was_canceled = segment_id in self.canceled
+            self.canceled.discard(segment_id)
+        if was_canceled:
+            if not SYNTH_CACHE_ENABLED:
+                # Cache-keyed clips can also back a concurrent /api/speak, prefetch or history entry;
+                # only the per-request names used without the cache belong to this session alone.
+                remove_audio_file(output_name)
+            self.emit("canceled", {"id": segment_id})
+            return
+
+        token = make_audio_access_token(output_name)
+        data = {
+            "id": segment_id,
+            "audioUrl": f"/api/audio/{output_name}?token={token}",
+            "voice": voice,
+            "speed": segment["speed"],
+        }
+        if segment.get("timings"):
+            data["timings"] = load_speech_timings(output_name, segment["text"], segment["prependSilenceMs"])
+        if segment.get("inline"):
+            data["audio"] = base64.b64encode(audio_file_path(output_name).read_bytes()).decode("ascii")
+            data["mimetype"] = "audio/wav"
+        self.emit("audio", data)
+
+
+_STREAM_SESSIONS = {}
+_STREAM_SESSIONS_LOCK = threading.Lock()
+
+
+def prune_stream_sessions() -> None:
+    now = time.time()
+    with _STREAM_SESSIONS_LOCK:
+        stale = [sid for sid, session in _STREAM_SESSIONS.items() if session.is_idle(now)]
+        for sid in stale:
+            _STREAM_SESSIONS.pop(sid).close()
+
+
+def create_stream_session(client_id: str = "") -> StreamSession:
+    prune_stream_sessions()
+    session = StreamSession(client_id)
+    with _STREAM_SESSIONS_LOCK:
+        _STREAM_SESSIONS[session.id] = session
+    return session
+
+
+def get_stream_session(session_id: str):
+    with _STREAM_SESSIONS_LOCK:
+        session = _STREAM_SESSIONS.get(session_id)
+    if session is None or session.closed:
+        return None
+    session.touch()
+    return session
+
+
+def close_stream_session(session_id: str) -> bool:
+    with _STREAM_SESSIONS_LOCK:
+        session = _STREAM_SESSIONS.pop(session_id, None)
+    if session is None:
+        return False
+    session.close()
+    return True
+
+
+def sse_message(event_id: int, event: str, data: dict) -> str:
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, ensure_ascii=True)}\n\n"
+
+
+def normalize_speak_segments(
+    raw_segments,
+    client_id: str,
+    inline_default: bool = False,
+    limit: int = STREAM_MAX_SEGMENTS,
+    timings_default: bool = False,
+):
+    if not isinstance(raw_segments, list) or not raw_segments:
+        return None, "segments must be a non-empty array"
+    if len(raw_segments) > limit:
+        return None, f"at most {limit} segments per request"
+    silence_default = resolve_silence_ms(None, client_id)
+    segments = []
+    for item in raw_segments:
+        if not isinstance(item, dict):
+            return None, "each segment must be an object"
+        text = str(item.get("text") or "").strip()
+        if not text:
+            return None, "segment text is required"
+        try:
+            speed = float(item.get("speed") or 1.0)
+        except (TypeError, ValueError):
+            return None, "segment speed must be a number"
+        silence_ms = silence_default
+        if item.get("prependSilenceMs") is not None:
+            silence_ms = resolve_silence_ms(item.get("prependSilenceMs"), client_id)
+        segments.append(
+            {
+                "id": str(item.get("id") or uuid.uuid4().hex)[:128],
+                "text": normalize_speech_text(text, client_id),
+                "voice": str(item.get("voice") or DEFAULT_VOICE).strip() or DEFAULT_VOICE,
+                "speed": speed,
+                "prependSilenceMs": silence_ms,
+                "inline": bool(item.get("inline", inline_default)),
+                "timings": bool(item.get("timings", timings_default)),
+            }
+        )
+    return segments, None
+
+
 def safe_audio_filename(name: str) -> str:
     parsed = urlparse(name)
     base = os.path.basename(parsed.path)
@@ -451,7 +1809,7 @@ def make_audio_access_token(filename: str) -> str:
     return audio_access_token(filename, expires_at)
 
 
-def verify_audio_access_token(filename: str, token: str) -> bool:
+def verify_audio_access_token(filename: str, token: str, check_expiry: bool = True) -> bool:
     token = str(token or "").strip()
     if "." not in token:
         return False
@@ -460,7 +1818,7 @@ def verify_audio_access_token(filename: str, token: str) -> bool:
         expires_at = int(exp_raw)
     except ValueError:
         return False
-    if expires_at < int(time.time()):
+    if check_expiry and expires_at < int(time.time()):
         return False
     expected = audio_access_token(filename, expires_at)
     return hmac.compare_digest(expected, token)
@@ -471,8 +1829,291 @@ def safe_download_format(value: str) -> str:
     return fmt if fmt in ALLOWED_DOWNLOAD_FORMATS else "wav"
 
 
+class PrefetchGroup:
+    def __init__(self, client_id: str, segments: list):
+        self.id = process_scoped_id(18)
+        self.client_id = client_id
+        self.created_at = time.time()
+        self.canceled = False
+        self.items = [{**segment, "status": "queued", "audioName": "", "error": ""} for segment in segments]
+
+    def to_dict(self) -> dict:
+        items = []
+        for item in self.items:
+            out = {"id": item["id"], "status": item["status"], "voice": item["voice"]}
+            if item["status"] == "ready":
+                token = make_audio_access_token(item["audioName"])
+                out["audioUrl"] = f"/api/audio/{item['audioName']}?token={token}"
+            if item["error"]:
+                out["error"] = item["error"]
+            items.append(out)
+        return {"prefetchId": self.id, "canceled": self.canceled, "items": items}
+
+
+_PREFETCH_LOCK = threading.Condition()
+_PREFETCH_GROUPS = {}
+_PREFETCH_BY_CLIENT = {}
+_PREFETCH_QUEUE = deque()
+_PREFETCH_WORKER = None
+
+
+def prefetch_marker_path(key: str) -> Path:
+    return PREFETCH_MARKER_DIR / key
+
+
+def mark_prefetched(key: str, group_id: str) -> None:
+    # Marker files live on the audio volume so every replica sees which clips nobody has asked for yet.
+    try:
+        with prefetch_marker_path(key).open("x", encoding="utf-8") as handle:
+            handle.write(group_id)
+    except FileExistsError:
+        pass
+
+
+def claim_prefetched(key: str) -> None:
+    marker = prefetch_marker_path(key)
+    if not marker.exists():
+        return
+    with shared_lock(f"prefetch-{key}", AUDIO_LOCKS_DIR):
+        marker.unlink(missing_ok=True)
+
+
+def ensure_prefetch_worker() -> None:
+    global _PREFETCH_WORKER
+    with _PREFETCH_LOCK:
+        if _PREFETCH_WORKER is not None and _PREFETCH_WORKER.is_alive():
+            return
+        _PREFETCH_WORKER = threading.Thread(target=run_prefetch_worker, name="open-tts-prefetch", daemon=True)
+        _PREFETCH_WORKER.start()
+
+
+def run_prefetch_worker() -> None:
+    while True:
+        with _PREFETCH_LOCK:
+            _PREFETCH_LOCK.wait_for(lambda: bool(_PREFETCH_QUEUE))
+        # Low priority: never compete with a request that is waiting on audio.
+        FOREGROUND_SYNTHESIS.wait_idle()
+        with _PREFETCH_LOCK:
+            if not _PREFETCH_QUEUE:
+                continue
+            group, item = _PREFETCH_QUEUE.popleft()
+            if group.canceled or item["status"] != "queued":
+                continue
+            item["status"] = "rendering"
+        try:
+            audio_name, voice, hit = synthesize_speech_cached(
+                item["text"], item["voice"], item["speed"], item["prependSilenceMs"], background=True
+            )
+        except SynthesisError as exc:
+            with _PREFETCH_LOCK:
+                item["status"] = "failed"
+                item["error"] = str(exc)
+            continue
+        except Exception as exc:
+            with _PREFETCH_LOCK:
+                item["status"] = "failed"
+                item["error"] = f"synthesis failed: {exc}"
+            continue
+        with _PREFETCH_LOCK:
+            item["audioName"] = audio_name
+            item["voice"] = voice
+            if not hit:
+                mark_prefetched(audio_name[:-4], group.id)
+            if group.canceled:
+                item["status"] = "canceled"
+                discard_unclaimed_prefetch(group, [audio_name])
+            else:
+                item["status"] = "ready"
+
+
+def discard_unclaimed_prefetch(group: PrefetchGroup, audio_names: list) -> None:
+    # Caller holds _PREFETCH_LOCK. Only drop clips nobody has requested since they were rendered.
+    for audio_name in audio_names:
+        key = audio_name[:-4]
+        marker = prefetch_marker_path(key)
+        with shared_lock(f"prefetch-{key}", AUDIO_LOCKS_DIR):
+            try:
+                owner = marker.read_text(encoding="utf-8")
+            except OSError:
+                continue
+            if owner != group.id:
+                continue
+            remove_audio_file(audio_name)
+            # Marker goes last: a claimer that finds it gone re-checks the audio file.
+            marker.unlink(missing_ok=True)
+
+
+def cancel_prefetch_group(group: PrefetchGroup) -> None:
+    with _PREFETCH_LOCK:
+        if group.canceled:
+            return
+        group.canceled = True
+        rendered = []
+        for item in group.items:
+            if item["status"] == "queued":
+                item["status"] = "canceled"
+            elif item["status"] == "ready":
+                item["status"] = "canceled"
+                rendered.append(item["audioName"])
+        discard_unclaimed_prefetch(group, rendered)
+        if _PREFETCH_BY_CLIENT.get(group.client_id) == group.id:
+            _PREFETCH_BY_CLIENT.pop(group.client_id, None)
+
+
+def prune_prefetch_groups() -> None:
+    cutoff = time.time() - PREFETCH_RETENTION_SECONDS
+    with _PREFETCH_LOCK:
+        stale = [group for group in _PREFETCH_GROUPS.values() if group.created_at < cutoff]
+        for group in stale:
+            _PREFETCH_GROUPS.pop(group.id, None)
+            if _PREFETCH_BY_CLIENT.get(group.client_id) == group.id:
+                _PREFETCH_BY_CLIENT.pop(group.client_id, None)
+    # Markers of expired groups are dropped; their clips simply stay on as ordinary cache entries.
+    for marker in PREFETCH_MARKER_DIR.iterdir():
+        try:
+            if marker.stat().st_mtime < cutoff:
+                marker.unlink(missing_ok=True)
+        except OSError:
+            continue
+
+
+def submit_prefetch(client_id: str, segments: list, replace: bool = True) -> PrefetchGroup:
+    prune_prefetch_groups()
+    group = PrefetchGroup(client_id, segments)
+    if client_id and replace:
+        with _PREFETCH_LOCK:
+            previous = _PREFETCH_GROUPS.get(_PREFETCH_BY_CLIENT.get(client_id, ""))
+        if previous is not None:
+            cancel_prefetch_group(previous)
+    with _PREFETCH_LOCK:
+        _PREFETCH_GROUPS[group.id] = group
+        if client_id:
+            _PREFETCH_BY_CLIENT[client_id] = group.id
+        _PREFETCH_QUEUE.extend((group, item) for item in group.items)
+        _PREFETCH_LOCK.notify_all()
+    ensure_prefetch_worker()
+    return group
+
+
+def get_prefetch_group(group_id: str):
+    with _PREFETCH_LOCK:
+        return _PREFETCH_GROUPS.get(group_id)
+
+
+def render_job_chunk(text: str, manifest: dict, output_path: Path) -> None:
+    # Background work: give interactive requests the CPU first, but never starve completely.
+    FOREGROUND_SYNTHESIS.wait_idle(timeout=5)
+    text = apply_phonetic_dictionary(text, manifest.get("clientId") or "")
+    # Chunks are kept by the job itself; a second copy per sentence would double a book's footprint.
+    render_speech(text, manifest["voice"], float(manifest.get("speed") or 1.0), 0, output_path, reuse_sentences=False)
+
+
+DOCUMENT_JOBS = DocumentJobs(
+    JOBS_DIR,
+    AUDIO_DIR,
+    LOCKS_DIR,
+    render_chunk=render_job_chunk,
+    split_sentences=split_sentences,
+    chunk_chars=JOB_CHUNK_CHARS,
+    workers=JOB_WORKERS,
+    cancel_timeout=SPEAK_TIMEOUT_SECONDS,
+)
+
+
+def job_status_payload(manifest: dict) -> dict:
+    job_id = manifest["id"]
+    total = int(manifest.get("totalChunks") or 0)
+    payload = {
+        "jobId": job_id,
+        "status": manifest.get("status"),
+        "title": manifest.get("title", ""),
+        "voice": manifest.get("voice"),
+        "speed": manifest.get("speed"),
+        "chapters": manifest.get("totalChapters", 0),
+        "chunksDone": DOCUMENT_JOBS.chunks_done(manifest),
+        "chunksTotal": total,
+        "createdAt": manifest.get("createdAt"),
+        "updatedAt": manifest.get("updatedAt"),
+    }
+    if manifest.get("error"):
+        payload["error"] = manifest["error"]
+    if manifest.get("status") == "complete" and manifest.get("audioName"):
+        token = make_audio_access_token(manifest["audioName"])
+        payload["audioUrl"] = f"/api/audio/{manifest['audioName']}?token={token}"
+        payload["downloadUrl"] = f"/api/download/{manifest['audioName']}?token={token}"
+        payload["indexUrl"] = f"/api/jobs/{job_id}/index"
+        payload["durationMs"] = manifest.get("durationMs")
+    return payload
+
+
+def export_title(text, index: int) -> str:
+    title = " ".join(str(text or "").split())
+    if len(title) > EXPORT_TITLE_CHARS:
+        title = title[: EXPORT_TITLE_CHARS - 3].rstrip() + "..."
+    return title or f"Clip {index + 1}"
+
+
+def export_references(body: dict, client_id: str):
+    """Collect [{"ref", "title", "name", "token"}] from history ids or tokenized audio references."""
+    ids = body.get("ids")
+    audio = body.get("audio")
+    references = []
+    if ids is not None:
+        if not client_id:
+            return None, (jsonify({"error": f"{CLIENT_ID_HEADER} header is required to export history ids"}), 400)
+        if not isinstance(ids, list):
+            return None, (jsonify({"error": "ids must be an array"}), 400)
+        by_id = {str(entry.get("id")): entry for entry in load_history(client_id) if isinstance(entry, dict)}
+        for raw_id in ids:
+            entry = by_id.get(str(raw_id)) or {}
+            audio_url = str(entry.get("audioUrl") or "")
+            references.append(
+                {
+                    "ref": str(raw_id),
+                    "title": entry.get("text"),
+                    "name": audio_url,
+                    "token": (parse_qs(urlparse(audio_url).query).get("token") or [""])[0],
+                    "owned": True,
+                }
+            )
+    elif isinstance(audio, list):
+        for item in audio:
+            if isinstance(item, str):
+                # A tokenized audioUrl as returned by /api/speak.
+                item = {"name": item, "token": (parse_qs(urlparse(item).query).get("token") or [""])[0]}
+            if not isinstance(item, dict):
+                return None, (jsonify({"error": "audio items must be objects or audio URLs"}), 400)
+            name = str(item.get("name") or "")
+            references.append({"ref": name, "title": item.get("title"), "name": name, "token": item.get("token")})
+    else:
+        return None, (jsonify({"error": "ids or audio is required"}), 400)
+    if not references:
+        return None, (jsonify({"error": "nothing to export"}), 400)
+    if len(references) > EXPORT_MAX_ITEMS:
+        return None, (jsonify({"error": f"at most {EXPORT_MAX_ITEMS} items can be exported at once"}), 400)
+    return references, None
+
+
+def resolve_export_clips(references: list):
+    """Return ([(title, path)], missing refs); owned history entries may carry expired but genuine tokens."""
+    clips = []
+    missing = []
+    for index, reference in enumerate(references):
+        filename = safe_audio_filename(reference["name"])
+        path = audio_file_path(filename) if filename else None
+        check_expiry = not reference.get("owned")
+        if (
+            not path
+            or not verify_audio_access_token(filename, reference["token"], check_expiry=check_expiry)
+            or not path.is_file()
+        ):
+            missing.append(reference["ref"])
+            continue
+        clips.append((export_title(reference["title"], index), path))
+    return clips, missing
+
+
 def openapi_spec():
-    base_url = request.host_url.rstrip("/")
     return {
         "openapi": "3.0.3",
         "info": {
@@ -480,7 +2121,8 @@ def openapi_spec():
             "version": "0.4.0",
             "description": "API for Piper-based text-to-speech, voice management, and downloadable audio.",
         },
-        "servers": [{"url": base_url}],
+        # Relative, so the cached spec resolves against whichever host the client used.
+        "servers": [{"url": "/"}],
         "paths": {
             "/api/settings": {
                 "get": {
@@ -539,13 +2181,25 @@ def openapi_spec():
                             "application/json": {
                                 "schema": {
                                     "type": "object",
-                                    "properties": {"voice": {"type": "string"}},
+                                    "properties": {
+                                        "voice": {
+                                            "type": "string",
+                                            "description": "Catalog id; append @int8 for a quantized variant",
+                                        },
+                                        "quantize": {
+                                            "type": "boolean",
+                                            "description": "Also generate the int8 variant of a Piper voice",
+                                        },
+                                    },
                                     "required": ["voice"],
                                 }
                             }
                         },
                     },
-                    "responses": {"201": {"description": "Installed"}},
+                    "responses": {
+                        "201": {"description": "Installed"},
+                        "501": {"description": "Quantization tools (onnxruntime, onnx) not installed"},
+                    },
                 }
             },
             "/api/voices/{voice_id}": {
@@ -575,6 +2229,10 @@ def openapi_spec():
                                         "text": {"type": "string"},
                                         "voice": {"type": "string"},
                                         "speed": {"type": "number"},
+                                        "timings": {
+                                            "type": "boolean",
+                                            "description": "Include per-sentence and per-word start/end offsets (ms)",
+                                        },
                                     },
                                     "required": ["text"],
                                 }
@@ -584,42 +2242,709 @@ def openapi_spec():
                     "responses": {"201": {"description": "Audio generated"}},
                 }
             },
-            "/api/audio/{name}": {
+            "/api/stream/sessions": {
+                "post": {
+                    "summary": "Open a persistent speak channel",
+                    "responses": {"201": {"description": "Session created"}},
+                }
+            },
+            "/api/stream/sessions/{session_id}/events": {
                 "get": {
-                    "summary": "Fetch generated WAV audio",
+                    "summary": "Server-sent audio, failed, canceled and complete events for a session",
                     "parameters": [
                         {
-                            "name": "name",
+                            "name": "session_id",
                             "in": "path",
                             "required": True,
                             "schema": {"type": "string"},
                         }
                     ],
-                    "responses": {"200": {"description": "WAV audio"}},
+                    "responses": {"200": {"description": "text/event-stream"}},
                 }
             },
-            "/api/download/{name}": {
-                "get": {
-                    "summary": "Download generated audio in selected format",
+            "/api/stream/sessions/{session_id}/segments": {
+                "post": {
+                    "summary": "Queue text segments for synthesis on a session",
                     "parameters": [
                         {
-                            "name": "name",
+                            "name": "session_id",
                             "in": "path",
                             "required": True,
                             "schema": {"type": "string"},
+                        }
+                    ],
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "segments": {
+                                            "type": "array",
+                                            "items": {
+                                                "type": "object",
+                                                "properties": {
+                                                    "id": {"type": "string"},
+                                                    "text": {"type": "string"},
+                                                    "voice": {"type": "string"},
+                                                    "speed": {"type": "number"},
+                                                    "prependSilenceMs": {"type": "integer"},
+                                                    "inline": {"type": "boolean"},
+                                                    "timings": {"type": "boolean"},
+                                                },
+                                                "required": ["text"],
+                                            },
+                                        },
+                                        "inline": {"type": "boolean"},
+                                        "timings": {"type": "boolean"},
+                                    },
+                                    "required": ["segments"],
+                                }
+                            }
                         },
+                    },
+                    "responses": {"202": {"description": "Segments queued"}},
+                }
+            },
+            "/api/stream/sessions/{session_id}/cancel": {
+                "post": {
+                    "summary": "Cancel queued segments (all pending when ids is omitted)",
+                    "parameters": [
                         {
-                            "name": "format",
-                            "in": "query",
-                            "required": False,
-                            "schema": {"type": "string", "enum": ["wav", "mp3", "ogg"]},
-                        },
+                            "name": "session_id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        }
                     ],
-                    "responses": {"200": {"description": "Download file"}},
+                    "responses": {"200": {"description": "Canceled"}},
                 }
             },
-            "/api/openapi.json": {
-                "get": {
+            "/api/stream/sessions/{session_id}": {
+                "delete": {
+                    "summary": "Close a speak channel",
+                    "parameters": [
+                        {
+                            "name": "session_id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        }
+                    ],
+                    "responses": {"200": {"description": "Closed"}},
+                }
+            },
+            "/api/prefetch": {
+                "post": {
+                    "summary": "Declare upcoming segments to synthesize into the cache at low priority",
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "required": ["segments"],
+                                    "properties": {
+                                        "segments": {
+                                            "type": "array",
+                                            "items": {
+                                                "type": "object",
+                                                "required": ["text"],
+                                                "properties": {
+                                                    "id": {"type": "string"},
+                                                    "text": {"type": "string"},
+                                                    "voice": {"type": "string"},
+                                                    "speed": {"type": "number"},
+                                                    "prependSilenceMs": {"type": "integer"},
+                                                },
+                                            },
+                                        },
+                                        "replace": {
+                                            "type": "boolean",
+                                            "description": "Cancel this client's previous prefetch (default true)",
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                    "responses": {"202": {"description": "Prefetch queued"}},
+                },
+            },
+            "/api/prefetch/{prefetch_id}": {
+                "get": {
+                    "summary": "Prefetch status with audio URLs for ready segments",
+                    "parameters": [
+                        {
+                            "name": "prefetch_id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                    ],
+                    "responses": {"200": {"description": "Prefetch status"}},
+                },
+                "delete": {
+                    "summary": "Cancel a prefetch and drop clips nobody requested",
+                    "parameters": [
+                        {
+                            "name": "prefetch_id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                    ],
+                    "responses": {"200": {"description": "Canceled"}},
+                },
+            },
+            "/api/jobs": {
+                "post": {
+                    "summary": "Start a long-document synthesis job from JSON text or a multipart file upload",
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "required": ["text"],
+                                    "properties": {
+                                        "text": {"type": "string"},
+                                        "title": {"type": "string"},
+                                        "format": {
+                                            "type": "string",
+                                            "enum": ["text", "markdown", "html"],
+                                        },
+                                        "voice": {"type": "string"},
+                                        "speed": {"type": "number"},
+                                        "prependSilenceMs": {"type": "integer"},
+                                    },
+                                },
+                            },
+                            "multipart/form-data": {
+                                "schema": {
+                                    "type": "object",
+                                    "required": ["file"],
+                                    "properties": {
+                                        "file": {"type": "string", "format": "binary"},
+                                        "title": {"type": "string"},
+                                        "format": {
+                                            "type": "string",
+                                            "enum": ["text", "markdown", "html"],
+                                        },
+                                        "voice": {"type": "string"},
+                                        "speed": {"type": "number"},
+                                    },
+                                },
+                            },
+                        },
+                    },
+                    "responses": {
+                        "202": {"description": "Job queued"},
+                        "413": {"description": "Document too large"},
+                    },
+                },
+            },
+            "/api/jobs/{job_id}": {
+                "get": {
+                    "summary": "Job progress and audio URLs once complete",
+                    "parameters": [
+                        {
+                            "name": "job_id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                    ],
+                    "responses": {"200": {"description": "Job status"}},
+                },
+                "delete": {
+                    "summary": "Cancel a job and delete its chunks and audio",
+                    "parameters": [
+                        {
+                            "name": "job_id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                    ],
+                    "responses": {"200": {"description": "Deleted"}},
+                },
+            },
+            "/api/jobs/{job_id}/resume": {
+                "post": {
+                    "summary": "Restart a failed or interrupted job from its first missing chunk",
+                    "parameters": [
+                        {
+                            "name": "job_id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                    ],
+                    "responses": {"202": {"description": "Job queued"}},
+                },
+            },
+            "/api/jobs/{job_id}/index": {
+                "get": {
+                    "summary": "Chapter and paragraph start offsets (ms) for the assembled audio",
+                    "parameters": [
+                        {
+                            "name": "job_id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                    ],
+                    "responses": {
+                        "200": {"description": "Navigation index"},
+                        "409": {"description": "Job not complete"},
+                    },
+                },
+            },
+            "/api/workers/register": {
+                "post": {
+                    "summary": "Register or heartbeat a synthesis worker (requires X-OpenTTS-Worker-Secret)",
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "required": ["workerId", "url"],
+                                    "properties": {
+                                        "workerId": {"type": "string"},
+                                        "url": {
+                                            "type": "string",
+                                            "description": "Base URL the API uses to reach the worker",
+                                        },
+                                        "voices": {
+                                            "type": "array",
+                                            "items": {"type": "string"},
+                                            "description": "Installed voice IDs",
+                                        },
+                                        "warm": {
+                                            "type": "array",
+                                            "items": {"type": "string"},
+                                            "description": "Voice IDs currently loaded in memory",
+                                        },
+                                        "capacity": {"type": "integer"},
+                                        "active": {"type": "integer"},
+                                    },
+                                },
+                            },
+                        },
+                    },
+                    "responses": {
+                        "200": {"description": "Registered"},
+                        "403": {"description": "Bad worker secret"},
+                        "404": {"description": "Worker protocol disabled"},
+                    },
+                },
+            },
+            "/api/workers": {
+                "get": {
+                    "summary": "List live synthesis workers (requires X-OpenTTS-Worker-Secret)",
+                    "responses": {"200": {"description": "Workers"}},
+                },
+            },
+            "/api/workers/{worker_id}": {
+                "delete": {
+                    "summary": "Unregister a synthesis worker (requires X-OpenTTS-Worker-Secret)",
+                    "parameters": [
+                        {
+                            "name": "worker_id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                    ],
+                    "responses": {"200": {"description": "Unregistered"}},
+                },
+            },
+            "/api/admin/memory": {
+                "get": {
+                    "summary": "Per-process unique vs shared memory of the API server processes (requires admin token)",
+                    "parameters": [
+                        {
+                            "name": "X-OpenTTS-Admin-Token",
+                            "in": "header",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                    ],
+                    "responses": {
+                        "200": {"description": "Memory report"},
+                        "403": {"description": "Bad admin token"},
+                        "404": {"description": "Admin endpoints disabled"},
+                    },
+                },
+            },
+            "/api/admin/scheduler": {
+                "get": {
+                    "summary": "CPU slots, ONNX thread counts and queue depth of the synthesis scheduler in the answering process (requires admin token)",
+                    "parameters": [
+                        {
+                            "name": "X-OpenTTS-Admin-Token",
+                            "in": "header",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                    ],
+                    "responses": {
+                        "200": {"description": "Scheduler state"},
+                        "403": {"description": "Bad admin token"},
+                        "404": {"description": "Admin endpoints disabled"},
+                    },
+                },
+            },
+            "/api/admin/profile": {
+                "get": {
+                    "summary": "Collapsed stacks from the always-on sampler (OPEN_TTS_PROFILE_HZ) of the answering process (requires admin token)",
+                    "parameters": [
+                        {
+                            "name": "X-OpenTTS-Admin-Token",
+                            "in": "header",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                        {
+                            "name": "reset",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "string", "enum": ["1"]},
+                        },
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "Flamegraph collapsed-stack text",
+                            "content": {"text/plain": {}},
+                        },
+                        "403": {"description": "Bad admin token"},
+                        "404": {
+                            "description": "Admin endpoints disabled or always-on profiling off",
+                        },
+                    },
+                },
+                "post": {
+                    "summary": "Start sampling the answering process in the background for N seconds or until N more requests finish (requires admin token)",
+                    "parameters": [
+                        {
+                            "name": "X-OpenTTS-Admin-Token",
+                            "in": "header",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                        {
+                            "name": "seconds",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "number", "default": 10, "maximum": 300},
+                        },
+                        {
+                            "name": "requests",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "integer"},
+                        },
+                        {
+                            "name": "hz",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "number", "default": 100, "maximum": 1000},
+                        },
+                        {
+                            "name": "threads",
+                            "in": "query",
+                            "required": False,
+                            "schema": {
+                                "type": "string",
+                                "enum": ["active", "all"],
+                                "default": "active",
+                            },
+                        },
+                    ],
+                    "responses": {
+                        "202": {
+                            "description": "Profile started; poll statusUrl for the stacks",
+                            "content": {"application/json": {}},
+                        },
+                        "400": {"description": "Invalid parameters"},
+                        "403": {"description": "Bad admin token"},
+                        "404": {"description": "Admin endpoints disabled"},
+                        "409": {"description": "A profile is already running in this process"},
+                    },
+                },
+            },
+            "/api/admin/profile/{profileId}": {
+                "get": {
+                    "summary": "Result of an on-demand profile; forwarded to the process that started it (requires admin token)",
+                    "parameters": [
+                        {
+                            "name": "profileId",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                        {
+                            "name": "X-OpenTTS-Admin-Token",
+                            "in": "header",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "Flamegraph collapsed-stack text",
+                            "content": {"text/plain": {}},
+                        },
+                        "202": {"description": "Still sampling; retry after the Retry-After delay"},
+                        "403": {"description": "Bad admin token"},
+                        "404": {"description": "Unknown profile, or admin endpoints disabled"},
+                    },
+                },
+            },
+            "/api/voices/benchmark": {
+                "post": {
+                    "summary": "A/B benchmark an installed Piper voice against its int8 variant (speedup and size reduction; requires admin token)",
+                    "parameters": [
+                        {
+                            "name": "X-OpenTTS-Admin-Token",
+                            "in": "header",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                    ],
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "required": ["voice"],
+                                    "properties": {
+                                        "voice": {"type": "string", "example": "en_US-ryan-high"},
+                                        "text": {"type": "string"},
+                                        "runs": {
+                                            "type": "integer",
+                                            "minimum": 1,
+                                            "maximum": 10,
+                                            "default": 3,
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                    "responses": {
+                        "200": {
+                            "description": "Median render time, real-time factor and model size for both variants",
+                        },
+                        "400": {"description": "Invalid voice"},
+                        "403": {"description": "Bad admin token"},
+                        "404": {"description": "Voice not installed, or admin endpoints disabled"},
+                        "409": {"description": "int8 variant not installed"},
+                    },
+                },
+            },
+            "/api/chunking": {
+                "get": {
+                    "summary": "Recommended narrator chunk sizes per voice from measured real-time factor and current queue depth",
+                    "parameters": [
+                        {
+                            "name": "voice",
+                            "in": "query",
+                            "required": False,
+                            "description": "Voice id; repeat for several voices (default voice when omitted)",
+                            "schema": {"type": "array", "items": {"type": "string"}},
+                            "style": "form",
+                            "explode": True,
+                        },
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "firstChunkChars, chunkChars and growth per voice, plus queue state",
+                        },
+                    },
+                },
+            },
+            "/api/phonetic": {
+                "get": {
+                    "summary": "Phonetic dictionary of the calling client (X-OpenTTS-Client) plus the global dictionary",
+                    "responses": {
+                        "200": {"description": "entries and global arrays of {word, replacement}"},
+                    },
+                },
+                "put": {
+                    "summary": "Replace the calling client's phonetic dictionary; without a client id, replaces the global dictionary (admin token required)",
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "required": ["entries"],
+                                    "properties": {
+                                        "entries": {
+                                            "type": "array",
+                                            "items": {
+                                                "type": "object",
+                                                "required": ["word", "replacement"],
+                                                "properties": {
+                                                    "word": {"type": "string"},
+                                                    "replacement": {"type": "string"},
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                    "responses": {
+                        "200": {"description": "Saved entries"},
+                        "400": {"description": "Invalid entries"},
+                        "403": {"description": "Bad admin token (global dictionary)"},
+                        "404": {"description": "Global edits disabled (no admin token configured)"},
+                    },
+                },
+            },
+            "/api/audio/{name}": {
+                "get": {
+                    "summary": "Fetch generated WAV audio",
+                    "parameters": [
+                        {
+                            "name": "name",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        }
+                    ],
+                    "responses": {"200": {"description": "WAV audio"}},
+                }
+            },
+            "/api/audio/{name}/pin": {
+                "post": {
+                    "summary": "Keep generated audio: move it from the ephemeral ring to the audio volume",
+                    "parameters": [
+                        {
+                            "name": "name",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                        {
+                            "name": "token",
+                            "in": "query",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                    ],
+                    "responses": {
+                        "200": {"description": "Audio is durable"},
+                        "403": {"description": "Invalid or expired token"},
+                        "404": {"description": "Audio was already evicted"},
+                    },
+                },
+            },
+            "/api/export": {
+                "post": {
+                    "summary": "Export many clips as one concatenated audio file or a streaming zip",
+                    "parameters": [
+                        {
+                            "name": "X-OpenTTS-Client",
+                            "in": "header",
+                            "required": False,
+                            "schema": {"type": "string"},
+                            "description": "Required when exporting history ids",
+                        },
+                    ],
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {
+                                        "ids": {
+                                            "type": "array",
+                                            "items": {"type": "string"},
+                                            "description": "History entry ids of this client, in export order",
+                                        },
+                                        "audio": {
+                                            "type": "array",
+                                            "items": {
+                                                "oneOf": [
+                                                    {
+                                                        "type": "string",
+                                                        "description": "Tokenized audioUrl",
+                                                    },
+                                                    {
+                                                        "type": "object",
+                                                        "properties": {
+                                                            "name": {"type": "string"},
+                                                            "token": {"type": "string"},
+                                                            "title": {"type": "string"},
+                                                        },
+                                                        "required": ["name", "token"],
+                                                    },
+                                                ],
+                                            },
+                                        },
+                                        "mode": {
+                                            "type": "string",
+                                            "enum": ["concat", "zip"],
+                                            "default": "concat",
+                                        },
+                                        "format": {
+                                            "type": "string",
+                                            "enum": ["wav", "mp3", "ogg"],
+                                            "default": "wav",
+                                        },
+                                        "gapMs": {
+                                            "type": "integer",
+                                            "minimum": 0,
+                                            "maximum": 10000,
+                                            "default": 0,
+                                        },
+                                        "chapters": {"type": "boolean", "default": True},
+                                    },
+                                },
+                            },
+                        },
+                    },
+                    "responses": {
+                        "200": {
+                            "description": "Streamed audio file (WAV cue markers or mp3/ogg chapters) or zip; X-OpenTTS-Export-Missing counts skipped items",
+                        },
+                        "400": {"description": "Invalid request"},
+                        "404": {"description": "None of the requested audio is available"},
+                        "501": {"description": "ffmpeg is not installed"},
+                    },
+                },
+            },
+            "/api/download/{name}": {
+                "get": {
+                    "summary": "Download generated audio in selected format",
+                    "parameters": [
+                        {
+                            "name": "name",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        },
+                        {
+                            "name": "format",
+                            "in": "query",
+                            "required": False,
+                            "schema": {"type": "string", "enum": ["wav", "mp3", "ogg"]},
+                        },
+                    ],
+                    "responses": {"200": {"description": "Download file"}},
+                }
+            },
+            "/api/openapi.json": {
+                "get": {
                     "summary": "OpenAPI document",
                     "responses": {"200": {"description": "OpenAPI spec"}},
                 }
@@ -634,6 +2959,38 @@ def openapi_spec():
     }
 
 
+_METADATA_RESPONSES = {}
+_METADATA_RESPONSES_LOCK = threading.Lock()
+
+
+def precomputed_json(key: str, signature, build, per_client: bool = False) -> Response:
+    """Serve a JSON body that is only rebuilt when `signature` changes, with a strong ETag."""
+    with _METADATA_RESPONSES_LOCK:
+        cached = _METADATA_RESPONSES.get(key)
+    if cached is None or cached[0] != signature:
+        body = app.json.response(build()).get_data()
+        cached = (signature, body, hashlib.sha256(body).hexdigest()[:32])
+        with _METADATA_RESPONSES_LOCK:
+            _METADATA_RESPONSES.pop(key, None)
+            _METADATA_RESPONSES[key] = cached
+            while len(_METADATA_RESPONSES) > METADATA_CACHE_SIZE:
+                _METADATA_RESPONSES.pop(next(iter(_METADATA_RESPONSES)))
+    response = Response(cached[1], mimetype="application/json")
+    response.set_etag(cached[2])
+    # no-cache: browsers revalidate on every load (a 304 when unchanged), so changes are seen immediately.
+    if per_client:
+        response.headers["Cache-Control"] = "private, no-cache"
+        response.vary.add(CLIENT_ID_HEADER)
+    else:
+        response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
+
+
+def voices_signature() -> tuple:
+    # Installing, quantizing or removing a Piper voice changes the directory; Supertonic voices live in a state file.
+    return path_signature(VOICES_DIR), path_signature(SUPERTONIC_STATE_FILE)
+
+
 @app.get("/api/health")
 def health():
     return jsonify({"ok": True})
@@ -644,7 +3001,49 @@ def get_settings():
     client_id, err = require_client_id()
     if err:
         return err
-    return jsonify(load_settings(client_id))
+    return precomputed_json(
+        f"settings:{client_id}",
+        path_signature(client_settings_path(client_id)),
+        lambda: load_settings(client_id),
+        per_client=True,
+    )
+
+
+@app.get("/api/phonetic")
+def get_phonetic():
+    client_id, err = optional_client_id()
+    if err:
+        return err
+    state_key = client_state_key(client_id) if client_id else ""
+
+    def build():
+        shared = load_phonetic_entries()
+        return {"entries": load_phonetic_entries(state_key) if state_key else shared, "global": shared}
+
+    signature = (path_signature(PHONETIC_FILE), path_signature(phonetic_dictionary_path(state_key)))
+    return precomputed_json(f"phonetic:{state_key}", signature, build, per_client=True)
+
+
+@app.put("/api/phonetic")
+def put_phonetic():
+    """Replace the caller's dictionary; without a client id this edits the global one (admin token)."""
+    client_id, err = optional_client_id()
+    if err:
+        return err
+    if not client_id:
+        err = require_admin_token()
+        if err:
+            return err
+    body = request.get_json(silent=True)
+    entries = body.get("entries") if isinstance(body, dict) else body
+    if not isinstance(entries, list):
+        return jsonify({"error": "entries must be an array of {word, replacement}"}), 400
+    if len(entries) > PHONETIC_MAX_ENTRIES:
+        return jsonify({"error": f"at most {PHONETIC_MAX_ENTRIES} entries"}), 400
+    state_key = client_state_key(client_id) if client_id else ""
+    with shared_lock(f"phonetic-{state_key or 'global'}", LOCKS_DIR):
+        saved = save_phonetic_entries(entries, state_key)
+    return jsonify({"entries": saved})
 
 
 @app.put("/api/settings")
@@ -674,6 +3073,7 @@ def put_history():
     if not isinstance(body, list):
         return jsonify({"error": "history body must be an array"}), 400
     saved = save_history(body, client_id)
+    persist_pinned_audio(saved)
     return jsonify({"ok": True, "items": saved})
 
 
@@ -700,15 +3100,18 @@ def post_history():
     if not entry["createdAt"]:
         entry["createdAt"] = datetime.now(timezone.utc).isoformat()
 
-    history = load_history(client_id)
-    history.append(entry)
-    save_history(history, client_id)
+    with shared_lock(f"client-{client_state_key(client_id)}", LOCKS_DIR):
+        history = load_history(client_id)
+        history.append(entry)
+        save_history(history, client_id)
+    persist_pinned_audio([entry])
     return jsonify({"ok": True, "entry": entry}), 201
 
 
 @app.get("/api/openapi.json")
 def openapi_json():
-    return jsonify(openapi_spec())
+    # The spec only changes with the code, so it is built once per process.
+    return precomputed_json("openapi", None, openapi_spec)
 
 
 @app.get("/api/docs")
@@ -738,30 +3141,60 @@ def docs():
 
 @app.get("/api/voices")
 def voices():
-    return jsonify(
-        {
+    return precomputed_json(
+        "voices",
+        voices_signature(),
+        lambda: {
             "voices": list_voice_models(),
             "catalog": list_catalog_with_status(),
             "default": DEFAULT_VOICE,
+        },
+    )
+
+
+@app.get("/api/chunking")
+def chunking():
+    voices = [voice.strip() for voice in request.args.getlist("voice") if voice.strip()] or [DEFAULT_VOICE]
+    slowdown = synthesis_slowdown()
+    queue = INFERENCE_SCHEDULER.describe()
+    return jsonify(
+        {
+            "firstAudioTargetMs": FIRST_AUDIO_TARGET_MS,
+            "queue": {
+                "slots": queue["slots"],
+                "active": queue["active"],
+                "waiting": queue["waiting"],
+                "slowdown": round(slowdown, 2),
+            },
+            "voices": {voice: chunk_advice(voice, slowdown) for voice in voices[:16]},
         }
     )
 
 
 @app.post("/api/voices/install")
 def install_voice():
+    import requests
+
     body = request.get_json(silent=True) or {}
     voice_id = (body.get("voice") or "").strip()
     if not voice_id:
         return jsonify({"error": "voice is required"}), 400
     if not VOICE_ID_PATTERN.match(voice_id):
         return jsonify({"error": "invalid voice id"}), 400
+    voice_id, variant = split_voice_variant(voice_id)
+    if variant and variant not in QUANTIZED_VARIANTS:
+        return jsonify({"error": f"unknown voice variant: {variant}"}), 400
+    quantize = variant == "int8" or body.get("quantize") is True or body.get("quantize") == "int8"
     if voice_id.startswith("supertonic:"):
+        if quantize:
+            return jsonify({"error": "supertonic voices have no quantized variants"}), 400
         supertone_ids = {item["id"] for item in list_supertone_catalog()}
         if voice_id not in supertone_ids:
             return jsonify({"error": f"voice not in catalog: {voice_id}"}), 404
-        enabled = get_enabled_supertone_voice_ids()
-        enabled.add(voice_id)
-        set_enabled_supertone_voice_ids(enabled)
+        with shared_lock("supertonic-voices", LOCKS_DIR):
+            enabled = get_enabled_supertone_voice_ids()
+            enabled.add(voice_id)
+            set_enabled_supertone_voice_ids(enabled)
         return jsonify({"ok": True, "voice": voice_id}), 201
     catalog_item = VOICE_CATALOG_BY_ID.get(voice_id)
     if not catalog_item:
@@ -772,7 +3205,73 @@ def install_voice():
     except requests.RequestException as exc:
         return jsonify({"error": f"download failed: {exc}"}), 502
 
-    return jsonify({"ok": True, "voice": voice_id}), 201
+    if not quantize:
+        return jsonify({"ok": True, "voice": voice_id}), 201
+    if not quantization_available():
+        return jsonify({"error": "int8 quantization needs the onnxruntime and onnx packages"}), 501
+    try:
+        variant_id = quantize_voice(voice_id)
+    except Exception as exc:
+        return jsonify({"error": f"quantization failed: {exc}"}), 500
+    return jsonify({"ok": True, "voice": variant_id, "base": voice_id}), 201
+
+
+def benchmark_voice_variants(voice_id: str, text: str, runs: int) -> dict:
+    """Time the baseline and int8 models on the same text, alternating runs so both see the same load."""
+    candidates = {"baseline": voice_id, "int8": f"{voice_id}@int8"}
+    elapsed = {label: [] for label in candidates}
+    audio_ms = {}
+    output_path = AUDIO_DIR / f".benchmark.{uuid.uuid4().hex}.tmp.wav"
+    try:
+        for label, candidate in candidates.items():
+            # Warm-up render: loads the model and lets ONNX Runtime settle.
+            render_with_engine(text, candidate, 1.0, output_path)
+            audio_ms[label] = wav_duration_ms(output_path)
+        for _ in range(runs):
+            for label, candidate in candidates.items():
+                started = time.perf_counter()
+                render_with_engine(text, candidate, 1.0, output_path)
+                elapsed[label].append((time.perf_counter() - started) * 1000.0)
+    finally:
+        output_path.unlink(missing_ok=True)
+
+    report = {"text": text, "runs": runs}
+    for label, candidate in candidates.items():
+        median_ms = sorted(elapsed[label])[len(elapsed[label]) // 2]
+        report[label] = {
+            "voice": candidate,
+            "sizeBytes": (VOICES_DIR / f"{candidate}.onnx").stat().st_size,
+            "medianMs": round(median_ms, 1),
+            "realTimeFactor": round(median_ms / audio_ms[label], 3) if audio_ms[label] else None,
+        }
+    report["speedup"] = round(report["baseline"]["medianMs"] / max(report["int8"]["medianMs"], 0.1), 2)
+    report["sizeReduction"] = round(1.0 - report["int8"]["sizeBytes"] / max(report["baseline"]["sizeBytes"], 1), 3)
+    return report
+
+
+@app.post("/api/voices/benchmark")
+def benchmark_voice():
+    # Up to 2 * (BENCHMARK_MAX_RUNS + 1) full renders on the shared slots: operators only.
+    err = require_admin_token()
+    if err:
+        return err
+    body = request.get_json(silent=True) or {}
+    voice_id, _variant = split_voice_variant(str(body.get("voice") or "").strip())
+    if not voice_id or not VOICE_ID_PATTERN.match(voice_id) or voice_id.startswith("supertonic:"):
+        return jsonify({"error": "voice must be an installed Piper voice id"}), 400
+    if not (VOICES_DIR / f"{voice_id}.onnx").exists():
+        return jsonify({"error": f"voice not found: {voice_id}"}), 404
+    if not (VOICES_DIR / f"{voice_id}@int8.onnx").exists():
+        return jsonify({"error": f"install {voice_id}@int8 first"}), 409
+    text = " ".join(str(body.get("text") or BENCHMARK_DEFAULT_TEXT).split())[:1000]
+    try:
+        runs = max(1, min(int(body.get("runs") or 3), BENCHMARK_MAX_RUNS))
+    except (TypeError, ValueError):
+        return jsonify({"error": "runs must be an integer"}), 400
+    try:
+        return jsonify(benchmark_voice_variants(voice_id, text, runs))
+    except SynthesisError as exc:
+        return exc.to_response()
 
 
 @app.delete("/api/voices/<voice_id>")
@@ -781,22 +3280,25 @@ def uninstall_voice(voice_id: str):
     if not VOICE_ID_PATTERN.match(voice_id):
         return jsonify({"error": "invalid voice id"}), 400
     if voice_id.startswith("supertonic:"):
-        enabled = get_enabled_supertone_voice_ids()
-        removed = voice_id in enabled
-        if removed:
-            enabled.remove(voice_id)
-            set_enabled_supertone_voice_ids(enabled)
+        with shared_lock("supertonic-voices", LOCKS_DIR):
+            enabled = get_enabled_supertone_voice_ids()
+            removed = voice_id in enabled
+            if removed:
+                enabled.remove(voice_id)
+                set_enabled_supertone_voice_ids(enabled)
         return jsonify({"ok": True, "removed": removed, "voice": voice_id})
     if voice_id == DEFAULT_VOICE:
         return jsonify({"error": "cannot uninstall default voice"}), 400
 
-    model_path = VOICES_DIR / f"{voice_id}.onnx"
-    config_path = VOICES_DIR / f"{voice_id}.onnx.json"
+    # Removing a base voice also removes the variants generated from it.
+    variant_ids = [] if "@" in voice_id else [f"{voice_id}@{variant}" for variant in installed_voice_variants(voice_id)]
     removed = False
-    for path in (model_path, config_path):
-        if path.exists():
-            path.unlink()
-            removed = True
+    for target_id in [voice_id, *variant_ids]:
+        evict_piper_voice(target_id)
+        for path in (VOICES_DIR / f"{target_id}.onnx", VOICES_DIR / f"{target_id}.onnx.json"):
+            if path.exists():
+                path.unlink()
+                removed = True
 
     return jsonify({"ok": True, "removed": removed, "voice": voice_id})
 
@@ -810,84 +3312,659 @@ def speak():
     text = (body.get("text") or "").strip()
     voice = (body.get("voice") or DEFAULT_VOICE).strip()
     speed = float(body.get("speed") or 1.0)
-    current_settings = load_settings(client_id)
-    silence_ms = int(current_settings.get("prependSilenceMs", PREPEND_SILENCE_MS))
-    if body.get("prependSilenceMs") is not None:
-        try:
-            silence_ms = int(body.get("prependSilenceMs"))
-        except (TypeError, ValueError):
-            silence_ms = int(current_settings.get("prependSilenceMs", PREPEND_SILENCE_MS))
-    silence_ms = max(0, min(silence_ms, 3000))
+    silence_ms = resolve_silence_ms(body.get("prependSilenceMs"), client_id)
 
     if not text:
         return jsonify({"error": "text is required"}), 400
+    text = normalize_speech_text(text, client_id)
 
-    output_name = f"{uuid.uuid4().hex}.wav"
-    output_path = AUDIO_DIR / output_name
+    try:
+        output_name, voice = synthesize_speech(text, voice, speed, silence_ms)
+    except SynthesisError as exc:
+        return exc.to_response()
 
-    if voice.startswith("supertonic:"):
-        try:
-            synthesize_with_supertone(text, voice, speed, output_path)
-        except Exception as exc:
-            return jsonify({"error": f"supertonic synthesis failed: {exc}"}), 500
+    token = make_audio_access_token(output_name)
+    payload = {
+        "audioUrl": f"/api/audio/{output_name}?token={token}",
+        "voice": voice,
+        "speed": speed,
+    }
+    if body.get("timings"):
+        payload["timings"] = load_speech_timings(output_name, text, silence_ms)
+    return jsonify(payload), 201
+
+
+@app.post("/api/stream/sessions")
+def create_stream():
+    client_id, err = optional_client_id()
+    if err:
+        return err
+    session = create_stream_session(client_id)
+    return (
+        jsonify(
+            {
+                "sessionId": session.id,
+                "eventsUrl": f"/api/stream/sessions/{session.id}/events",
+                "idleTimeoutSeconds": STREAM_SESSION_IDLE_SECONDS,
+            }
+        ),
+        201,
+    )
+
+
+@app.get("/api/stream/sessions/<session_id>/events")
+def stream_events(session_id: str):
+    session = get_stream_session(session_id)
+    if session is None:
+        return forward_to_owner_process(session_id) or (jsonify({"error": "stream session not found"}), 404)
+    try:
+        last_event_id = int(request.headers.get("Last-Event-ID") or request.args.get("lastEventId") or 0)
+    except ValueError:
+        last_event_id = 0
+
+    def generate():
+        cursor = last_event_id
+        yield f"retry: 2000\nevent: ready\ndata: {json.dumps({'sessionId': session.id})}\n\n"
+        while True:
+            with session.cond:
+                batch = session.events_after(cursor)
+                if not batch and not session.closed:
+                    session.cond.wait(timeout=STREAM_KEEPALIVE_SECONDS)
+                    batch = session.events_after(cursor)
+                closed = session.closed
+            session.touch()
+            for event_id, event, data in batch:
+                cursor = event_id
+                yield sse_message(event_id, event, data)
+            if closed:
+                yield "event: closed\ndata: {}\n\n"
+                return
+            if not batch:
+                yield ": keepalive\n\n"
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return Response(generate(), mimetype="text/event-stream", headers=headers)
+
+
+@app.post("/api/stream/sessions/<session_id>/segments")
+def stream_segments(session_id: str):
+    session = get_stream_session(session_id)
+    if session is None:
+        return forward_to_owner_process(session_id) or (jsonify({"error": "stream session not found"}), 404)
+    body = request.get_json(silent=True) or {}
+    if not isinstance(body, dict):
+        return jsonify({"error": "body must be an object"}), 400
+    segments, error = normalize_speak_segments(
+        body.get("segments"),
+        session.client_id,
+        bool(body.get("inline")),
+        timings_default=bool(body.get("timings")),
+    )
+    if error:
+        return jsonify({"error": error}), 400
+    session.enqueue(segments)
+    return jsonify({"ok": True, "queued": [segment["id"] for segment in segments]}), 202
+
+
+@app.post("/api/stream/sessions/<session_id>/cancel")
+def stream_cancel(session_id: str):
+    session = get_stream_session(session_id)
+    if session is None:
+        return forward_to_owner_process(session_id) or (jsonify({"error": "stream session not found"}), 404)
+    body = request.get_json(silent=True) or {}
+    ids = body.get("ids") if isinstance(body, dict) else None
+    if ids is not None and not isinstance(ids, list):
+        return jsonify({"error": "ids must be an array"}), 400
+    canceled = session.cancel([str(item) for item in ids] if ids is not None else None)
+    return jsonify({"ok": True, "canceled": canceled})
+
+
+@app.delete("/api/stream/sessions/<session_id>")
+def stream_close(session_id: str):
+    removed = close_stream_session(session_id)
+    if not removed:
+        forwarded = forward_to_owner_process(session_id)
+        if forwarded is not None:
+            return forwarded
+    return jsonify({"ok": True, "closed": removed})
+
+
+@app.post("/api/prefetch")
+def create_prefetch():
+    client_id, err = optional_client_id()
+    if err:
+        return err
+    if not SYNTH_CACHE_ENABLED:
+        return jsonify({"error": "prefetch requires the synthesis cache (OPEN_TTS_SYNTH_CACHE)"}), 501
+    body = request.get_json(silent=True) or {}
+    if not isinstance(body, dict):
+        return jsonify({"error": "body must be an object"}), 400
+    segments, error = normalize_speak_segments(body.get("segments"), client_id, limit=PREFETCH_MAX_SEGMENTS)
+    if error:
+        return jsonify({"error": error}), 400
+    group = submit_prefetch(client_id, segments, replace=body.get("replace", True) is not False)
+    return jsonify(group.to_dict()), 202
+
+
+@app.get("/api/prefetch/<prefetch_id>")
+def read_prefetch(prefetch_id: str):
+    group = get_prefetch_group(prefetch_id)
+    if group is None:
+        return forward_to_owner_process(prefetch_id) or (jsonify({"error": "prefetch not found"}), 404)
+    with _PREFETCH_LOCK:
+        payload = group.to_dict()
+    return jsonify(payload)
+
+
+@app.delete("/api/prefetch/<prefetch_id>")
+def delete_prefetch(prefetch_id: str):
+    group = get_prefetch_group(prefetch_id)
+    if group is None:
+        return forward_to_owner_process(prefetch_id) or (jsonify({"error": "prefetch not found"}), 404)
+    cancel_prefetch_group(group)
+    return jsonify({"ok": True, "prefetchId": group.id})
+
+
+def load_job_for_request(job_id: str):
+    client_id, err = optional_client_id()
+    if err:
+        return None, err
+    manifest = DOCUMENT_JOBS.read_manifest(job_id)
+    if manifest is None or (manifest.get("clientId") and manifest.get("clientId") != client_state_key(client_id or "")):
+        return None, (jsonify({"error": "job not found"}), 404)
+    return manifest, None
+
+
+@app.post("/api/jobs")
+def create_job():
+    client_id, err = optional_client_id()
+    if err:
+        return err
+    if (request.content_length or 0) > JOB_MAX_INPUT_BYTES:
+        return jsonify({"error": f"document exceeds {JOB_MAX_INPUT_BYTES} bytes"}), 413
+
+    upload = request.files.get("file")
+    if upload is not None:
+        options = request.form
+        fmt = document_format_for(upload.filename, upload.mimetype, options.get("format"))
+        lines = io.TextIOWrapper(upload.stream, encoding="utf-8", errors="replace")
+        title = options.get("title") or Path(upload.filename or "").stem
     else:
-        model_path = VOICES_DIR / f"{voice}.onnx"
-        if not model_path.exists():
-            fallback_model = VOICES_DIR / f"{DEFAULT_VOICE}.onnx"
-            if fallback_model.exists():
-                voice = DEFAULT_VOICE
-                model_path = fallback_model
-            else:
-                return jsonify({"error": f"voice not found: {voice}"}), 400
-
-        cmd = [
-            PIPER_BIN,
-            "--model",
-            str(model_path),
-            "--output_file",
-            str(output_path),
-            "--length_scale",
-            str(normalize_speed(speed)),
-        ]
+        options = request.get_json(silent=True) or {}
+        if not isinstance(options, dict):
+            return jsonify({"error": "body must be an object or multipart upload"}), 400
+        fmt = document_format_for("", "", options.get("format"))
+        lines = io.StringIO(str(options.get("text") or ""))
+        title = options.get("title") or ""
+
+    voice = str(options.get("voice") or DEFAULT_VOICE).strip() or DEFAULT_VOICE
+    try:
+        speed = float(options.get("speed") or 1.0)
+        if not voice.startswith("supertonic:"):
+            voice = resolve_piper_voice(voice)
+    except SynthesisError as exc:
+        return exc.to_response()
+    except (TypeError, ValueError):
+        return jsonify({"error": "speed must be a number"}), 400
+
+    job_id = secrets.token_hex(16)
+    title = str(title or "Document").strip()[:200]
+    try:
+        planned = DOCUMENT_JOBS.plan(job_id, lines, fmt, title)
+    except Exception:
+        shutil.rmtree(DOCUMENT_JOBS.job_dir(job_id), ignore_errors=True)
+        raise
+    if not planned["chunks"]:
+        shutil.rmtree(DOCUMENT_JOBS.job_dir(job_id), ignore_errors=True)
+        return jsonify({"error": "document has no readable text"}), 400
+
+    now = datetime.now(timezone.utc).isoformat()
+    manifest = {
+        "id": job_id,
+        "clientId": client_state_key(client_id) if client_id else "",
+        "title": title,
+        "format": fmt,
+        "voice": voice,
+        "speed": speed,
+        "prependSilenceMs": resolve_silence_ms(options.get("prependSilenceMs"), client_id),
+        "status": "queued",
+        "totalChunks": planned["chunks"],
+        "totalChapters": planned["chapters"],
+        "createdAt": now,
+        "updatedAt": now,
+    }
+    DOCUMENT_JOBS.write_manifest(manifest)
+    DOCUMENT_JOBS.start(job_id)
+    return jsonify(job_status_payload(manifest)), 202
+
+
+@app.get("/api/jobs/<job_id>")
+def get_job(job_id: str):
+    manifest, err = load_job_for_request(job_id)
+    if err:
+        return err
+    return jsonify(job_status_payload(manifest))
+
+
+@app.get("/api/jobs/<job_id>/index")
+def get_job_index(job_id: str):
+    manifest, err = load_job_for_request(job_id)
+    if err:
+        return err
+    if manifest.get("status") != "complete":
+        return jsonify({"error": "job is not complete"}), 409
+    return jsonify(read_json_file(DOCUMENT_JOBS.job_dir(job_id) / "index.json", {}))
+
+
+@app.post("/api/jobs/<job_id>/resume")
+def resume_job(job_id: str):
+    manifest, err = load_job_for_request(job_id)
+    if err:
+        return err
+    if manifest.get("status") == "complete":
+        return jsonify(job_status_payload(manifest))
+    # The worker marks the job running once it holds the job lock; if another replica already
+    # holds it, that replica keeps rendering.
+    DOCUMENT_JOBS.start(job_id)
+    return jsonify(job_status_payload(manifest)), 202
+
+
+@app.delete("/api/jobs/<job_id>")
+def delete_job(job_id: str):
+    manifest, err = load_job_for_request(job_id)
+    if err:
+        return err
+    DOCUMENT_JOBS.cancel(job_id)
+    shutil.rmtree(DOCUMENT_JOBS.job_dir(job_id), ignore_errors=True)
+    if manifest.get("audioName"):
+        (AUDIO_DIR / manifest["audioName"]).unlink(missing_ok=True)
+    return jsonify({"ok": True, "jobId": job_id})
+
+
+def require_admin_token():
+    if not ADMIN_TOKEN:
+        return jsonify({"error": "admin endpoints are disabled (set OPEN_TTS_ADMIN_TOKEN)"}), 404
+    supplied = request.headers.get(ADMIN_TOKEN_HEADER) or ""
+    auth = request.headers.get("Authorization") or ""
+    if not supplied and auth.lower().startswith("bearer "):
+        supplied = auth[7:].strip()
+    if not hmac.compare_digest(supplied, ADMIN_TOKEN):
+        return jsonify({"error": "forbidden"}), 403
+    return None
 
-        try:
-            subprocess.run(
-                cmd,
-                input=text.encode("utf-8"),
-                capture_output=True,
-                check=True,
-                timeout=SPEAK_TIMEOUT_SECONDS,
-            )
-        except subprocess.CalledProcessError as exc:
-            return (
-                jsonify(
-                    {
-                        "error": "piper synthesis failed",
-                        "stderr": exc.stderr.decode("utf-8", errors="ignore"),
-                    }
-                ),
-                500,
-            )
-        except subprocess.TimeoutExpired:
-            return jsonify({"error": "piper synthesis timed out"}), 504
 
+def process_memory(pid) -> dict:
+    """Unique (private) vs shared resident memory for one process, from /proc/<pid>/smaps_rollup (Linux)."""
+    fields = {}
     try:
-        prepend_wav_silence(output_path, silence_ms)
-    except Exception as exc:
-        # Do not fail synthesis when silence prepend fails.
-        print(f"[open-tts] warning: could not prepend silence: {exc}")
+        with open(f"/proc/{pid}/smaps_rollup", encoding="utf-8") as handle:
+            for line in handle:
+                name, _sep, rest = line.partition(":")
+                parts = rest.split()
+                if len(parts) == 2 and parts[1] == "kB":
+                    fields[name] = int(parts[0])
+    except OSError:
+        return None
+    return {
+        "pid": os.getpid() if pid == "self" else int(pid),
+        "rssKb": fields.get("Rss", 0),
+        "pssKb": fields.get("Pss", 0),
+        "uniqueKb": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+        "sharedKb": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+    }
 
-    token = make_audio_access_token(output_name)
+
+def server_process_ids() -> list:
+    supervisor = supervisor_pid()
+    if not supervisor:
+        return [os.getpid()]
+    try:
+        children = Path(f"/proc/{supervisor}/task/{supervisor}/children").read_text().split()
+    except OSError:
+        return [os.getpid()]
+    return [int(pid) for pid in children] or [os.getpid()]
+
+
+@app.get("/api/admin/memory")
+def admin_memory():
+    err = require_admin_token()
+    if err:
+        return err
+    processes = [report for report in (process_memory(pid) for pid in server_process_ids()) if report]
+    supervisor = process_memory(supervisor_pid()) if supervisor_pid() else None
+    with _PIPER_VOICES_LOCK:
+        loaded = sorted(_PIPER_VOICES)
+    return jsonify(
+        {
+            "mode": "prefork" if supervisor_pid() else "single",
+            "pid": os.getpid(),
+            "loadedVoices": loaded,
+            "processes": processes,
+            "supervisor": supervisor,
+            "totals": {
+                "uniqueKb": sum(report["uniqueKb"] for report in processes),
+                "pssKb": sum(report["pssKb"] for report in processes),
+            },
+        }
+    )
+
+
+@app.get("/api/admin/scheduler")
+def admin_scheduler():
+    err = require_admin_token()
+    if err:
+        return err
+    return jsonify({"pid": os.getpid(), **INFERENCE_SCHEDULER.describe()})
+
+
+_PROFILED_THREADS = {}
+_PROFILE_COND = threading.Condition()
+# "onDemand" is the running POST profile, "last" the most recent one (running or finished) for polling.
+_PROFILE_STATE = {"completedRequests": 0, "onDemand": None, "last": None, "background": None}
+
+
+def profiling_active() -> bool:
+    return _PROFILE_STATE["onDemand"] is not None or _PROFILE_STATE["background"] is not None
+
+
+def mark_profiled_thread(delta: int) -> None:
+    """Count the current thread in (+1) or out (-1) of the work the sampler looks at; marks nest."""
+    ident = threading.get_ident()
+    with _PROFILE_COND:
+        depth = _PROFILED_THREADS.get(ident, 0) + delta
+        if depth > 0:
+            _PROFILED_THREADS[ident] = depth
+        else:
+            _PROFILED_THREADS.pop(ident, None)
+
+
+@contextmanager
+def profiled_thread():
+    marked = profiling_active()
+    if marked:
+        mark_profiled_thread(1)
+    try:
+        yield
+    finally:
+        if marked:
+            mark_profiled_thread(-1)
+
+
+@app.before_request
+def mark_request_thread():
+    # Without a sampler running, requests skip the bookkeeping entirely.
+    if profiling_active():
+        mark_profiled_thread(1)
+        g.open_tts_profiled = True
+
+
+@app.teardown_request
+def unmark_request_thread(_exc):
+    if g.pop("open_tts_profiled", False):
+        mark_profiled_thread(-1)
+    if _PROFILE_STATE["onDemand"] is not None:
+        with _PROFILE_COND:
+            _PROFILE_STATE["completedRequests"] += 1
+            _PROFILE_COND.notify_all()
+
+
+def frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '?')}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class StackSampler:
+    """Statistical profiler: samples other threads' Python stacks into collapsed (flamegraph) form."""
+
+    def __init__(self, hz: float, all_threads: bool = False):
+        self.id = process_scoped_id(12)
+        self.interval = 1.0 / hz
+        self.hz = hz
+        self.all_threads = all_threads
+        self.elapsed = None
+        self.counts = Counter()
+        self.samples = 0
+        self.started_at = time.time()
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self) -> "StackSampler":
+        self.thread = threading.Thread(target=self._run, name="open-tts-profiler", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+
+    def _run(self) -> None:
+        while not self.stop_event.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        with _PROFILE_COND:
+            marked = set(_PROFILED_THREADS)
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        stacks = []
+        for ident, frame in sys._current_frames().items():
+            name = names.get(ident, "thread")
+            # Idle server and heartbeat threads would drown the profile; only marked work is sampled by default.
+            if name == "open-tts-profiler" or (not self.all_threads and ident not in marked):
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(frame_label(frame))
+                frame = frame.f_back
+            # Thread names carry counters ("Thread-12 (process_request_thread)"); fold them together.
+            labels.append(re.sub(r"\d+", "N", name).replace(";", ","))
+            stacks.append(";".join(reversed(labels)))
+        with self.lock:
+            self.samples += 1
+            for stack in stacks:
+                if stack not in self.counts and len(self.counts) >= PROFILE_MAX_STACKS:
+                    stack = "[other stacks]"
+                self.counts[stack] += 1
+
+    def collapsed(self, reset: bool = False) -> tuple:
+        with self.lock:
+            lines = [f"{stack} {count}" for stack, count in sorted(self.counts.items())]
+            samples = self.samples
+            if reset:
+                self.counts.clear()
+                self.samples = 0
+                self.started_at = time.time()
+        return "\n".join(lines) + ("\n" if lines else ""), samples
+
+
+def start_background_profiler() -> None:
+    if PROFILE_ALWAYS_ON_HZ and _PROFILE_STATE["background"] is None:
+        _PROFILE_STATE["background"] = StackSampler(PROFILE_ALWAYS_ON_HZ).start()
+
+
+def profile_response(sampler: StackSampler, text: str, samples: int, seconds: float) -> Response:
+    response = Response(text, mimetype="text/plain")
+    response.headers["X-OpenTTS-Profile-Pid"] = str(os.getpid())
+    response.headers["X-OpenTTS-Profile-Samples"] = str(samples)
+    response.headers["X-OpenTTS-Profile-Hz"] = f"{sampler.hz:g}"
+    response.headers["X-OpenTTS-Profile-Seconds"] = f"{seconds:.1f}"
+    return response
+
+
+def run_on_demand_profile(sampler: StackSampler, seconds: float, target: int) -> None:
+    started = time.perf_counter()
+    sampler.start()
+    try:
+        with _PROFILE_COND:
+            if target:
+                _PROFILE_COND.wait_for(lambda: _PROFILE_STATE["completedRequests"] >= target, timeout=seconds)
+            else:
+                _PROFILE_COND.wait_for(lambda: False, timeout=seconds)
+    finally:
+        sampler.stop()
+        sampler.elapsed = time.perf_counter() - started
+        with _PROFILE_COND:
+            _PROFILE_STATE["onDemand"] = None
+
+
+@app.post("/api/admin/profile")
+def admin_profile():
+    """Start sampling this process in the background; poll the returned statusUrl for the stacks."""
+    err = require_admin_token()
+    if err:
+        return err
+    body = request.get_json(silent=True) or {}
+    if not isinstance(body, dict):
+        body = {}
+
+    def option(name: str, default):
+        value = request.args.get(name, body.get(name, default))
+        return float(value) if value not in (None, "") else default
+
+    try:
+        seconds = min(max(0.1, option("seconds", 10.0)), PROFILE_MAX_SECONDS)
+        hz = min(max(1.0, option("hz", PROFILE_DEFAULT_HZ)), PROFILE_MAX_HZ)
+        request_count = int(option("requests", 0) or 0)
+    except (TypeError, ValueError):
+        return jsonify({"error": "seconds, hz and requests must be numbers"}), 400
+    all_threads = str(request.args.get("threads", body.get("threads", "active"))).lower() == "all"
+
+    with _PROFILE_COND:
+        if _PROFILE_STATE["onDemand"] is not None:
+            return jsonify({"error": "a profile is already running in this process"}), 409
+        sampler = StackSampler(hz, all_threads=all_threads)
+        _PROFILE_STATE["onDemand"] = sampler
+        _PROFILE_STATE["last"] = sampler
+        target = _PROFILE_STATE["completedRequests"] + request_count if request_count > 0 else 0
+    threading.Thread(
+        target=run_on_demand_profile, args=(sampler, seconds, target), name="open-tts-profiler", daemon=True
+    ).start()
     return (
         jsonify(
             {
-                "audioUrl": f"/api/audio/{output_name}?token={token}",
-                "voice": voice,
-                "speed": speed,
+                "profileId": sampler.id,
+                "statusUrl": f"/api/admin/profile/{sampler.id}",
+                "pid": os.getpid(),
+                "seconds": seconds,
+                "requests": request_count,
+                "hz": hz,
             }
         ),
-        201,
+        202,
+    )
+
+
+@app.get("/api/admin/profile/<profile_id>")
+def admin_profile_result(profile_id: str):
+    err = require_admin_token()
+    if err:
+        return err
+    sampler = _PROFILE_STATE["last"]
+    if sampler is None or sampler.id != profile_id:
+        return forward_to_owner_process(profile_id) or (jsonify({"error": "profile not found"}), 404)
+    if sampler.elapsed is None:
+        elapsed = round(time.time() - sampler.started_at, 1)
+        return jsonify({"profileId": sampler.id, "status": "running", "elapsedSeconds": elapsed}), 202, {"Retry-After": "1"}
+    text, samples = sampler.collapsed()
+    return profile_response(sampler, text, samples, sampler.elapsed)
+
+
+@app.get("/api/admin/profile")
+def admin_profile_background():
+    """Collapsed stacks gathered by the always-on sampler (OPEN_TTS_PROFILE_HZ); `reset=1` starts a new window."""
+    err = require_admin_token()
+    if err:
+        return err
+    sampler = _PROFILE_STATE["background"]
+    if sampler is None:
+        return jsonify({"error": "always-on profiling is off (set OPEN_TTS_PROFILE_HZ)"}), 404
+    seconds = time.time() - sampler.started_at
+    text, samples = sampler.collapsed(reset=request.args.get("reset") in {"1", "true"})
+    return profile_response(sampler, text, samples, seconds)
+
+
+def require_worker_secret():
+    if not WORKER_SECRET:
+        return jsonify({"error": "worker protocol is disabled (set OPEN_TTS_WORKER_SECRET)"}), 404
+    if not worker_secret_valid(request.headers.get(WORKER_SECRET_HEADER)):
+        return jsonify({"error": "forbidden"}), 403
+    return None
+
+
+@app.post("/api/workers/register")
+def worker_register():
+    err = require_worker_secret()
+    if err:
+        return err
+    body = request.get_json(silent=True) or {}
+    if not isinstance(body, dict):
+        return jsonify({"error": "body must be an object"}), 400
+    worker_id = str(body.get("workerId") or "").strip()
+    url = str(body.get("url") or "").strip().rstrip("/")
+    if not WORKER_ID_PATTERN.match(worker_id):
+        return jsonify({"error": "invalid workerId"}), 400
+    if urlparse(url).scheme not in {"http", "https"} or not urlparse(url).netloc:
+        return jsonify({"error": "url must be an http(s) URL"}), 400
+    try:
+        capacity = max(1, int(body.get("capacity") or 1))
+        active = max(0, int(body.get("active") or 0))
+    except (TypeError, ValueError):
+        return jsonify({"error": "capacity and active must be integers"}), 400
+    voices = [str(v) for v in body.get("voices") or [] if isinstance(v, str)]
+    warm = [str(v) for v in body.get("warm") or [] if isinstance(v, str)]
+    register_worker(
+        {"id": worker_id, "url": url, "voices": voices, "warm": warm, "capacity": capacity, "active": active}
     )
+    return jsonify({"ok": True, "workerId": worker_id, "ttlSeconds": WORKER_TTL_SECONDS})
+
+
+@app.get("/api/workers")
+def worker_list():
+    err = require_worker_secret()
+    if err:
+        return err
+    now = time.time()
+    workers = []
+    for info in list_workers():
+        with _WORKER_LOCK:
+            inflight = _WORKER_INFLIGHT.get(info["id"], 0)
+            cooling = _WORKER_FAILED_UNTIL.get(info["id"], 0) > now
+        workers.append({**info, "inflight": inflight, "coolingDown": cooling})
+    return jsonify({"workers": workers})
+
+
+@app.delete("/api/workers/<worker_id>")
+def worker_unregister(worker_id: str):
+    err = require_worker_secret()
+    if err:
+        return err
+    if not WORKER_ID_PATTERN.match(worker_id):
+        return jsonify({"error": "invalid workerId"}), 400
+    unregister_worker(worker_id)
+    return jsonify({"ok": True, "workerId": worker_id})
+
+
+def send_audio_file(filename: str, mimetype: str, download_name: str = None):
+    """Send a clip from AUDIO_DIR or the ephemeral ring, or hand a durable file to nginx via X-Accel-Redirect."""
+    directory = audio_file_path(filename).parent
+    # nginx only mounts AUDIO_DIR; ring clips always go out through Flask.
+    if directory != AUDIO_DIR or not AUDIO_ACCEL_PREFIX or request.headers.get(AUDIO_ACCEL_HEADER) != "1":
+        return send_from_directory(
+            directory,
+            filename,
+            mimetype=mimetype,
+            as_attachment=download_name is not None,
+            download_name=download_name,
+        )
+    if not (AUDIO_DIR / filename).is_file():
+        return jsonify({"error": "audio not found"}), 404
+    # nginx keeps Content-Type and Content-Disposition from this response and streams the body with sendfile.
+    response = Response(status=200, mimetype=mimetype)
+    response.headers["X-Accel-Redirect"] = f"{AUDIO_ACCEL_PREFIX}/{quote(filename)}"
+    if download_name is not None:
+        response.headers.set("Content-Disposition", "attachment", filename=download_name)
+    return response
 
 
 @app.get("/api/audio/<path:name>")
@@ -898,7 +3975,20 @@ def audio(name: str):
     token = request.args.get("token", "")
     if not verify_audio_access_token(filename, token):
         return jsonify({"error": "forbidden"}), 403
-    return send_from_directory(AUDIO_DIR, filename, mimetype="audio/wav")
+    return send_audio_file(filename, "audio/wav")
+
+
+@app.post("/api/audio/<path:name>/pin")
+def pin_audio(name: str):
+    filename = safe_audio_filename(name)
+    if not filename:
+        return jsonify({"error": "invalid filename"}), 400
+    token = request.args.get("token", "")
+    if not verify_audio_access_token(filename, token):
+        return jsonify({"error": "forbidden"}), 403
+    if not persist_audio_file(filename):
+        return jsonify({"error": "audio not found"}), 404
+    return jsonify({"ok": True, "name": filename})
 
 
 @app.get("/api/download/<path:name>")
@@ -910,52 +4000,237 @@ def download_audio(name: str):
     if not verify_audio_access_token(filename, token):
         return jsonify({"error": "forbidden"}), 403
 
-    source_path = AUDIO_DIR / filename
-    if not source_path.exists():
+    # Downloads are kept: a clip still in the ephemeral ring becomes durable here.
+    if not persist_audio_file(filename):
         return jsonify({"error": "audio not found"}), 404
+    source_path = AUDIO_DIR / filename
 
     fmt = safe_download_format(request.args.get("format", "wav"))
     if fmt == "wav":
-        return send_from_directory(
-            AUDIO_DIR,
-            filename,
-            mimetype="audio/wav",
-            as_attachment=True,
-            download_name=filename,
-        )
+        return send_audio_file(filename, "audio/wav", download_name=filename)
 
     if not shutil.which("ffmpeg"):
         return jsonify({"error": "ffmpeg is required for mp3/ogg conversion"}), 501
 
     converted_name = f"{source_path.stem}.{fmt}"
     converted_path = AUDIO_DIR / converted_name
-    if (not converted_path.exists()) or converted_path.stat().st_mtime < source_path.stat().st_mtime:
-        cmd = ["ffmpeg", "-y", "-i", str(source_path), str(converted_path)]
-        try:
-            subprocess.run(cmd, capture_output=True, check=True, timeout=60)
-        except subprocess.CalledProcessError as exc:
-            return (
-                jsonify(
-                    {
-                        "error": "audio conversion failed",
-                        "stderr": exc.stderr.decode("utf-8", errors="ignore"),
-                    }
-                ),
-                500,
-            )
-        except subprocess.TimeoutExpired:
-            return jsonify({"error": "audio conversion timed out"}), 504
+
+    def is_stale() -> bool:
+        return (not converted_path.exists()) or converted_path.stat().st_mtime < source_path.stat().st_mtime
+
+    if is_stale():
+        # One conversion per file across replicas; ffmpeg writes a private temp file that is renamed into place.
+        with shared_lock(f"convert-{converted_name}", AUDIO_LOCKS_DIR):
+            if is_stale():
+                tmp_path = AUDIO_DIR / f".{source_path.stem}.{uuid.uuid4().hex}.tmp.{fmt}"
+                cmd = ["ffmpeg", "-y", "-i", str(source_path), str(tmp_path)]
+                try:
+                    subprocess.run(cmd, capture_output=True, check=True, timeout=60)
+                    tmp_path.replace(converted_path)
+                except subprocess.CalledProcessError as exc:
+                    return (
+                        jsonify(
+                            {
+                                "error": "audio conversion failed",
+                                "stderr": exc.stderr.decode("utf-8", errors="ignore"),
+                            }
+                        ),
+                        500,
+                    )
+                except subprocess.TimeoutExpired:
+                    return jsonify({"error": "audio conversion timed out"}), 504
+                finally:
+                    tmp_path.unlink(missing_ok=True)
 
     mime = "audio/mpeg" if fmt == "mp3" else "audio/ogg"
-    return send_from_directory(
-        AUDIO_DIR,
-        converted_name,
-        mimetype=mime,
-        as_attachment=True,
-        download_name=converted_name,
+    return send_audio_file(converted_name, mime, download_name=converted_name)
+
+
+@app.post("/api/export")
+def export_audio():
+    client_id, err = optional_client_id()
+    if err:
+        return err
+    body = request.get_json(silent=True) or {}
+    if not isinstance(body, dict):
+        return jsonify({"error": "export body must be an object"}), 400
+    mode = str(body.get("mode") or "concat").strip().lower()
+    if mode not in {"concat", "zip"}:
+        return jsonify({"error": "mode must be concat or zip"}), 400
+    fmt = safe_download_format(body.get("format"))
+    if mode == "zip" and fmt != "wav":
+        return jsonify({"error": "zip exports contain the WAV clips; use mode concat for mp3/ogg"}), 400
+    try:
+        gap_ms = min(max(0, int(body.get("gapMs") or 0)), EXPORT_MAX_GAP_MS)
+    except (TypeError, ValueError):
+        return jsonify({"error": "gapMs must be a number"}), 400
+    with_chapters = bool(body.get("chapters", True))
+
+    references, err = export_references(body, client_id)
+    if err:
+        return err
+    clips, missing = resolve_export_clips(references)
+    if not clips:
+        return jsonify({"error": "none of the requested audio is available", "missing": missing}), 404
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    headers = {"X-OpenTTS-Export-Missing": str(len(missing))}
+    if mode == "zip":
+        response = Response(stream_zip_export(clips), mimetype="application/zip", headers=headers)
+        response.headers.set("Content-Disposition", "attachment", filename=f"open-tts-export-{stamp}.zip")
+        return response
+
+    work_dir = AUDIO_DIR / f".export.{uuid.uuid4().hex}"
+    try:
+        plan = plan_export_concat(clips, gap_ms, work_dir)
+        header = wav_export_header(plan["format"], plan["dataBytes"], plan["cues"] if with_chapters else [])
+        if fmt == "wav" and len(header) + plan["dataBytes"] > 0xFFFFFFFF:
+            raise SynthesisError("export is too large for a single WAV file; use mode zip", 413)
+        if fmt != "wav" and not shutil.which("ffmpeg"):
+            raise SynthesisError("ffmpeg is required for mp3/ogg conversion", 501)
+    except SynthesisError as exc:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        return exc.to_response()
+    except ExportError as exc:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        return jsonify({"error": str(exc)}), exc.status
+    except Exception:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        raise
+
+    if fmt == "wav":
+        chunks = stream_wav_export(plan, header)
+        mimetype = "audio/wav"
+    else:
+        chunks = stream_encoded_export(plan, fmt, with_chapters, work_dir)
+        mimetype = "audio/mpeg" if fmt == "mp3" else "audio/ogg"
+    response = Response(with_cleanup(chunks, work_dir), mimetype=mimetype, headers=headers)
+    if fmt == "wav":
+        response.content_length = len(header) + plan["dataBytes"] + plan["dataBytes"] % 2
+    response.headers.set("Content-Disposition", "attachment", filename=f"open-tts-export-{stamp}.{fmt}")
+    return response
+
+
+worker_app = Flask("open-tts-worker")
+
+
+@worker_app.get("/worker/health")
+def worker_health():
+    with _WORKER_LOCK:
+        active = _WORKER_ACTIVE["count"]
+    return jsonify(
+        {
+            "ok": True,
+            "workerId": _WORKER_ID,
+            "capacity": WORKER_CAPACITY,
+            "active": active,
+            "scheduler": INFERENCE_SCHEDULER.describe(),
+        }
+    )
+
+
+@worker_app.post("/worker/synthesize")
+def worker_synthesize():
+    if not worker_secret_valid(request.headers.get(WORKER_SECRET_HEADER)):
+        return jsonify({"error": "forbidden"}), 403
+    body = request.get_json(silent=True) or {}
+    text = str(body.get("text") or "").strip()
+    voice = str(body.get("voice") or DEFAULT_VOICE).strip()
+    if not text:
+        return jsonify({"error": "text is required"}), 400
+    try:
+        speed = float(body.get("speed") or 1.0)
+        silence_ms = max(0, min(int(body.get("prependSilenceMs") or 0), 3000))
+    except (TypeError, ValueError):
+        return jsonify({"error": "speed and prependSilenceMs must be numbers"}), 400
+    if not voice.startswith("supertonic:") and not (VOICES_DIR / f"{voice}.onnx").exists():
+        return jsonify({"error": f"voice not found: {voice}"}), 400
+    if not _WORKER_SLOTS.acquire(blocking=False):
+        return jsonify({"error": "worker is at capacity"}), 503
+
+    output_path = AUDIO_DIR / f".worker.{uuid.uuid4().hex}.tmp.wav"
+    with _WORKER_LOCK:
+        _WORKER_ACTIVE["count"] += 1
+    try:
+        timings = render_speech(text, voice, speed, silence_ms, output_path)
+        audio = base64.b64encode(output_path.read_bytes()).decode("ascii")
+    except SynthesisError as exc:
+        return exc.to_response()
+    finally:
+        output_path.unlink(missing_ok=True)
+        with _WORKER_LOCK:
+            _WORKER_ACTIVE["count"] -= 1
+        _WORKER_SLOTS.release()
+    return jsonify({"workerId": _WORKER_ID, "voice": voice, "audio": audio, "timings": timings})
+
+
+def serve_app_preforked(flask_app: Flask, port: int, start_process) -> None:
+    def preload() -> None:
+        INFERENCE_SCHEDULER.configure(available_cpus())
+        preload_models()
+
+    def start_child(index: int) -> None:
+        cpus = process_cpu_share(available_cpus(), index, SERVER_PROCESSES)
+        if CPU_AFFINITY_ENABLED:
+            # Only this thread survives fork(); threads started from here on inherit the mask.
+            os.sched_setaffinity(0, cpus)
+        INFERENCE_SCHEDULER.configure(cpus)
+        start_process(index)
+
+    # Forwarded event streams stay open between keepalives; everything else answers promptly.
+    serve_preforked(
+        flask_app,
+        port,
+        SERVER_PROCESSES,
+        preload=preload,
+        on_child_start=start_child,
+        forward_timeout=STREAM_KEEPALIVE_SECONDS * 4,
     )
 
 
+def start_worker_heartbeat(index: int = None) -> None:
+    global _WORKER_ID
+    if index is not None:
+        # Each preforked process registers separately with its own slots.
+        _WORKER_ID = f"{_WORKER_ID}-{index}"
+    threading.Thread(target=worker_heartbeat_loop, name="open-tts-worker-heartbeat", daemon=True).start()
+
+
+def start_worker_process(index: int) -> None:
+    start_worker_heartbeat(index)
+    if index == 0:
+        start_voice_setup()
+
+
+def run_worker() -> None:
+    if not WORKER_SECRET or not WORKER_API_URL:
+        raise SystemExit("[open-tts] worker mode needs OPEN_TTS_WORKER_SECRET and OPEN_TTS_WORKER_API")
+    ensure_dirs()
+    if SERVER_PROCESSES > 1:
+        serve_app_preforked(worker_app, WORKER_PORT, start_worker_process)
+        return
+    start_worker_heartbeat()
+    start_voice_setup()
+    worker_app.run(host="0.0.0.0", port=WORKER_PORT, threaded=True)
+
+
+def start_api_process(index: int) -> None:
+    # Job ownership locks make it safe for every process to try resuming interrupted jobs.
+    DOCUMENT_JOBS.resume_all()
+    start_background_profiler()
+    if index == 0:
+        start_voice_setup()
+
+
+def run_api() -> None:
+    ensure_dirs()
+    if SERVER_PROCESSES > 1:
+        serve_app_preforked(app, 5000, start_api_process)
+        return
+    start_api_process(0)
+    app.run(host="0.0.0.0", port=5000)
+
+
 def try_ensure_default_voice():
     try:
         ensure_preinstalled_piper_voices()
@@ -964,8 +4239,49 @@ def try_ensure_default_voice():
         print(f"[open-tts] warning: could not ensure default voice: {exc}")
 
 
+def start_voice_setup() -> None:
+    """Download preinstalled voices in the background so the server answers /api/health right away."""
+    # Under prefork only the first child runs this: the supervisor must not fork while a download holds locks.
+    threading.Thread(target=try_ensure_default_voice, name="open-tts-voice-setup", daemon=True).start()
+
+
+def check_startup_budget(budget_ms: int) -> bool:
+    """Time `import app` in a fresh interpreter and flag engine modules that were imported eagerly."""
+    probe = (
+        "import json, sys, time; started = time.perf_counter(); import app; "
+        "elapsed_ms = (time.perf_counter() - started) * 1000; "
+        f"print(json.dumps([elapsed_ms, [m for m in {LAZY_ENGINE_MODULES!r} if m in sys.modules]]))"
+    )
+    # OPEN_TTS_STARTUP_PROBE skips voice setup, job resumption and the profiler, so only the import is timed.
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=Path(__file__).resolve().parent,
+        env={**os.environ, "OPEN_TTS_STARTUP_PROBE": "1"},
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    if result.returncode != 0:
+        print(f"[open-tts] import app failed:\n{result.stderr}")
+        return False
+    elapsed_ms, eager = json.loads(result.stdout.strip().splitlines()[-1])
+    print(
+        f"[open-tts] import app took {elapsed_ms:.0f} ms (budget {budget_ms} ms); "
+        f"engine modules imported eagerly: {', '.join(eager) or 'none'}"
+    )
+    return elapsed_ms <= budget_ms and not eager
+
+
 if __name__ == "__main__":
-    try_ensure_default_voice()
-    app.run(host="0.0.0.0", port=5000)
-else:
-    try_ensure_default_voice()
+    if sys.argv[1:2] == ["--check-startup"]:
+        sys.exit(0 if check_startup_budget(STARTUP_BUDGET_MS) else 1)
+    if OPEN_TTS_ROLE == "worker":
+        run_worker()
+    else:
+        run_api()
+elif not STARTUP_PROBE:
+    # Imported by a WSGI server: this is its startup.
+    ensure_dirs()
+    start_voice_setup()
+    DOCUMENT_JOBS.resume_all()
+    start_background_profiler()
@@ -0,0 +1,248 @@
+"""WAV concatenation: splicing rendered clips and streaming history exports without buffering them."""
+
+import io
+import re
+import shutil
+import struct
+import subprocess
+import threading
+import time
+import wave
+import zipfile
+from pathlib import Path
+
+EXPORT_CHUNK_BYTES = 65536
+# Sample width -> PCM codec used when an export has to bring an odd clip to the common format.
+PCM_CODECS = {1: "pcm_u8", 2: "pcm_s16le", 3: "pcm_s24le", 4: "pcm_s32le"}
+
+
+class ExportError(Exception):
+    def __init__(self, message: str, status: int = 500):
+        super().__init__(message)
+        self.status = status
+
+
+def splice_wav_clips(clips: list, output_path: Path, silence_ms: int = 0) -> None:
+    """Concatenate same-format WAV clips into output_path, streaming frames so memory stays bounded."""
+    fmt = None
+    with wave.open(str(output_path), "wb") as dst:
+        for clip in clips:
+            with wave.open(str(clip), "rb") as src:
+                clip_fmt = (src.getnchannels(), src.getsampwidth(), src.getframerate())
+                if fmt is None:
+                    fmt = clip_fmt
+                    dst.setnchannels(fmt[0])
+                    dst.setsampwidth(fmt[1])
+                    dst.setframerate(fmt[2])
+                    silent_frames = int(fmt[2] * (max(0, silence_ms) / 1000.0))
+                    dst.writeframes(b"\x00" * (silent_frames * fmt[0] * fmt[1]))
+                elif clip_fmt != fmt:
+                    raise ExportError("clips have mismatched audio formats")
+                while True:
+                    frames = src.readframes(65536)
+                    if not frames:
+                        break
+                    dst.writeframes(frames)
+
+
+def convert_wav_format(source: Path, fmt: tuple, target: Path) -> Path:
+    channels, sampwidth, framerate = fmt
+    if not shutil.which("ffmpeg"):
+        raise ExportError("ffmpeg is required to export clips with different audio formats together", 501)
+    cmd = ["ffmpeg", "-y", "-loglevel", "error", "-i", str(source)]
+    cmd += ["-ac", str(channels), "-ar", str(framerate), "-c:a", PCM_CODECS[sampwidth], str(target)]
+    try:
+        subprocess.run(cmd, capture_output=True, check=True, timeout=60)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:
+        raise ExportError(f"could not convert {source.name} for export") from exc
+    return target
+
+
+def plan_export_concat(clips: list, gap_ms: int, work_dir: Path) -> dict:
+    """Lay clips end to end in the first clip's format; only clips in another format are converted."""
+    fmt = None
+    gap_frames = 0
+    sources = []
+    cues = []
+    total_frames = 0
+    for index, (title, path) in enumerate(clips):
+        with wave.open(str(path), "rb") as src:
+            clip_fmt = (src.getnchannels(), src.getsampwidth(), src.getframerate())
+            nframes = src.getnframes()
+        if fmt is None:
+            fmt = clip_fmt
+            gap_frames = int(fmt[2] * gap_ms / 1000.0)
+        elif clip_fmt != fmt:
+            work_dir.mkdir(parents=True, exist_ok=True)
+            path = convert_wav_format(path, fmt, work_dir / f"{index}.wav")
+            with wave.open(str(path), "rb") as src:
+                nframes = src.getnframes()
+        if index:
+            total_frames += gap_frames
+        cues.append((total_frames, title))
+        sources.append(path)
+        total_frames += nframes
+    return {
+        "format": fmt,
+        "sources": sources,
+        "cues": cues,
+        "gapFrames": gap_frames,
+        "frames": total_frames,
+        "dataBytes": total_frames * fmt[0] * fmt[1],
+    }
+
+
+def riff_chunk(chunk_id: bytes, payload: bytes) -> bytes:
+    return chunk_id + struct.pack("<I", len(payload)) + payload + (b"\x00" if len(payload) % 2 else b"")
+
+
+def wav_export_header(fmt: tuple, data_bytes: int, cues: list) -> bytes:
+    """RIFF header for a streamed export; cue points and their labels precede the data chunk."""
+    channels, sampwidth, framerate = fmt
+    fmt_chunk = riff_chunk(
+        b"fmt ",
+        struct.pack("<HHIIHH", 1, channels, framerate, framerate * channels * sampwidth, channels * sampwidth, sampwidth * 8),
+    )
+    marker_chunks = b""
+    if cues:
+        points = b"".join(
+            struct.pack("<II4sIII", cue_id, frame, b"data", 0, 0, frame)
+            for cue_id, (frame, _title) in enumerate(cues, start=1)
+        )
+        labels = b"".join(
+            riff_chunk(b"labl", struct.pack("<I", cue_id) + title.encode("utf-8") + b"\x00")
+            for cue_id, (_frame, title) in enumerate(cues, start=1)
+        )
+        marker_chunks = riff_chunk(b"cue ", struct.pack("<I", len(cues)) + points) + riff_chunk(b"LIST", b"adtl" + labels)
+    riff_size = 4 + len(fmt_chunk) + len(marker_chunks) + 8 + data_bytes + data_bytes % 2
+    return (
+        b"RIFF"
+        + struct.pack("<I", riff_size)
+        + b"WAVE"
+        + fmt_chunk
+        + marker_chunks
+        + b"data"
+        + struct.pack("<I", data_bytes)
+    )
+
+
+def stream_wav_export(plan: dict, header: bytes):
+    """Yield the concatenated WAV without ever holding more than one read chunk in memory."""
+    channels, sampwidth, _framerate = plan["format"]
+    frame_bytes = channels * sampwidth
+    yield header
+    gap_bytes = plan["gapFrames"] * frame_bytes
+    silence = b"\x00" * min(gap_bytes, EXPORT_CHUNK_BYTES)
+    for index, path in enumerate(plan["sources"]):
+        remaining = gap_bytes if index else 0
+        while remaining > 0:
+            yield silence[:remaining]
+            remaining -= len(silence)
+        with wave.open(str(path), "rb") as src:
+            while True:
+                frames = src.readframes(max(1, EXPORT_CHUNK_BYTES // frame_bytes))
+                if not frames:
+                    break
+                yield frames
+    if plan["dataBytes"] % 2:
+        yield b"\x00"
+
+
+def ffmetadata_escape(value: str) -> str:
+    return re.sub(r"([=;#\\\n])", r"\\\1", value)
+
+
+def write_export_chapters(plan: dict, path: Path) -> None:
+    framerate = plan["format"][2]
+    starts = [round(frame * 1000 / framerate) for frame, _title in plan["cues"]]
+    ends = starts[1:] + [round(plan["frames"] * 1000 / framerate)]
+    lines = [";FFMETADATA1"]
+    for (_frame, title), start_ms, end_ms in zip(plan["cues"], starts, ends):
+        lines += ["[CHAPTER]", "TIMEBASE=1/1000", f"START={start_ms}", f"END={end_ms}", f"title={ffmetadata_escape(title)}"]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def stream_encoded_export(plan: dict, fmt: str, with_chapters: bool, work_dir: Path):
+    """Pipe the concatenated WAV through a single ffmpeg encode and yield its output as it is produced."""
+    cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-f", "wav", "-i", "pipe:0"]
+    if with_chapters:
+        work_dir.mkdir(parents=True, exist_ok=True)
+        chapters_path = work_dir / "chapters.txt"
+        write_export_chapters(plan, chapters_path)
+        cmd += ["-f", "ffmetadata", "-i", str(chapters_path), "-map_metadata", "1", "-map_chapters", "1"]
+    cmd += ["-map", "0:a", "-f", "mp3" if fmt == "mp3" else "ogg", "pipe:1"]
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def feed() -> None:
+        try:
+            for chunk in stream_wav_export(plan, wav_export_header(plan["format"], plan["dataBytes"], [])):
+                proc.stdin.write(chunk)
+        except OSError:
+            # ffmpeg exited (or was killed because the client went away).
+            pass
+        finally:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    try:
+        while True:
+            chunk = proc.stdout.read(EXPORT_CHUNK_BYTES)
+            if not chunk:
+                break
+            yield chunk
+        if proc.wait() != 0:
+            stderr = proc.stderr.read().decode("utf-8", errors="ignore").strip()
+            print(f"[open-tts] warning: export encode failed: {stderr}")
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        feeder.join(timeout=5)
+
+
+class StreamSink(io.RawIOBase):
+    """Unseekable write target for zipfile; the response generator drains it after each write."""
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def stream_zip_export(clips: list):
+    """Yield a stored (uncompressed) zip of the clips; entry sizes go into data descriptors as files stream."""
+    sink = StreamSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as archive:
+        for index, (title, path) in enumerate(clips):
+            slug = re.sub(r"[^A-Za-z0-9]+", "-", title).strip("-").lower()[:40] or "clip"
+            info = zipfile.ZipInfo(f"{index + 1:03d}-{slug}.wav", date_time=time.localtime(path.stat().st_mtime)[:6])
+            with path.open("rb") as src, archive.open(info, "w") as dst:
+                while True:
+                    chunk = src.read(EXPORT_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    yield sink.drain()
+    yield sink.drain()
+
+
+def with_cleanup(chunks, work_dir: Path):
+    try:
+        yield from chunks
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
@@ -0,0 +1,335 @@
+"""Long-document jobs: chapter-indexed chunk files rendered in the background and spliced into one WAV."""
+
+import re
+import threading
+import uuid
+import wave
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from pathlib import Path
+
+from export import splice_wav_clips
+from storage import read_json_file, shared_lock, write_json_file
+
+JOB_ID_PATTERN = re.compile(r"^[a-f0-9]{32}$")
+DOCUMENT_FORMATS = {"text", "markdown", "html"}
+
+MARKDOWN_HEADING_PATTERN = re.compile(r"^\s{0,3}(#{1,6})\s+(.*?)\s*#*\s*$")
+MARKDOWN_LINK_PATTERN = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+MARKDOWN_MARKUP_PATTERN = re.compile(r"[*_`~]+")
+MARKDOWN_PREFIX_PATTERN = re.compile(r"^\s*(?:>+\s*|[-*+]\s+|\d+[.)]\s+)")
+PLAIN_HEADING_PATTERN = re.compile(r"^(?:chapter|part|book|section)\b[\w .:-]{0,80}$", re.IGNORECASE)
+
+
+class DocumentHTMLParser(HTMLParser):
+    """Incremental HTML to heading/paragraph blocks; feed() can be called with arbitrary slices."""
+
+    BLOCK_TAGS = {"p", "div", "li", "br", "section", "article", "blockquote", "tr", "pre", "h4", "h5", "h6"}
+    HEADING_TAGS = {"h1", "h2", "h3"}
+    SKIP_TAGS = {"script", "style", "head", "noscript", "template"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks = deque()
+        self.parts = []
+        self.skip_depth = 0
+        self.in_heading = False
+
+    def flush(self, kind: str = "paragraph") -> None:
+        text = " ".join("".join(self.parts).split())
+        self.parts = []
+        if text:
+            self.blocks.append((kind, text))
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag in self.HEADING_TAGS:
+            self.flush()
+            self.in_heading = True
+        elif tag in self.BLOCK_TAGS:
+            self.flush()
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag in self.HEADING_TAGS:
+            self.flush("heading")
+            self.in_heading = False
+        elif tag in self.BLOCK_TAGS:
+            self.flush()
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+
+
+def clean_markdown_line(line: str) -> str:
+    line = MARKDOWN_PREFIX_PATTERN.sub("", line)
+    line = MARKDOWN_LINK_PATTERN.sub(r"\1", line)
+    return MARKDOWN_MARKUP_PATTERN.sub("", line)
+
+
+def iter_document_blocks(lines, fmt: str):
+    """Yield ("heading" | "paragraph", text) blocks from an iterable of text lines without buffering the document."""
+    if fmt == "html":
+        parser = DocumentHTMLParser()
+        for line in lines:
+            parser.feed(line)
+            while parser.blocks:
+                yield parser.blocks.popleft()
+        parser.close()
+        parser.flush()
+        while parser.blocks:
+            yield parser.blocks.popleft()
+        return
+
+    paragraph = []
+    in_fence = False
+    for raw_line in lines:
+        line = raw_line.rstrip("\r\n")
+        if fmt == "markdown":
+            if line.strip().startswith("```"):
+                in_fence = not in_fence
+                continue
+            if in_fence:
+                continue
+            heading = MARKDOWN_HEADING_PATTERN.match(line)
+            if heading:
+                if paragraph:
+                    yield ("paragraph", " ".join(paragraph))
+                    paragraph = []
+                title = clean_markdown_line(heading.group(2)).strip()
+                if title:
+                    yield ("heading", title)
+                continue
+            line = clean_markdown_line(line)
+        stripped = " ".join(line.split())
+        if not stripped:
+            if paragraph:
+                yield ("paragraph", " ".join(paragraph))
+                paragraph = []
+            continue
+        if fmt == "text" and not paragraph and PLAIN_HEADING_PATTERN.match(stripped):
+            yield ("heading", stripped)
+            continue
+        paragraph.append(stripped)
+    if paragraph:
+        yield ("paragraph", " ".join(paragraph))
+
+
+def split_paragraph_parts(sentences: list, limit: int) -> list:
+    parts = []
+    current = ""
+    for sentence in sentences:
+        while len(sentence) > limit:
+            cut = sentence.rfind(" ", 0, limit)
+            cut = cut if cut > 0 else limit
+            if current:
+                parts.append(current)
+                current = ""
+            parts.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if current and len(current) + 1 + len(sentence) > limit:
+            parts.append(current)
+            current = ""
+        current = f"{current} {sentence}".strip()
+    if current:
+        parts.append(current)
+    return [part for part in parts if part]
+
+
+def document_format_for(filename: str, content_type: str, requested: str = "") -> str:
+    requested = (requested or "").strip().lower()
+    if requested in DOCUMENT_FORMATS:
+        return requested
+    suffix = Path(filename or "").suffix.lower()
+    if suffix in {".html", ".htm", ".xhtml"} or "html" in (content_type or ""):
+        return "html"
+    if suffix in {".md", ".markdown"} or "markdown" in (content_type or ""):
+        return "markdown"
+    return "text"
+
+
+class DocumentJobs:
+    """Job directories under `root`; `render_chunk(text, manifest, path)` renders one chunk WAV."""
+
+    def __init__(
+        self,
+        root: Path,
+        output_dir: Path,
+        locks_dir: Path,
+        render_chunk,
+        split_sentences,
+        chunk_chars: int,
+        workers: int,
+        cancel_timeout: float,
+    ):
+        self.root = root
+        self.output_dir = output_dir
+        self.locks_dir = locks_dir
+        self.render_chunk = render_chunk
+        self.split_sentences = split_sentences
+        self.chunk_chars = chunk_chars
+        self.workers = workers
+        self.cancel_timeout = cancel_timeout
+        self.lock = threading.Lock()
+        self.running = {}
+
+    def job_dir(self, job_id: str) -> Path:
+        return self.root / job_id
+
+    def read_manifest(self, job_id: str):
+        if not JOB_ID_PATTERN.match(job_id or ""):
+            return None
+        manifest = read_json_file(self.job_dir(job_id) / "manifest.json", None)
+        return manifest if isinstance(manifest, dict) else None
+
+    def write_manifest(self, manifest: dict) -> None:
+        write_json_file(self.job_dir(manifest["id"]) / "manifest.json", manifest)
+
+    def update_manifest(self, job_id: str, **changes) -> dict:
+        with shared_lock(f"job-manifest-{job_id}", self.locks_dir):
+            manifest = self.read_manifest(job_id) or {}
+            manifest.update(changes, updatedAt=datetime.now(timezone.utc).isoformat())
+            self.write_manifest(manifest)
+            return manifest
+
+    def plan(self, job_id: str, lines, fmt: str, title: str) -> dict:
+        """Split the incoming document into paragraph-sized chunk files under the job directory."""
+        chunks_dir = self.job_dir(job_id) / "chunks"
+        chunks_dir.mkdir(parents=True, exist_ok=True)
+        chapters = []
+        plan = []
+        paragraph_index = 0
+        for kind, text in iter_document_blocks(lines, fmt):
+            if kind == "heading" or not chapters:
+                chapters.append({"title": text if kind == "heading" else title, "firstChunk": len(plan)})
+                paragraph_index = 0
+            # Headings are spoken too, as paragraph 0 of their chapter.
+            parts = split_paragraph_parts(self.split_sentences(text) or [text], self.chunk_chars)
+            for part_index, part in enumerate(parts):
+                (chunks_dir / f"{len(plan):06d}.txt").write_text(part, encoding="utf-8")
+                plan.append([len(chapters) - 1, paragraph_index, part_index])
+            paragraph_index += 1
+        write_json_file(self.job_dir(job_id) / "plan.json", {"chapters": chapters, "chunks": plan})
+        return {"chapters": len(chapters), "chunks": len(plan)}
+
+    def chunk_paths(self, job_id: str, index: int):
+        chunks_dir = self.job_dir(job_id) / "chunks"
+        return chunks_dir / f"{index:06d}.txt", chunks_dir / f"{index:06d}.wav"
+
+    def chunks_done(self, manifest: dict) -> int:
+        total = int(manifest.get("totalChunks") or 0)
+        if manifest.get("status") == "complete":
+            return total
+        return sum(1 for index in range(total) if self.chunk_paths(manifest["id"], index)[1].exists())
+
+    def _render_chunk(self, manifest: dict, index: int, cancel: threading.Event) -> None:
+        job_id = manifest["id"]
+        text_path, wav_path = self.chunk_paths(job_id, index)
+        if not self.job_dir(job_id).exists():
+            # Deleted through another replica.
+            cancel.set()
+        if wav_path.exists() or cancel.is_set():
+            return
+        tmp_path = wav_path.with_name(f".{wav_path.stem}.{uuid.uuid4().hex}.tmp.wav")
+        try:
+            self.render_chunk(text_path.read_text(encoding="utf-8"), manifest, tmp_path)
+            tmp_path.replace(wav_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def assemble(self, job_id: str, manifest: dict) -> dict:
+        plan = read_json_file(self.job_dir(job_id) / "plan.json", {})
+        chunks = plan.get("chunks") or []
+        clips = [self.chunk_paths(job_id, index)[1] for index in range(len(chunks))]
+        output_name = f"{job_id}.wav"
+        tmp_path = self.output_dir / f".{job_id}.{uuid.uuid4().hex}.tmp.wav"
+        try:
+            splice_wav_clips(clips, tmp_path, manifest.get("prependSilenceMs", 0))
+            tmp_path.replace(self.output_dir / output_name)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+        offset_ms = float(manifest.get("prependSilenceMs", 0))
+        chapters = [
+            {"index": idx, "title": chapter.get("title") or f"Chapter {idx + 1}", "startMs": None, "paragraphs": []}
+            for idx, chapter in enumerate(plan.get("chapters") or [])
+        ]
+        for (chapter_idx, paragraph_idx, part_idx), clip in zip(chunks, clips):
+            chapter = chapters[chapter_idx]
+            if chapter["startMs"] is None:
+                chapter["startMs"] = round(offset_ms)
+            if part_idx == 0:
+                chapter["paragraphs"].append({"index": paragraph_idx, "startMs": round(offset_ms)})
+            with wave.open(str(clip), "rb") as src:
+                offset_ms += src.getnframes() * 1000.0 / src.getframerate()
+        index = {"jobId": job_id, "title": manifest.get("title", ""), "durationMs": round(offset_ms), "chapters": chapters}
+        write_json_file(self.job_dir(job_id) / "index.json", index)
+        return {"audioName": output_name, "durationMs": index["durationMs"]}
+
+    def _run(self, job_id: str, cancel: threading.Event) -> None:
+        try:
+            # Whichever replica holds the job lock renders it; the lock dies with its process, so a
+            # restarted replica can pick the job up again.
+            with shared_lock(f"job-{job_id}", self.locks_dir, blocking=False) as owned:
+                if owned:
+                    self._render(job_id, cancel)
+        finally:
+            with self.lock:
+                self.running.pop(job_id, None)
+
+    def _render(self, job_id: str, cancel: threading.Event) -> None:
+        try:
+            manifest = self.read_manifest(job_id)
+            if manifest is None:
+                return
+            total = int(manifest.get("totalChunks") or 0)
+            manifest = self.update_manifest(job_id, status="running", error="")
+            pending = [index for index in range(total) if not self.chunk_paths(job_id, index)[1].exists()]
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"open-tts-job-{job_id[:8]}") as pool:
+                futures = [pool.submit(self._render_chunk, manifest, index, cancel) for index in pending]
+                try:
+                    for future in futures:
+                        future.result()
+                        if cancel.is_set():
+                            break
+                except Exception:
+                    # Stop the remaining chunks; finished ones are kept for the next attempt.
+                    cancel.set()
+                    raise
+            if cancel.is_set():
+                return
+            result = self.assemble(job_id, manifest)
+            self.update_manifest(job_id, status="complete", **result)
+        except Exception as exc:
+            if self.read_manifest(job_id) is not None:
+                self.update_manifest(job_id, status="failed", error=str(exc))
+            print(f"[open-tts] warning: document job {job_id} failed: {exc}")
+
+    def start(self, job_id: str) -> None:
+        with self.lock:
+            if job_id in self.running:
+                return
+            cancel = threading.Event()
+            worker = threading.Thread(target=self._run, args=(job_id, cancel), name=f"open-tts-job-{job_id[:8]}", daemon=True)
+            self.running[job_id] = (worker, cancel)
+            worker.start()
+
+    def cancel(self, job_id: str) -> None:
+        with self.lock:
+            running = self.running.get(job_id)
+        if running is not None:
+            running[1].set()
+            running[0].join(timeout=self.cancel_timeout)
+
+    def resume_all(self) -> None:
+        # Chunk WAVs are written atomically, so an interrupted job restarts from the first missing chunk.
+        for manifest_path in sorted(self.root.glob("*/manifest.json")):
+            manifest = read_json_file(manifest_path, None)
+            if isinstance(manifest, dict) and manifest.get("status") in {"queued", "running"}:
+                print(f"[open-tts] resuming document job {manifest.get('id')}")
+                self.start(manifest["id"])
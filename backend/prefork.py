@@ -0,0 +1,155 @@
+"""Prefork serving: N forked processes accept on one socket and relay requests for each other's state."""
+
+import http.client
+import os
+import secrets
+import shutil
+import signal
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+from flask import Flask, Response, request
+
+FORWARDED_HEADER = "X-OpenTTS-Forwarded"
+
+_SUPERVISOR_PID = 0
+_PROCESS_INDEX = 0
+_PROCESS_COUNT = 1
+_FORWARD_TIMEOUT = 60.0
+
+
+def supervisor_pid() -> int:
+    """Pid of the prefork supervisor, or 0 when this server runs as a single process."""
+    return _SUPERVISOR_PID
+
+
+def process_scoped_id(nbytes: int) -> str:
+    """Random id that, under prefork, names the process holding the in-memory state behind it."""
+    token = secrets.token_urlsafe(nbytes)
+    return f"{_PROCESS_INDEX}.{token}" if _SUPERVISOR_PID else token
+
+
+def process_socket_path(index: int) -> Path:
+    return Path(tempfile.gettempdir()) / f"open-tts-{_SUPERVISOR_PID}" / f"{index}.sock"
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: Path, timeout: float = None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = str(path)
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def forward_to_owner_process(resource_id: str):
+    """Replay this request on the sibling that created `resource_id`; None if the id is ours or its owner is gone."""
+    if not _SUPERVISOR_PID or request.headers.get(FORWARDED_HEADER):
+        return None
+    index, _sep, _token = resource_id.partition(".")
+    if not index.isdigit() or int(index) == _PROCESS_INDEX or int(index) >= _PROCESS_COUNT:
+        return None
+    headers = {key: value for key, value in request.headers.items() if key.lower() not in {"host", "content-length"}}
+    headers[FORWARDED_HEADER] = "1"
+    path = request.full_path if request.query_string else request.path
+    connection = UnixHTTPConnection(process_socket_path(int(index)), timeout=_FORWARD_TIMEOUT)
+    try:
+        connection.request(request.method, path, body=request.get_data(), headers=headers)
+        upstream = connection.getresponse()
+    except (OSError, http.client.HTTPException):
+        connection.close()
+        return None
+
+    def relay():
+        # read1 hands over whatever has arrived, so event streams are not held back.
+        try:
+            while True:
+                block = upstream.read1(65536)
+                if not block:
+                    return
+                yield block
+        except (OSError, http.client.HTTPException):
+            return
+        finally:
+            connection.close()
+
+    skipped = {"connection", "content-length", "transfer-encoding", "date", "server"}
+    response_headers = [(key, value) for key, value in upstream.getheaders() if key.lower() not in skipped]
+    return Response(relay(), status=upstream.status, headers=response_headers)
+
+
+def serve_preforked(
+    flask_app: Flask,
+    port: int,
+    processes: int,
+    preload=None,
+    on_child_start=None,
+    forward_timeout: float = 60.0,
+    host: str = "0.0.0.0",
+) -> None:
+    """Bind once, run `preload`, then fork `processes` children that accept on the shared socket."""
+    # The parent only supervises: it restarts dead children, forwards SIGTERM/SIGINT and removes the sockets.
+    # forward_timeout bounds idle reads of forwarded responses, so it must exceed event stream keepalives.
+    global _SUPERVISOR_PID, _PROCESS_COUNT, _FORWARD_TIMEOUT
+    from werkzeug.serving import make_server
+
+    server = make_server(host, port, flask_app, threaded=True)
+    _SUPERVISOR_PID = os.getpid()
+    _PROCESS_COUNT = processes
+    _FORWARD_TIMEOUT = forward_timeout
+    socket_dir = process_socket_path(0).parent
+    socket_dir.mkdir(parents=True, exist_ok=True)
+    if preload is not None:
+        preload()
+    children = {}
+    stopping = False
+
+    def spawn(index: int) -> None:
+        global _PROCESS_INDEX
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            try:
+                _PROCESS_INDEX = index
+                # Runs before any thread starts here, so CPU affinity set by the hook is inherited.
+                if on_child_start is not None:
+                    on_child_start(index)
+                private = make_server(f"unix://{process_socket_path(index)}", 0, flask_app, threaded=True)
+                threading.Thread(target=private.serve_forever, name="open-tts-process-socket", daemon=True).start()
+                server.serve_forever()
+            finally:
+                os._exit(0)
+        children[pid] = index
+
+    def stop(_signum, _frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    for index in range(processes):
+        spawn(index)
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    print(f"[open-tts] serving on :{port} with {processes} preforked processes")
+    try:
+        while children:
+            try:
+                pid, _status = os.wait()
+            except ChildProcessError:
+                break
+            index = children.pop(pid, None)
+            if index is not None and not stopping:
+                print(f"[open-tts] warning: server process {pid} exited; restarting")
+                spawn(index)
+    finally:
+        server.server_close()
+        shutil.rmtree(socket_dir, ignore_errors=True)
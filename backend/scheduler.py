@@ -0,0 +1,162 @@
+"""Inference scheduling: synthesis slots that each own a disjoint set of this process's cores."""
+
+import os
+import threading
+from contextlib import contextmanager
+
+from prefork import supervisor_pid
+
+SCHEDULER_MODES = {"latency", "throughput"}
+
+
+def fork_safe_sessions() -> bool:
+    # Under prefork, sessions loaded before fork must not own ONNX Runtime thread pools.
+    return bool(supervisor_pid())
+
+
+def available_cpus() -> list:
+    try:
+        return sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        return list(range(os.cpu_count() or 1))
+
+
+def plan_inference_slots(
+    cpu_count: int,
+    mode: str,
+    single_threaded: bool = False,
+    slots: int = 0,
+    intra_threads: int = 0,
+    latency_threads: int = 4,
+) -> tuple:
+    """(slots, threads per slot): latency mode runs few wide slots, throughput one single-threaded slot per core."""
+    cpu_count = max(1, cpu_count)
+    if single_threaded:
+        threads = 1
+    elif intra_threads:
+        threads = min(intra_threads, cpu_count)
+    elif slots:
+        threads = max(1, cpu_count // slots)
+    elif mode == "throughput":
+        threads = 1
+    else:
+        threads = min(cpu_count, latency_threads)
+    return slots or max(1, cpu_count // threads), threads
+
+
+def process_cpu_share(cpus: list, index: int, processes: int) -> list:
+    """Contiguous slice of `cpus` for preforked process `index`."""
+    if processes >= len(cpus):
+        return [cpus[index % len(cpus)]]
+    size, extra = divmod(len(cpus), processes)
+    start = index * size + min(index, extra)
+    return cpus[start : start + size + (1 if index < extra else 0)]
+
+
+class InferenceScheduler:
+    """At most `slots` renders run at once, so concurrent requests queue instead of oversubscribing the CPU."""
+
+    def __init__(
+        self,
+        mode: str,
+        slots: int = 0,
+        intra_threads: int = 0,
+        inter_threads: int = 1,
+        latency_threads: int = 4,
+        affinity: bool = False,
+    ):
+        self.mode = mode
+        self.requested_slots = slots
+        self.intra_threads = intra_threads
+        self.inter_threads = inter_threads
+        self.latency_threads = latency_threads
+        self.affinity = affinity
+        self.cond = threading.Condition()
+        self.configure(available_cpus())
+
+    def configure(self, cpus: list) -> None:
+        slots, threads = plan_inference_slots(
+            len(cpus),
+            self.mode,
+            single_threaded=fork_safe_sessions(),
+            slots=self.requested_slots,
+            intra_threads=self.intra_threads,
+            latency_threads=self.latency_threads,
+        )
+        with self.cond:
+            self.cpus = list(cpus)
+            self.enabled = self.mode in SCHEDULER_MODES
+            self.slots = slots
+            self.threads = threads
+            # Explicit slot counts larger than the core count wrap around and share cores.
+            self.free = [
+                [self.cpus[(index * threads + offset) % len(self.cpus)] for offset in range(threads)]
+                for index in reversed(range(slots))
+            ]
+            self.active = 0
+            self.waiting = 0
+            self.cond.notify_all()
+
+    def session_threads(self):
+        """(intra, inter) op threads for new ONNX sessions, or None to keep library defaults."""
+        if fork_safe_sessions():
+            # Pool threads do not survive fork(); parallelism comes from the processes instead.
+            return 1, 1
+        if not self.enabled:
+            return None
+        return self.threads, self.inter_threads
+
+    def pinnable(self, in_process: bool) -> bool:
+        # sched_setaffinity only affects the calling thread. A subprocess inherits the mask, and a session with
+        # one intra-op and one inter-op thread runs every operator on the caller; wider sessions share pool threads.
+        return not in_process or self.session_threads() == (1, 1)
+
+    @contextmanager
+    def slot(self, pin: bool = True):
+        if not self.enabled:
+            yield None
+            return
+        with self.cond:
+            self.waiting += 1
+            try:
+                self.cond.wait_for(lambda: self.free)
+            finally:
+                self.waiting -= 1
+            cores = self.free.pop()
+            self.active += 1
+        previous = None
+        if self.affinity and pin:
+            try:
+                # pid 0 is the calling thread on Linux, so other request threads keep their masks.
+                previous = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, cores)
+            except (AttributeError, OSError) as exc:
+                print(f"[open-tts] warning: could not pin synthesis to cpus {cores}: {exc}")
+                previous = None
+        try:
+            yield cores
+        finally:
+            if previous is not None:
+                try:
+                    os.sched_setaffinity(0, previous)
+                except OSError:
+                    pass
+            with self.cond:
+                self.free.append(cores)
+                self.active -= 1
+                self.cond.notify()
+
+    def describe(self) -> dict:
+        with self.cond:
+            return {
+                "mode": self.mode if self.enabled else "off",
+                "cpus": list(self.cpus),
+                "slots": self.slots,
+                "intraOpThreads": self.threads,
+                "interOpThreads": 1 if fork_safe_sessions() else self.inter_threads,
+                "affinity": self.affinity,
+                # In-process sessions are only pinned when they run on the caller alone; see pinnable().
+                "affinityInProcess": self.affinity and self.session_threads() == (1, 1),
+                "active": self.active,
+                "waiting": self.waiting,
+            }
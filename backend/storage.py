@@ -0,0 +1,95 @@
+"""JSON state files and locks shared by every thread and replica that mounts the data volumes."""
+
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    # Non-POSIX dev hosts: locks only coordinate threads of this process.
+    fcntl = None
+
+LOCK_TIMEOUT_SECONDS = int(os.getenv("OPEN_TTS_LOCK_TIMEOUT_SECONDS", "300"))
+LOCK_NAME_PATTERN = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def read_json_file(path: Path, default_value):
+    if not path.exists():
+        return default_value
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return default_value
+
+
+def unique_tmp_path(path: Path) -> Path:
+    # Unique per process and call, so replicas sharing a volume never write the same temp file.
+    return path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+
+
+def write_json_file(path: Path, data) -> None:
+    tmp_path = unique_tmp_path(path)
+    try:
+        tmp_path.write_text(json.dumps(data, ensure_ascii=True, indent=2), encoding="utf-8")
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+_THREAD_LOCKS = {}
+_THREAD_LOCKS_GUARD = threading.Lock()
+
+
+@contextmanager
+def shared_lock(name: str, directory: Path, timeout: float = None, blocking: bool = True):
+    """Yield True once held; with blocking=False yield False instead of waiting, else raise TimeoutError."""
+    # flock() is released by the kernel when a process dies, so a crashed replica never leaves a stale lock.
+    name = LOCK_NAME_PATTERN.sub("_", name)
+    timeout = LOCK_TIMEOUT_SECONDS if timeout is None else timeout
+    if fcntl is None:
+        with _THREAD_LOCKS_GUARD:
+            thread_lock = _THREAD_LOCKS.setdefault(f"{directory}/{name}", threading.Lock())
+        acquired = thread_lock.acquire(blocking, timeout if blocking else -1)
+        if blocking and not acquired:
+            raise TimeoutError(f"timed out waiting for lock {name}")
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                thread_lock.release()
+        return
+
+    path = directory / f"{name}.lock"
+    deadline = time.monotonic() + timeout
+    while True:
+        handle = open(path, "a+")
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            handle.close()
+            if not blocking:
+                yield False
+                return
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"timed out waiting for lock {name}")
+            time.sleep(0.05)
+            continue
+        try:
+            current = os.fstat(handle.fileno()).st_ino == os.stat(path).st_ino
+        except FileNotFoundError:
+            current = False
+        if current:
+            break
+        # The previous holder removed the file after we opened it; lock the fresh one instead.
+        handle.close()
+    try:
+        yield True
+    finally:
+        path.unlink(missing_ok=True)
+        handle.close()
@@ -0,0 +1,108 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import wave
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_DIR))
+
+DATA_DIR = Path(tempfile.mkdtemp(prefix="open-tts-tests-"))
+os.environ.update(
+    {
+        "PIPER_VOICES_DIR": str(DATA_DIR / "voices"),
+        "PIPER_AUDIO_DIR": str(DATA_DIR / "audio"),
+        "OPEN_TTS_STATE_DIR": str(DATA_DIR / "state"),
+        "OPEN_TTS_TOKEN_SECRET": "test-secret",
+        "OPEN_TTS_ADMIN_TOKEN": "test-admin",
+        "OPEN_TTS_WORKER_SECRET": "test-worker",
+        # Importing app as a WSGI module would otherwise start voice downloads, job resumption and the profiler.
+        "OPEN_TTS_STARTUP_PROBE": "1",
+    }
+)
+
+VOICE = "en_US-test-medium"
+CLIENT_ID = "test-client-0001"
+CLIENT = {"X-OpenTTS-Client": CLIENT_ID}
+ADMIN = {"X-OpenTTS-Admin-Token": "test-admin"}
+WORKER = {"X-OpenTTS-Worker-Secret": "test-worker"}
+SAMPLE_RATE = 16000
+MS_PER_CHAR = 10
+
+
+def write_wav(path: Path, duration_ms: float, rate: int = SAMPLE_RATE) -> None:
+    frames = int(rate * duration_ms / 1000)
+    with wave.open(str(path), "wb") as dst:
+        dst.setnchannels(1)
+        dst.setsampwidth(2)
+        dst.setframerate(rate)
+        dst.writeframes(b"\x01\x00" * frames)
+
+
+def wav_ms(path: Path) -> float:
+    with wave.open(str(path), "rb") as src:
+        return src.getnframes() * 1000.0 / src.getframerate()
+
+
+class FakeEngine:
+    """Stands in for synthesize_with_piper: MS_PER_CHAR of audio per character, calls recorded."""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+        self.gate = None
+
+    def __call__(self, text, voice, speed, output_path):
+        with self.lock:
+            self.calls.append(text)
+        if self.gate is not None:
+            self.gate.wait(10)
+        write_wav(Path(output_path), len(text) * MS_PER_CHAR)
+        return None
+
+    @property
+    def texts(self):
+        with self.lock:
+            return list(self.calls)
+
+
+def install_voice(app_module, voice: str = VOICE) -> None:
+    (app_module.VOICES_DIR / f"{voice}.onnx").write_bytes(b"onnx")
+    (app_module.VOICES_DIR / f"{voice}.onnx.json").write_text(
+        json.dumps({"audio": {"sample_rate": SAMPLE_RATE}}), encoding="utf-8"
+    )
+
+
+@pytest.fixture
+def app_module(monkeypatch):
+    import app
+
+    shutil.rmtree(DATA_DIR, ignore_errors=True)
+    app.ensure_dirs()
+    install_voice(app)
+    monkeypatch.setattr(app, "DEFAULT_VOICE", VOICE)
+    for state in (app._VOICE_RTF, app._WORKER_FAILED_UNTIL, app._METADATA_RESPONSES, app._PHONETIC_MATCHERS):
+        state.clear()
+    app._WORKER_CACHE.update(loadedAt=0.0, workers=[])
+    return app
+
+
+@pytest.fixture
+def engine(app_module, monkeypatch):
+    fake = FakeEngine()
+    monkeypatch.setattr(app_module, "synthesize_with_piper", fake)
+    # Sentence reuse needs a resident model; the fake engine is "resident".
+    monkeypatch.setattr(app_module, "resident_piper_enabled", lambda: True)
+    yield fake
+    if fake.gate is not None:
+        fake.gate.set()
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
@@ -0,0 +1,54 @@
+"""Minimal app served by serve_preforked in test_prefork.py."""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from flask import Flask, Response, jsonify, request  # noqa: E402
+
+import prefork  # noqa: E402
+
+app = Flask(__name__)
+ITEMS = {}
+
+
+@app.post("/items")
+def create_item():
+    item_id = prefork.process_scoped_id(8)
+    ITEMS[item_id] = request.get_json()
+    return jsonify({"id": item_id, "pid": os.getpid()}), 201
+
+
+@app.get("/items/<item_id>")
+def get_item(item_id):
+    if item_id not in ITEMS:
+        return prefork.forward_to_owner_process(item_id) or (jsonify({"error": "not found"}), 404)
+    forwarded = bool(request.headers.get(prefork.FORWARDED_HEADER))
+    return jsonify({"value": ITEMS[item_id], "pid": os.getpid(), "forwarded": forwarded})
+
+
+@app.get("/items/<item_id>/events")
+def item_events(item_id):
+    if item_id not in ITEMS:
+        return prefork.forward_to_owner_process(item_id) or (jsonify({"error": "not found"}), 404)
+    gate = Path(request.args["gate"])
+
+    def generate():
+        yield "data: first\n\n"
+        while not gate.exists():
+            time.sleep(0.02)
+        yield "data: second\n\n"
+
+    return Response(generate(), mimetype="text/event-stream")
+
+
+@app.get("/pid")
+def pid():
+    return jsonify({"pid": os.getpid()})
+
+
+if __name__ == "__main__":
+    prefork.serve_preforked(app, 0, 2, host="127.0.0.1")
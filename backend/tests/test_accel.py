@@ -0,0 +1,39 @@
+import time
+
+from conftest import write_wav
+
+ACCEL = {"X-OpenTTS-Accel": "1"}
+
+
+def clip_url(app_module, route, name="clip one.wav"):
+    write_wav(app_module.AUDIO_DIR / name, 100)
+    token = app_module.audio_access_token(name, int(time.time()) + 3600)
+    return f"/api/{route}/{name}?token={token}"
+
+
+def test_nginx_gets_the_transfer_when_it_asks_for_it(app_module, client, monkeypatch):
+    monkeypatch.setattr(app_module, "AUDIO_ACCEL_PREFIX", "/_audio")
+    response = client.get(clip_url(app_module, "audio"), headers=ACCEL)
+    assert response.headers["X-Accel-Redirect"] == "/_audio/clip%20one.wav"
+    assert response.get_data() == b"" and response.mimetype == "audio/wav"
+
+    download = client.get(clip_url(app_module, "download"), headers=ACCEL)
+    assert download.headers["X-Accel-Redirect"] == "/_audio/clip%20one.wav"
+    assert download.headers["Content-Disposition"].startswith("attachment")
+
+
+def test_flask_serves_the_file_without_the_proxy_header_or_prefix(app_module, client, monkeypatch):
+    url = clip_url(app_module, "audio")
+    assert "X-Accel-Redirect" not in client.get(url, headers=ACCEL).headers
+
+    monkeypatch.setattr(app_module, "AUDIO_ACCEL_PREFIX", "/_audio")
+    response = client.get(url)
+    assert "X-Accel-Redirect" not in response.headers
+    assert response.get_data() == (app_module.AUDIO_DIR / "clip one.wav").read_bytes()
+
+
+def test_tokens_are_checked_before_handing_off(app_module, client, monkeypatch):
+    monkeypatch.setattr(app_module, "AUDIO_ACCEL_PREFIX", "/_audio")
+    url = clip_url(app_module, "audio").rsplit(".", 1)[0] + ".0000"
+    response = client.get(url, headers=ACCEL)
+    assert response.status_code == 403 and "X-Accel-Redirect" not in response.headers
@@ -0,0 +1,95 @@
+import threading
+import time
+
+from conftest import CLIENT, VOICE
+
+
+def speak(client, text, **options):
+    response = client.post("/api/speak", json={"text": text, **options}, headers=CLIENT)
+    assert response.status_code == 201, response.get_json()
+    return response.get_json()["audioUrl"].split("?")[0].rsplit("/", 1)[1]
+
+
+def wait_for_prefetch(client, prefetch_id):
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        payload = client.get(f"/api/prefetch/{prefetch_id}").get_json()
+        if all(item["status"] not in {"queued", "rendering"} for item in payload["items"]):
+            return payload
+        time.sleep(0.02)
+    raise AssertionError("prefetch did not finish")
+
+
+def test_identical_requests_share_one_clip(client, engine):
+    first = speak(client, "Hello there.")
+    assert speak(client, "Hello there.") == first
+    assert speak(client, "Hello there.", speed=1.5) != first
+    assert speak(client, "Hello there.", prependSilenceMs=200) != first
+    assert engine.texts == ["Hello there."] * 3
+
+
+def test_cache_key_covers_every_render_input(app_module):
+    key = app_module.synthesis_cache_key
+    assert key("text", VOICE, 1.0, 0) == key("text", VOICE, 1.0004, 0)
+    variants = [("text ", VOICE, 1.0, 0), ("text", "other", 1.0, 0), ("text", VOICE, 1.1, 0), ("text", VOICE, 1.0, 10)]
+    assert len({key("text", VOICE, 1.0, 0), *(key(*args) for args in variants)}) == 5
+
+
+def test_concurrent_callers_render_a_key_once(app_module):
+    renders = []
+    started = threading.Event()
+
+    def render(path):
+        renders.append(path)
+        started.set()
+        time.sleep(0.2)
+        path.write_bytes(b"RIFF")
+
+    results = []
+
+    def call():
+        results.append(app_module.render_cached("k" * 32, render))
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert len(renders) == 1
+    assert sorted(results) == [False, True, True, True]
+    assert (app_module.AUDIO_DIR / f"{'k' * 32}.wav").read_bytes() == b"RIFF"
+
+
+def test_prefetched_clip_is_served_without_rendering_again(app_module, client, engine):
+    response = client.post("/api/prefetch", json={"segments": [{"id": "next", "text": "Coming up next."}]}, headers=CLIENT)
+    assert response.status_code == 202
+    payload = wait_for_prefetch(client, response.get_json()["prefetchId"])
+    assert payload["items"][0]["status"] == "ready"
+    assert list(app_module.PREFETCH_MARKER_DIR.iterdir())
+
+    speak(client, "Coming up next.")
+    assert engine.texts == ["Coming up next."]
+    # Asking for the clip claims it, so canceling the prefetch no longer removes it.
+    assert not list(app_module.PREFETCH_MARKER_DIR.iterdir())
+
+
+def test_canceled_prefetch_drops_only_unclaimed_clips(app_module, client, engine):
+    segments = [{"id": "a", "text": "Wanted later."}, {"id": "b", "text": "Never asked for."}]
+    prefetch_id = client.post("/api/prefetch", json={"segments": segments}, headers=CLIENT).get_json()["prefetchId"]
+    wait_for_prefetch(client, prefetch_id)
+    kept = speak(client, "Wanted later.")
+
+    assert client.delete(f"/api/prefetch/{prefetch_id}").status_code == 200
+    assert [path.name for path in app_module.AUDIO_DIR.glob("*.wav")] == [kept]
+
+
+def test_new_prefetch_replaces_the_clients_previous_one(client, engine):
+    engine.gate = threading.Event()
+    first = client.post("/api/prefetch", json={"segments": [{"text": "One."}, {"text": "Two."}]}, headers=CLIENT)
+    second = client.post("/api/prefetch", json={"segments": [{"text": "Three."}]}, headers=CLIENT)
+    engine.gate.set()
+    assert client.get(f"/api/prefetch/{first.get_json()['prefetchId']}").get_json()["canceled"] is True
+    wait_for_prefetch(client, second.get_json()["prefetchId"])
+    assert "Two." not in engine.texts
@@ -0,0 +1,32 @@
+from conftest import VOICE
+
+
+def test_unmeasured_voices_get_the_default_advice(app_module):
+    advice = app_module.chunk_advice(VOICE, 1.0)
+    assert advice["samples"] == 0
+    assert (advice["firstChunkChars"], advice["chunkChars"], advice["growth"]) == (60, 300, 4.0)
+
+
+def test_slow_voices_and_busy_nodes_get_smaller_chunks(app_module):
+    # 1 s of audio for 10 characters took 2 s to render: RTF 2.0, 100 ms of audio per character.
+    app_module.record_voice_rtf(VOICE, "0123456789", 1.0, 2000, 1000)
+    slow = app_module.chunk_advice(VOICE, 1.0)
+    assert (slow["realTimeFactor"], slow["msPerChar"], slow["samples"]) == (2.0, 100.0, 1)
+    assert (slow["firstChunkChars"], slow["chunkChars"], slow["growth"]) == (40, 40, 1.25)
+
+    fast = app_module.chunk_advice("unmeasured", 1.0)
+    busy = app_module.chunk_advice("unmeasured", 2.0)
+    assert busy["chunkChars"] < fast["chunkChars"] and busy["growth"] < fast["growth"]
+
+
+def test_measurements_are_normalized_to_speed_one(app_module):
+    app_module.record_voice_rtf(VOICE, "0123456789", 2.0, 100, 500)
+    app_module.record_voice_rtf("other", "0123456789", 1.0, 100, 1000)
+    assert app_module.chunk_advice(VOICE, 1.0)["msPerChar"] == app_module.chunk_advice("other", 1.0)["msPerChar"]
+
+
+def test_chunking_endpoint_reports_the_queue_and_each_voice(client):
+    payload = client.get(f"/api/chunking?voice={VOICE}&voice=other").get_json()
+    assert set(payload["voices"]) == {VOICE, "other"}
+    assert payload["queue"]["slowdown"] == 1.0
+    assert payload["firstAudioTargetMs"] > 0
@@ -0,0 +1,92 @@
+import io
+import struct
+import time
+import wave
+import zipfile
+
+import pytest
+
+import export
+from conftest import CLIENT, SAMPLE_RATE, write_wav
+
+
+def add_clip(app_module, name, duration_ms, rate=SAMPLE_RATE, expires_in=3600):
+    write_wav(app_module.AUDIO_DIR / name, duration_ms, rate)
+    token = app_module.audio_access_token(name, int(time.time()) + expires_in)
+    return f"/api/audio/{name}?token={token}"
+
+
+def riff_chunks(data):
+    chunks = {}
+    offset = 12
+    while offset < len(data):
+        chunk_id, size = struct.unpack("<4sI", data[offset : offset + 8])
+        chunks[chunk_id] = data[offset + 8 : offset + 8 + size]
+        offset += 8 + size + size % 2
+    return chunks
+
+
+def test_concat_export_streams_one_wav_with_gaps_and_cue_labels(app_module, client):
+    history = [
+        {"id": "one", "text": "First entry", "audioUrl": add_clip(app_module, "a.wav", 500)},
+        {"id": "two", "text": "Second entry", "audioUrl": add_clip(app_module, "b.wav", 250)},
+    ]
+    client.put("/api/history", json=history, headers=CLIENT)
+    response = client.post("/api/export", json={"ids": ["one", "missing", "two"], "gapMs": 100}, headers=CLIENT)
+
+    assert response.status_code == 200
+    assert response.headers["X-OpenTTS-Export-Missing"] == "1"
+    data = response.get_data()
+    assert response.content_length == len(data)
+    with wave.open(io.BytesIO(data), "rb") as src:
+        assert src.getnframes() == SAMPLE_RATE * 850 // 1000
+    chunks = riff_chunks(data)
+    cue_frames = [struct.unpack("<II4sIII", chunks[b"cue "][4 + 24 * i : 28 + 24 * i])[1] for i in range(2)]
+    assert cue_frames == [0, SAMPLE_RATE * 600 // 1000]
+    assert b"First entry\x00" in chunks[b"LIST"] and b"Second entry\x00" in chunks[b"LIST"]
+
+
+def test_zip_export_contains_each_clip_unchanged(app_module, client):
+    token = add_clip(app_module, "b.wav", 200).split("token=")[1]
+    audio = [add_clip(app_module, "a.wav", 100), {"name": "b.wav", "title": "Hello, world!", "token": token}]
+    response = client.post("/api/export", json={"audio": audio, "mode": "zip"})
+
+    assert response.status_code == 200
+    archive = zipfile.ZipFile(io.BytesIO(response.get_data()))
+    assert archive.namelist() == ["001-clip-1.wav", "002-hello-world.wav"]
+    assert archive.read("002-hello-world.wav") == (app_module.AUDIO_DIR / "b.wav").read_bytes()
+
+
+def test_export_requires_a_valid_token_per_clip(app_module, client):
+    forged = add_clip(app_module, "a.wav", 100).rsplit(".", 1)[0] + ".0000"
+    expired = add_clip(app_module, "b.wav", 100, expires_in=-10)
+    response = client.post("/api/export", json={"audio": [forged, expired]})
+    assert response.status_code == 404
+    assert response.get_json()["missing"] == [forged, expired]
+
+
+def test_owned_history_exports_past_the_url_lifetime(app_module, client):
+    history = [
+        {"id": "old", "text": "Old", "audioUrl": add_clip(app_module, "a.wav", 100, expires_in=-10)},
+        {"id": "forged", "text": "Forged", "audioUrl": "/api/audio/b.wav?token=1.abc"},
+    ]
+    write_wav(app_module.AUDIO_DIR / "b.wav", 100)
+    client.put("/api/history", json=history, headers=CLIENT)
+    response = client.post("/api/export", json={"ids": ["old", "forged"]}, headers=CLIENT)
+    assert response.status_code == 200
+    assert response.headers["X-OpenTTS-Export-Missing"] == "1"
+
+
+def test_mixed_formats_need_ffmpeg(app_module, client, monkeypatch):
+    monkeypatch.setattr(export.shutil, "which", lambda _name: None)
+    audio = [add_clip(app_module, "a.wav", 100), add_clip(app_module, "b.wav", 100, rate=22050)]
+    response = client.post("/api/export", json={"audio": audio})
+    assert response.status_code == 501
+    assert not list(app_module.AUDIO_DIR.glob(".export.*"))
+
+
+def test_splice_rejects_mismatched_clips(tmp_path):
+    write_wav(tmp_path / "a.wav", 100)
+    write_wav(tmp_path / "b.wav", 100, rate=22050)
+    with pytest.raises(export.ExportError):
+        export.splice_wav_clips([tmp_path / "a.wav", tmp_path / "b.wav"], tmp_path / "out.wav")
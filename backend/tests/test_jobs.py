@@ -0,0 +1,102 @@
+import io
+import time
+
+import jobs
+from conftest import CLIENT, MS_PER_CHAR, wav_ms
+from storage import shared_lock
+
+DOCUMENT = "# Intro\n\nFirst paragraph here.\n\n## Part two\n\nSecond paragraph.\n\nThird paragraph.\n"
+
+
+def wait_for_job(client, job_id, until=("complete", "failed")):
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        payload = client.get(f"/api/jobs/{job_id}", headers=CLIENT).get_json()
+        if payload["status"] in until:
+            return payload
+        time.sleep(0.02)
+    raise AssertionError("job did not finish")
+
+
+def create_job(client, text=DOCUMENT, fmt="markdown"):
+    response = client.post("/api/jobs", json={"text": text, "format": fmt, "title": "Doc"}, headers=CLIENT)
+    assert response.status_code == 202, response.get_json()
+    return response.get_json()["jobId"]
+
+
+def test_documents_parse_into_headings_and_paragraphs():
+    markdown = "# Intro\n\nSome *bold* [link](http://x).\n\n- one\n- two\n"
+    assert list(jobs.iter_document_blocks(io.StringIO(markdown), "markdown")) == [
+        ("heading", "Intro"),
+        ("paragraph", "Some bold link."),
+        ("paragraph", "one two"),
+    ]
+    html = "<head><title>T</title></head><script>x()</script><h1>Head</h1><p>Para <b>one</b>.</p>"
+    assert list(jobs.iter_document_blocks(io.StringIO(html), "html")) == [("heading", "Head"), ("paragraph", "Para one.")]
+    text = "CHAPTER ONE\n\nFirst line\ncontinues.\n"
+    assert list(jobs.iter_document_blocks(io.StringIO(text), "text")) == [
+        ("heading", "CHAPTER ONE"),
+        ("paragraph", "First line continues."),
+    ]
+    assert jobs.split_paragraph_parts(["aaaa. ", "bbbb. ", "cccc."], 12) == ["aaaa. bbbb.", "cccc."]
+    assert jobs.document_format_for("notes.md", "", None) == "markdown"
+    assert jobs.document_format_for("notes.md", "", "text") == "text"
+
+
+def test_job_renders_to_one_wav_with_a_chapter_index(app_module, client, engine):
+    job_id = create_job(client)
+    payload = wait_for_job(client, job_id)
+    assert payload["status"] == "complete" and payload["chunksDone"] == payload["chunksTotal"] == 5
+
+    index = client.get(payload["indexUrl"], headers=CLIENT).get_json()
+    assert [chapter["title"] for chapter in index["chapters"]] == ["Intro", "Part two"]
+    second = index["chapters"][1]
+    assert second["startMs"] == (len("Intro") + len("First paragraph here.")) * MS_PER_CHAR
+    assert [paragraph["index"] for paragraph in second["paragraphs"]] == [0, 1, 2]
+    assert wav_ms(app_module.AUDIO_DIR / payload["audioUrl"].split("?")[0].rsplit("/", 1)[1]) == index["durationMs"]
+
+
+def test_failed_job_resumes_from_the_first_missing_chunk(app_module, client, engine, monkeypatch):
+    def fail_on_part_two(text, voice, speed, output_path):
+        if text == "Part two":
+            raise RuntimeError("engine crashed")
+        engine(text, voice, speed, output_path)
+
+    monkeypatch.setattr(app_module, "synthesize_with_piper", fail_on_part_two)
+    monkeypatch.setattr(app_module.DOCUMENT_JOBS, "workers", 1)
+    job_id = create_job(client)
+    assert wait_for_job(client, job_id)["error"] == "engine crashed"
+    rendered = engine.texts
+    assert rendered == ["Intro", "First paragraph here."]
+
+    monkeypatch.setattr(app_module, "synthesize_with_piper", engine)
+    assert client.post(f"/api/jobs/{job_id}/resume", headers=CLIENT).status_code == 202
+    assert wait_for_job(client, job_id, until=("complete",))["status"] == "complete"
+    assert engine.texts[len(rendered) :] == ["Part two", "Second paragraph.", "Third paragraph."]
+
+
+def test_job_locked_by_another_replica_is_left_to_it(app_module, client, engine):
+    job_id = "a" * 32
+    app_module.DOCUMENT_JOBS.plan(job_id, io.StringIO("Hello."), "text", "Doc")
+    manifest = {"id": job_id, "clientId": "", "voice": app_module.DEFAULT_VOICE, "status": "queued", "totalChunks": 1}
+    app_module.DOCUMENT_JOBS.write_manifest(manifest)
+
+    with shared_lock(f"job-{job_id}", app_module.LOCKS_DIR):
+        app_module.DOCUMENT_JOBS.start(job_id)
+        deadline = time.monotonic() + 5
+        while job_id in app_module.DOCUMENT_JOBS.running and time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert app_module.DOCUMENT_JOBS.read_manifest(job_id)["status"] == "queued"
+    assert engine.texts == []
+
+
+def test_jobs_are_private_to_their_client_and_deletable(app_module, client, engine):
+    job_id = create_job(client)
+    wait_for_job(client, job_id)
+    other = {"X-OpenTTS-Client": "other-client-0002"}
+    assert client.get(f"/api/jobs/{job_id}", headers=other).status_code == 404
+    assert client.delete(f"/api/jobs/{job_id}", headers=other).status_code == 404
+
+    assert client.delete(f"/api/jobs/{job_id}", headers=CLIENT).status_code == 200
+    assert not app_module.DOCUMENT_JOBS.job_dir(job_id).exists()
+    assert not list(app_module.AUDIO_DIR.glob(f"{job_id}.wav"))
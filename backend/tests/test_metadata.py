@@ -0,0 +1,29 @@
+from conftest import CLIENT, install_voice
+
+
+def test_unchanged_metadata_revalidates_with_304(client):
+    first = client.get("/api/voices")
+    assert first.status_code == 200 and first.headers["Cache-Control"] == "no-cache"
+    etag = first.headers["ETag"]
+    again = client.get("/api/voices", headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.get_data() == b""
+    assert client.get("/api/openapi.json", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_installing_a_voice_changes_the_etag(app_module, client):
+    etag = client.get("/api/voices").headers["ETag"]
+    install_voice(app_module, "en_US-new-medium")
+    response = client.get("/api/voices", headers={"If-None-Match": etag})
+    assert response.status_code == 200 and response.headers["ETag"] != etag
+    assert "en_US-new-medium" in [voice["id"] for voice in response.get_json()["voices"]]
+
+
+def test_per_client_metadata_is_private(client):
+    response = client.get("/api/settings", headers=CLIENT)
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert "X-OpenTTS-Client" in response.headers["Vary"]
+
+    etag = response.headers["ETag"]
+    client.put("/api/settings", json={"prependSilenceMs": 300}, headers=CLIENT)
+    changed = client.get("/api/settings", headers={**CLIENT, "If-None-Match": etag})
+    assert changed.status_code == 200 and changed.get_json()["prependSilenceMs"] == 300
@@ -0,0 +1,40 @@
+import re
+
+from conftest import ADMIN, CLIENT
+
+
+def put_entries(client, entries, headers=CLIENT):
+    return client.put("/api/phonetic", json={"entries": entries}, headers=headers)
+
+
+def test_trie_regex_matches_exactly_the_words_and_prefers_the_longest(app_module):
+    words = ["nginx", "ngrok", "sql", "sqlite", "a.b"]
+    pattern = re.compile(app_module.trie_regex(words))
+    assert all(pattern.fullmatch(word) for word in words)
+    assert not pattern.fullmatch("sqli") and not pattern.fullmatch("axb")
+    assert pattern.match("sqlite3").group(0) == "sqlite"
+
+
+def test_replacements_are_whole_word_case_insensitive_and_single_pass(app_module, client):
+    entries = [{"word": "SQL", "replacement": "sequel"}, {"word": "sequel", "replacement": "nope"}]
+    assert put_entries(client, entries).status_code == 200
+    key = app_module.client_state_key(CLIENT["X-OpenTTS-Client"])
+    assert app_module.apply_phonetic_dictionary("sql, SQL and mysql_x", key) == "sequel, sequel and mysql_x"
+
+
+def test_client_entries_overlay_the_global_dictionary(app_module, client):
+    global_entries = [{"word": "gif", "replacement": "jif"}, {"word": "tts", "replacement": "T T S"}]
+    assert put_entries(client, global_entries, headers={}).status_code == 403
+    assert put_entries(client, global_entries, headers=ADMIN).status_code == 200
+    put_entries(client, [{"word": "GIF", "replacement": "ghif"}])
+    key = app_module.client_state_key(CLIENT["X-OpenTTS-Client"])
+    assert app_module.apply_phonetic_dictionary("gif tts", key) == "ghif T T S"
+    assert app_module.apply_phonetic_dictionary("gif tts") == "jif T T S"
+
+
+def test_matchers_are_rebuilt_when_the_file_changes(app_module, client, engine):
+    put_entries(client, [{"word": "foo", "replacement": "bar"}])
+    client.post("/api/speak", json={"text": "foo"}, headers=CLIENT)
+    put_entries(client, [{"word": "foo", "replacement": "baz"}])
+    client.post("/api/speak", json={"text": "foo"}, headers=CLIENT)
+    assert engine.texts == ["bar", "baz"]
@@ -0,0 +1,106 @@
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_DIR))
+
+import prefork  # noqa: E402
+
+
+def wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = predicate()
+        if result:
+            return result
+        time.sleep(0.05)
+    raise AssertionError("timed out")
+
+
+def call(path, method, url, body=None):
+    connection = prefork.UnixHTTPConnection(path, timeout=10)
+    try:
+        payload = json.dumps(body) if body is not None else None
+        connection.request(method, url, body=payload, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def try_call(path, method, url):
+    try:
+        return call(path, method, url)
+    except OSError:
+        return None
+
+
+@pytest.fixture
+def supervisor(tmp_path):
+    env = {**os.environ, "TMPDIR": str(tmp_path), "PYTHONUNBUFFERED": "1"}
+    process = subprocess.Popen([sys.executable, str(Path(__file__).with_name("prefork_app.py"))], env=env)
+    socket_dir = tmp_path / f"open-tts-{process.pid}"
+    sockets = [socket_dir / "0.sock", socket_dir / "1.sock"]
+    wait_for(lambda: all(try_call(path, "GET", "/pid") for path in sockets))
+    yield process, sockets
+    if process.poll() is None:
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=10)
+
+
+def test_ids_are_unscoped_without_prefork():
+    assert "." not in prefork.process_scoped_id(8)
+
+
+def test_sibling_forwards_to_the_owner(supervisor):
+    _process, (owner, sibling) = supervisor
+    status, created = call(owner, "POST", "/items", {"text": "hello"})
+    assert status == 201 and created["id"].startswith("0.")
+    status, item = call(sibling, "GET", f"/items/{created['id']}")
+    assert status == 200
+    assert item == {"value": {"text": "hello"}, "pid": created["pid"], "forwarded": True}
+    # An id naming the answering process itself is not forwarded anywhere.
+    assert call(sibling, "GET", "/items/1.missing")[0] == 404
+    assert call(sibling, "GET", "/items/7.missing")[0] == 404
+
+
+def test_forwarded_event_stream_is_relayed_as_it_arrives(supervisor, tmp_path):
+    _process, (owner, sibling) = supervisor
+    _status, created = call(owner, "POST", "/items", {})
+    gate = tmp_path / "gate"
+    connection = prefork.UnixHTTPConnection(sibling, timeout=10)
+    connection.request("GET", f"/items/{created['id']}/events?gate={gate}")
+    response = connection.getresponse()
+    assert response.status == 200
+    assert response.getheader("Content-Type").startswith("text/event-stream")
+    # The owner holds the second event back until the gate exists, so buffering would time out here.
+    assert response.readline() == b"data: first\n"
+    gate.touch()
+    assert b"data: second" in response.read()
+    connection.close()
+
+
+def test_crashed_child_is_restarted(supervisor):
+    _process, (_owner, sibling) = supervisor
+    _status, before = call(sibling, "GET", "/pid")
+    os.kill(before["pid"], signal.SIGKILL)
+
+    def restarted():
+        result = try_call(sibling, "GET", "/pid")
+        return result and result[1]["pid"] != before["pid"]
+
+    wait_for(restarted)
+
+
+def test_shutdown_removes_private_sockets(supervisor):
+    process, sockets = supervisor
+    process.send_signal(signal.SIGTERM)
+    assert process.wait(timeout=10) == 0
+    assert not sockets[0].parent.exists()
@@ -0,0 +1,66 @@
+import threading
+import time
+
+from conftest import ADMIN
+
+
+def busy_marked_thread(app_module, stop):
+    def work_in_progress():
+        with app_module.profiled_thread():
+            stop.wait(5)
+
+    thread = threading.Thread(target=work_in_progress, name="render-7")
+    thread.start()
+    return thread
+
+
+def test_idle_requests_skip_the_profiler_bookkeeping(app_module, client, monkeypatch):
+    calls = []
+    monkeypatch.setattr(app_module, "mark_profiled_thread", calls.append)
+    client.get("/api/health")
+    with app_module.profiled_thread():
+        pass
+    assert calls == []
+
+
+def test_sampler_collapses_only_marked_threads(app_module, monkeypatch):
+    sampler = app_module.StackSampler(100)
+    monkeypatch.setitem(app_module._PROFILE_STATE, "background", sampler)
+    stop = threading.Event()
+    thread = busy_marked_thread(app_module, stop)
+    try:
+        time.sleep(0.05)
+        sampler.sample()
+        everything = app_module.StackSampler(100, all_threads=True)
+        everything.sample()
+    finally:
+        stop.set()
+        thread.join(5)
+
+    text, samples = sampler.collapsed(reset=True)
+    assert samples == 1
+    assert text.startswith("render-N;") and "work_in_progress" in text and text.endswith(" 1\n")
+    assert len(everything.collapsed()[0].splitlines()) > 1
+    assert sampler.collapsed() == ("", 0)
+
+
+def test_on_demand_profile_runs_in_the_background_until_enough_requests(app_module, client, monkeypatch):
+    monkeypatch.setitem(app_module._PROFILE_STATE, "last", None)
+    started = client.post("/api/admin/profile?requests=2&seconds=30", headers=ADMIN)
+    assert started.status_code == 202
+    status_url = started.get_json()["statusUrl"]
+    assert client.post("/api/admin/profile", headers=ADMIN).status_code == 409
+
+    running = client.get(status_url, headers=ADMIN)
+    assert running.status_code == 202 and running.headers["Retry-After"] == "1"
+    deadline = time.monotonic() + 10
+    while (done := client.get(status_url, headers=ADMIN)).status_code == 202 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert done.status_code == 200 and done.mimetype == "text/plain"
+    assert float(done.headers["X-OpenTTS-Profile-Seconds"]) < 30
+    assert client.get("/api/admin/profile/unknown", headers=ADMIN).status_code == 404
+
+
+def test_profiles_are_admin_only_and_background_sampling_is_opt_in(client):
+    assert client.post("/api/admin/profile").status_code == 403
+    assert client.get("/api/admin/profile", headers=ADMIN).status_code == 404
@@ -0,0 +1,50 @@
+import os
+import time
+
+import pytest
+
+from conftest import CLIENT, write_wav
+
+
+@pytest.fixture
+def ring(app_module, monkeypatch, tmp_path):
+    monkeypatch.setattr(app_module, "EPHEMERAL_AUDIO_DIR", tmp_path)
+    monkeypatch.setattr(app_module, "EPHEMERAL_AUDIO_BYTES", 1024 * 1024)
+    return tmp_path
+
+
+def speak(client, text):
+    response = client.post("/api/speak", json={"text": text, "timings": True}, headers=CLIENT)
+    assert response.status_code == 201
+    url = response.get_json()["audioUrl"]
+    return url, url.split("?")[0].rsplit("/", 1)[1]
+
+
+def test_fresh_clips_stay_in_the_ring_until_pinned(app_module, client, engine, ring):
+    url, name = speak(client, "Ring clip.")
+    assert (ring / name).exists() and not (app_module.AUDIO_DIR / name).exists()
+    assert client.get(url).status_code == 200
+
+    path, token = url.split("?")
+    assert client.post(f"{path}/pin?{token}").status_code == 200
+    assert (app_module.AUDIO_DIR / name).exists() and not (ring / name).exists()
+    assert app_module.speech_timings_path(name).exists()
+    assert client.get(url).status_code == 200
+
+
+def test_oldest_ring_clips_are_evicted_first(app_module, ring, monkeypatch):
+    for age, name in enumerate(["old.wav", "mid.wav", "new.wav"]):
+        write_wav(ring / name, 100)
+        os.utime(ring / name, (time.time() - 100 + age, time.time() - 100 + age))
+    monkeypatch.setattr(app_module, "EPHEMERAL_AUDIO_BYTES", 2 * (ring / "new.wav").stat().st_size)
+    app_module.trim_ephemeral_audio()
+    assert sorted(path.name for path in ring.glob("*.wav")) == ["mid.wav", "new.wav"]
+    assert app_module.persist_audio_file("old.wav") is False
+
+
+def test_pinned_history_entries_keep_their_clip(app_module, client, engine, ring):
+    url, name = speak(client, "Keep me.")
+    _other_url, other = speak(client, "Drop me.")
+    client.put("/api/history", json=[{"id": "a", "text": "Keep me.", "audioUrl": url, "pinned": True}], headers=CLIENT)
+    assert (app_module.AUDIO_DIR / name).exists()
+    assert (ring / other).exists() and not (app_module.AUDIO_DIR / other).exists()
@@ -0,0 +1,70 @@
+import os
+import threading
+
+import scheduler
+
+
+def configured(mode, cpus, **options):
+    instance = scheduler.InferenceScheduler(mode, **options)
+    instance.configure(cpus)
+    return instance
+
+
+def test_slot_plans_per_mode():
+    assert scheduler.plan_inference_slots(8, "latency") == (2, 4)
+    assert scheduler.plan_inference_slots(2, "latency") == (1, 2)
+    assert scheduler.plan_inference_slots(8, "throughput") == (8, 1)
+    assert scheduler.plan_inference_slots(8, "latency", single_threaded=True) == (8, 1)
+    assert scheduler.plan_inference_slots(8, "latency", slots=3) == (3, 2)
+    assert scheduler.plan_inference_slots(8, "throughput", intra_threads=2) == (4, 2)
+
+
+def test_prefork_processes_get_disjoint_cpu_shares():
+    cpus = list(range(7))
+    shares = [scheduler.process_cpu_share(cpus, index, 3) for index in range(3)]
+    assert shares == [[0, 1, 2], [3, 4], [5, 6]]
+    assert scheduler.process_cpu_share([0, 1], 3, 4) == [1]
+
+
+def test_slots_own_disjoint_cores_and_queue_beyond_them():
+    instance = configured("latency", [0, 1, 2, 3], latency_threads=2)
+    entered = threading.Event()
+    with instance.slot() as first, instance.slot() as second:
+        assert sorted(first + second) == [0, 1, 2, 3]
+
+        def third():
+            with instance.slot():
+                entered.set()
+
+        waiter = threading.Thread(target=third)
+        waiter.start()
+        assert not entered.wait(0.1)
+        assert instance.describe()["waiting"] == 1
+    waiter.join(5)
+    assert entered.is_set()
+    assert instance.describe()["active"] == 0
+
+
+def test_off_mode_neither_queues_nor_sizes_sessions():
+    instance = configured("off", [0, 1])
+    with instance.slot() as cores:
+        assert cores is None
+    assert instance.session_threads() is None and instance.describe()["mode"] == "off"
+
+
+def test_only_single_threaded_or_subprocess_renders_are_pinned():
+    assert configured("throughput", [0, 1]).pinnable(in_process=True)
+    assert not configured("latency", [0, 1, 2, 3]).pinnable(in_process=True)
+    assert configured("latency", [0, 1, 2, 3]).pinnable(in_process=False)
+
+
+def test_affinity_pins_the_rendering_thread_and_restores_it():
+    cpus = scheduler.available_cpus()
+    before = os.sched_getaffinity(0)
+    instance = configured("throughput", cpus, affinity=True)
+    with instance.slot() as cores:
+        assert os.sched_getaffinity(0) == set(cores) and len(cores) == 1
+    assert os.sched_getaffinity(0) == before
+
+    with instance.slot(pin=False):
+        assert os.sched_getaffinity(0) == before
@@ -0,0 +1,45 @@
+import os
+import time
+
+from conftest import MS_PER_CHAR, VOICE, wav_ms
+
+TEXT = "The first sentence stays. The second one changes. The third stays too."
+
+
+def test_edit_rerenders_only_the_changed_sentence(app_module, engine, tmp_path):
+    app_module.render_speech(TEXT, VOICE, 1.0, 0, tmp_path / "a.wav")
+    edited = TEXT.replace("second one changes", "second one was edited")
+    timings = app_module.render_speech(edited, VOICE, 1.0, 0, tmp_path / "b.wav")
+
+    assert engine.texts[3:] == ["The second one was edited."]
+    sentences = app_module.split_sentences(edited)
+    assert wav_ms(tmp_path / "b.wav") == sum(len(sentence) for sentence in sentences) * MS_PER_CHAR
+    durations = [sentence["endMs"] - sentence["startMs"] for sentence in timings["sentences"]]
+    assert durations == [len(sentence) * MS_PER_CHAR for sentence in sentences]
+    assert timings["source"] == "sentences"
+
+
+def test_job_chunks_bypass_the_sentence_cache(app_module, engine, tmp_path):
+    app_module.render_speech(TEXT, VOICE, 1.0, 0, tmp_path / "chunk.wav", reuse_sentences=False)
+    assert engine.texts == [TEXT]
+    assert not list(app_module.SENTENCE_CACHE_DIR.glob("*.wav"))
+
+
+def test_sentence_cache_evicts_least_recently_used(app_module, engine, monkeypatch):
+    clips = app_module.render_sentence_clips(app_module.split_sentences(TEXT), VOICE, 1.0)
+    sizes = [clip.stat().st_size for clip in clips]
+    old = time.time() - 3600
+    for age, clip in enumerate(clips):
+        os.utime(clip, (old + age, old + age))
+    monkeypatch.setattr(app_module, "SPEAK_TIMEOUT_SECONDS", 60)
+    monkeypatch.setattr(app_module, "SENTENCE_CACHE_MAX_BYTES", sizes[1] + sizes[2])
+
+    app_module.trim_sentence_cache()
+    assert [clip.exists() for clip in clips] == [False, True, True]
+
+
+def test_sentence_cache_keeps_clips_a_render_may_still_splice(app_module, engine, monkeypatch):
+    clips = app_module.render_sentence_clips(app_module.split_sentences(TEXT), VOICE, 1.0)
+    monkeypatch.setattr(app_module, "SENTENCE_CACHE_MAX_BYTES", 0)
+    app_module.trim_sentence_cache()
+    assert all(clip.exists() for clip in clips)
@@ -0,0 +1,31 @@
+import os
+import subprocess
+import sys
+
+from conftest import BACKEND_DIR
+
+
+def test_import_has_no_side_effects(tmp_path):
+    env = {
+        **os.environ,
+        "PIPER_VOICES_DIR": str(tmp_path / "voices"),
+        "PIPER_AUDIO_DIR": str(tmp_path / "audio"),
+        "OPEN_TTS_STATE_DIR": str(tmp_path / "state"),
+    }
+    probe = "import sys, app; print(sorted(m for m in app.LAZY_ENGINE_MODULES if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", probe], cwd=BACKEND_DIR, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_startup_check_enforces_the_budget(app_module, capsys):
+    assert app_module.check_startup_budget(60000) is True
+    assert app_module.check_startup_budget(0) is False
+    assert "engine modules imported eagerly: none" in capsys.readouterr().out
+
+
+def test_missing_engines_are_reported_without_importing(app_module):
+    assert app_module.module_available("json") is True
+    assert app_module.module_available("open_tts_no_such_engine") is False
+    assert app_module.lazy_module("open_tts_no_such_engine") is None
@@ -0,0 +1,71 @@
+import multiprocessing
+import threading
+
+import pytest
+
+import storage
+
+FORK = multiprocessing.get_context("fork")
+
+
+def hold_lock(name, directory, held, release, output=None):
+    # Stands in for another replica sharing the volume.
+    with storage.shared_lock(name, directory):
+        held.set()
+        release.wait(10)
+        if output is not None:
+            output.write_bytes(b"RIFF")
+
+
+def locked_elsewhere(name, directory, output=None):
+    held, release = FORK.Event(), FORK.Event()
+    process = FORK.Process(target=hold_lock, args=(name, directory, held, release, output))
+    process.start()
+    assert held.wait(10)
+    return process, release
+
+
+def test_lock_is_exclusive_across_processes(tmp_path):
+    process, release = locked_elsewhere("job-1", tmp_path)
+    with storage.shared_lock("job-1", tmp_path, blocking=False) as owned:
+        assert owned is False
+    with pytest.raises(TimeoutError):
+        with storage.shared_lock("job-1", tmp_path, timeout=0.2):
+            pass
+    release.set()
+    process.join(10)
+    with storage.shared_lock("job-1", tmp_path, timeout=1) as owned:
+        assert owned is True
+    assert not list(tmp_path.glob("*.lock"))
+
+
+def test_lock_dies_with_its_process(tmp_path):
+    process, _release = locked_elsewhere("job-2", tmp_path)
+    process.kill()
+    process.join(10)
+    with storage.shared_lock("job-2", tmp_path, blocking=False) as owned:
+        assert owned is True
+
+
+def test_render_waits_for_another_replica_instead_of_rendering_twice(app_module):
+    key = "r" * 32
+    output = app_module.AUDIO_DIR / f"{key}.wav"
+    process, release = locked_elsewhere(key, app_module.AUDIO_LOCKS_DIR, output)
+    renders = []
+    threading.Timer(0.2, release.set).start()
+    assert app_module.render_cached(key, renders.append) is True
+    assert renders == []
+    process.join(10)
+
+
+def test_render_gives_up_when_another_replica_holds_the_lock_too_long(app_module, monkeypatch):
+    key = "t" * 32
+    process, release = locked_elsewhere(key, app_module.AUDIO_LOCKS_DIR)
+    monkeypatch.setattr(app_module, "SPEAK_TIMEOUT_SECONDS", 0.1)
+    try:
+        with pytest.raises(app_module.SynthesisError) as error:
+            app_module.render_cached(key, lambda path: path.write_bytes(b"RIFF"))
+        assert error.value.status == 504
+    finally:
+        release.set()
+        process.join(10)
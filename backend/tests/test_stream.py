@@ -0,0 +1,82 @@
+import json
+import threading
+
+from conftest import CLIENT
+
+
+def read_events(response, until="complete"):
+    events = []
+    buffer = ""
+    for chunk in response.response:
+        buffer += chunk.decode() if isinstance(chunk, bytes) else chunk
+        while "\n\n" in buffer:
+            block, buffer = buffer.split("\n\n", 1)
+            fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line and not line.startswith(":"))
+            if "event" in fields:
+                events.append((fields["event"], json.loads(fields.get("data") or "{}")))
+                if fields["event"] == until:
+                    response.close()
+                    return events
+    return events
+
+
+def open_session(client):
+    response = client.post("/api/stream/sessions", headers=CLIENT)
+    assert response.status_code == 201
+    return response.get_json()
+
+
+def test_segments_come_back_as_audio_events_in_order(client, engine):
+    session = open_session(client)
+    segments = [{"id": "a", "text": "First segment."}, {"id": "b", "text": "Second one.", "timings": True}]
+    response = client.post(f"/api/stream/sessions/{session['sessionId']}/segments", json={"segments": segments}, headers=CLIENT)
+    assert response.status_code == 202 and response.get_json()["queued"] == ["a", "b"]
+
+    events = read_events(client.get(session["eventsUrl"]))
+    assert [name for name, _data in events] == ["ready", "audio", "audio", "complete"]
+    first, second = events[1][1], events[2][1]
+    assert (first["id"], second["id"]) == ("a", "b")
+    assert "timings" not in first and second["timings"]["durationMs"] > 0
+    assert client.get(first["audioUrl"]).status_code == 200
+    assert engine.texts == ["First segment.", "Second one."]
+
+
+def test_reconnect_replays_events_after_last_event_id(client, engine):
+    session = open_session(client)
+    client.post(f"/api/stream/sessions/{session['sessionId']}/segments", json={"segments": [{"text": "Hello."}]}, headers=CLIENT)
+    read_events(client.get(session["eventsUrl"]))
+    replay = read_events(client.get(session["eventsUrl"], headers={"Last-Event-ID": "1"}))
+    assert [name for name, _data in replay] == ["ready", "complete"]
+
+
+def test_cancel_drops_pending_segments(client, engine):
+    engine.gate = threading.Event()
+    session = open_session(client)
+    url = f"/api/stream/sessions/{session['sessionId']}"
+    segments = [{"id": str(index), "text": f"Segment {index}."} for index in range(3)]
+    client.post(f"{url}/segments", json={"segments": segments}, headers=CLIENT)
+    canceled = client.post(f"{url}/cancel", json={"ids": ["1", "2"]}, headers=CLIENT).get_json()["canceled"]
+    engine.gate.set()
+
+    events = read_events(client.get(session["eventsUrl"]))
+    assert canceled == ["1", "2"]
+    assert [(name, data.get("id")) for name, data in events[1:-1]] == [("canceled", "1"), ("canceled", "2"), ("audio", "0")]
+    assert engine.texts == ["Segment 0."]
+
+
+def test_failed_segment_reports_an_error_event(app_module, client, engine):
+    # Unknown voices fall back to the default one; without it the render fails.
+    (app_module.VOICES_DIR / f"{app_module.DEFAULT_VOICE}.onnx").unlink()
+    session = open_session(client)
+    segments = [{"id": "x", "text": "Hi.", "voice": "missing-voice"}]
+    client.post(f"/api/stream/sessions/{session['sessionId']}/segments", json={"segments": segments}, headers=CLIENT)
+    events = read_events(client.get(session["eventsUrl"]))
+    assert events[1] == ("failed", {"id": "x", "status": 400, "error": "voice not found: missing-voice"})
+
+
+def test_closed_session_is_gone(client, engine):
+    session = open_session(client)
+    url = f"/api/stream/sessions/{session['sessionId']}"
+    assert client.delete(url).get_json()["closed"] is True
+    assert client.post(f"{url}/segments", json={"segments": [{"text": "late"}]}).status_code == 404
+    assert client.get(f"{url}/events").status_code == 404
@@ -0,0 +1,36 @@
+from conftest import CLIENT, MS_PER_CHAR
+
+TEXT = "Hi there. Bye now."
+
+
+def test_estimated_timings_cover_the_clip_after_the_silence(app_module):
+    timings = app_module.build_speech_timings(TEXT, 1000, 100)
+    assert timings["source"] == "estimate"
+    assert [(s["start"], s["end"]) for s in timings["sentences"]] == [(0, 9), (9, 18)]
+    assert timings["sentences"][0]["startMs"] == 100 and timings["sentences"][-1]["endMs"] == 1000
+    words = timings["words"]
+    assert [TEXT[w["start"] : w["end"]] for w in words] == ["Hi", "there.", "Bye", "now."]
+    assert all(a["endMs"] == b["startMs"] for a, b in zip(words, words[1:]))
+
+
+def test_measured_sentences_and_alignments_are_used_as_given(app_module):
+    timings = app_module.build_speech_timings(TEXT, 1000, 100, sentence_ms=[600, 300], word_ms=[[200, 300], None])
+    assert timings["source"] == "sentences"
+    assert [(s["startMs"], s["endMs"]) for s in timings["sentences"]] == [(100, 700), (700, 1000)]
+    # Trailing clip silence after the aligned words belongs to the last word.
+    assert [(w["startMs"], w["endMs"]) for w in timings["words"][:2]] == [(100, 300), (300, 700)]
+
+    aligned = app_module.build_speech_timings(TEXT, 900, 0, sentence_ms=[500, 400], word_ms=[[200, 300], [100, 300]])
+    assert aligned["source"] == "alignment"
+
+
+def test_speak_returns_timings_and_keeps_them_with_the_clip(app_module, client, engine):
+    body = {"text": TEXT, "timings": True}
+    first = client.post("/api/speak", json=body, headers=CLIENT).get_json()
+    sentences = first["timings"]["sentences"]
+    assert [s["endMs"] - s["startMs"] for s in sentences] == [len("Hi there.") * MS_PER_CHAR, len("Bye now.") * MS_PER_CHAR]
+
+    name = first["audioUrl"].split("?")[0].rsplit("/", 1)[1]
+    assert app_module.speech_timings_path(name).exists()
+    assert client.post("/api/speak", json=body, headers=CLIENT).get_json()["timings"] == first["timings"]
+    assert "timings" not in client.post("/api/speak", json={"text": TEXT}, headers=CLIENT).get_json()
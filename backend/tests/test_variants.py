@@ -0,0 +1,29 @@
+from conftest import ADMIN, VOICE, install_voice
+
+
+def test_int8_variants_list_next_to_their_base_voice(app_module, client):
+    install_voice(app_module, f"{VOICE}@int8")
+    voices = {voice["id"]: voice["label"] for voice in client.get("/api/voices").get_json()["voices"]}
+    assert voices[f"{VOICE}@int8"].endswith("(int8)")
+    assert app_module.split_voice_variant(f"{VOICE}@int8") == (VOICE, "int8")
+    assert app_module.installed_voice_variants(VOICE) == ["int8"]
+
+
+def test_benchmark_is_admin_only_and_compares_both_models(app_module, client, engine):
+    body = {"voice": VOICE, "text": "Benchmark me.", "runs": 2}
+    assert client.post("/api/voices/benchmark", json=body).status_code == 403
+    assert client.post("/api/voices/benchmark", json=body, headers=ADMIN).status_code == 409
+
+    install_voice(app_module, f"{VOICE}@int8")
+    report = client.post("/api/voices/benchmark", json=body, headers=ADMIN).get_json()
+    assert report["runs"] == 2 and report["int8"]["voice"] == f"{VOICE}@int8"
+    assert report["baseline"]["realTimeFactor"] is not None
+    # One warm-up plus two timed renders per model.
+    assert engine.texts == ["Benchmark me."] * 6
+
+
+def test_uninstalling_a_base_voice_removes_its_variants(app_module, client):
+    install_voice(app_module, "en_US-other-medium")
+    install_voice(app_module, "en_US-other-medium@int8")
+    assert client.delete("/api/voices/en_US-other-medium").status_code == 200
+    assert not list(app_module.VOICES_DIR.glob("en_US-other-medium*"))
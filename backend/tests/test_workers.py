@@ -0,0 +1,100 @@
+import time
+
+import requests
+
+from conftest import CLIENT, VOICE, WORKER
+
+
+class WorkerResponse:
+    def __init__(self, response):
+        self.status_code = response.status_code
+        self.payload = response.get_json()
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}")
+
+    def json(self):
+        return self.payload
+
+
+def register(client, worker_id, **fields):
+    body = {"workerId": worker_id, "url": f"http://{worker_id}:5001", "voices": [VOICE], "capacity": 2, **fields}
+    return client.post("/api/workers/register", json=body, headers=WORKER)
+
+
+def route_to_worker_app(app_module, monkeypatch, calls):
+    worker = app_module.worker_app.test_client()
+
+    def post(url, json, headers, timeout):
+        calls.append(url)
+        return WorkerResponse(worker.post("/worker/synthesize", json=json, headers=headers))
+
+    monkeypatch.setattr(requests, "post", post)
+
+
+def test_registry_needs_the_worker_secret(client):
+    assert register(client, "w1").status_code == 200
+    assert client.get("/api/workers").status_code == 403
+    wrong_secret = {"X-OpenTTS-Worker-Secret": "wrong"}
+    assert client.post("/api/workers/register", json={"workerId": "w2"}, headers=wrong_secret).status_code == 403
+    assert register(client, "bad id!").status_code == 400
+    assert register(client, "w3", url="ftp://w3").status_code == 400
+
+    assert [w["id"] for w in client.get("/api/workers", headers=WORKER).get_json()["workers"]] == ["w1"]
+    assert client.delete("/api/workers/w1", headers=WORKER).status_code == 200
+    assert client.get("/api/workers", headers=WORKER).get_json()["workers"] == []
+
+
+def test_registrations_expire_without_heartbeats(app_module, client):
+    register(client, "w1")
+    path = app_module.WORKERS_DIR / "w1.json"
+    info = app_module.read_json_file(path, {})
+    app_module.write_json_file(path, {**info, "lastSeen": time.time() - app_module.WORKER_TTL_SECONDS - 1})
+    app_module._WORKER_CACHE["loadedAt"] = 0.0
+    assert app_module.list_workers() == []
+    assert path.exists()
+
+    app_module.write_json_file(path, {**info, "lastSeen": time.time() - app_module.WORKER_TTL_SECONDS * 11})
+    app_module._WORKER_CACHE["loadedAt"] = 0.0
+    app_module.list_workers()
+    assert not path.exists()
+
+
+def test_pick_prefers_warm_then_least_loaded_workers(app_module, client):
+    register(client, "busy", active=1, warm=[VOICE])
+    register(client, "idle")
+    register(client, "full", capacity=1, active=1, warm=[VOICE])
+    register(client, "other", voices=["other-voice"])
+    assert app_module.pick_worker(VOICE)["id"] == "busy"
+    assert app_module.pick_worker("missing") is None
+
+    app_module._WORKER_FAILED_UNTIL["busy"] = time.time() + 60
+    assert app_module.pick_worker(VOICE)["id"] == "idle"
+
+
+def test_speak_renders_on_a_worker(app_module, client, engine, monkeypatch):
+    calls = []
+    route_to_worker_app(app_module, monkeypatch, calls)
+    register(client, "w1")
+    response = client.post("/api/speak", json={"text": "Remote hello.", "timings": True}, headers=CLIENT)
+    assert response.status_code == 201
+    assert calls == ["http://w1:5001/worker/synthesize"]
+    assert response.get_json()["timings"]["durationMs"] > 0
+    assert client.get(response.get_json()["audioUrl"]).status_code == 200
+
+
+def test_failing_worker_falls_back_and_cools_down(app_module, client, engine, monkeypatch):
+    calls = []
+
+    def post(url, json, headers, timeout):
+        calls.append(url)
+        raise requests.ConnectionError("refused")
+
+    monkeypatch.setattr(requests, "post", post)
+    register(client, "w1")
+    assert client.post("/api/speak", json={"text": "First."}, headers=CLIENT).status_code == 201
+    assert client.post("/api/speak", json={"text": "Second."}, headers=CLIENT).status_code == 201
+    assert len(calls) == 1
+    assert engine.texts == ["First.", "Second."]
+    assert client.get("/api/workers", headers=WORKER).get_json()["workers"][0]["coolingDown"] is True
@@ -1,5 +1,8 @@
 const MENU_ID = "open_tts_read_selection";
 const SHARED_KEYS = ["voice", "speed", "volume", "downloadFormat", "theme", "autoPasteClipboard", "hotkeys", "prependSilenceMs"];
+const CHUNK_ADVICE_TTL_MS = 30000;
+const DEFAULT_CHUNK_ADVICE = { firstChunkChars: 120, chunkChars: 240, growth: 2 };
+const chunkAdvice = { key: "", advice: DEFAULT_CHUNK_ADVICE, fetchedAt: 0 };
 
 async function getSettings() {
   const data = await chrome.storage.local.get({
@@ -50,7 +53,149 @@ async function ensureContentScript(tabId) {
   }
 }
 
+const speakChannel = {
+  serverUrl: "",
+  sessionId: "",
+  opening: null,
+  controller: null,
+  unsupportedServerUrl: "",
+  waiters: new Map(),
+};
+
+function settleSpeakWaiter(id, method, value) {
+  const waiter = speakChannel.waiters.get(id);
+  if (!waiter) return;
+  speakChannel.waiters.delete(id);
+  waiter[method](value);
+}
+
+function resetSpeakChannel(reason) {
+  if (speakChannel.controller) speakChannel.controller.abort();
+  speakChannel.controller = null;
+  speakChannel.sessionId = "";
+  Array.from(speakChannel.waiters.keys()).forEach((id) => settleSpeakWaiter(id, "reject", new Error(reason)));
+}
+
+function handleSpeakChannelEvent(serverUrl, event, rawData) {
+  let data = {};
+  try {
+    data = JSON.parse(rawData || "{}");
+  } catch (_err) {
+    return;
+  }
+  if (event === "audio") {
+    const audioUrl = data.audioUrl.startsWith("http") ? data.audioUrl : `${serverUrl}${data.audioUrl}`;
+    settleSpeakWaiter(data.id, "resolve", { audioUrl });
+  } else if (event === "failed" || event === "canceled") {
+    const err = new Error(event === "failed" ? data.error || "Speak failed" : "Speak canceled");
+    err.fromChannel = true;
+    settleSpeakWaiter(data.id, "reject", err);
+  }
+}
+
+async function readSpeakChannel(res, serverUrl, onReady) {
+  // Service workers have no EventSource, so parse the SSE stream from fetch directly.
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let boundary = buffer.indexOf("\n\n");
+    while (boundary !== -1) {
+      const block = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      let event = "message";
+      const dataLines = [];
+      block.split("\n").forEach((line) => {
+        if (line.startsWith("event:")) event = line.slice(6).trim();
+        else if (line.startsWith("data:")) dataLines.push(line.slice(5).trim());
+      });
+      if (event === "ready") onReady();
+      else handleSpeakChannelEvent(serverUrl, event, dataLines.join("\n"));
+      boundary = buffer.indexOf("\n\n");
+    }
+  }
+}
+
+async function ensureSpeakChannel(serverUrl) {
+  if (speakChannel.unsupportedServerUrl === serverUrl) throw new Error("Speak channel unavailable");
+  if (speakChannel.sessionId && speakChannel.serverUrl === serverUrl) return speakChannel.sessionId;
+  if (speakChannel.opening) return speakChannel.opening;
+
+  speakChannel.opening = (async () => {
+    resetSpeakChannel("Speak channel reset");
+    const res = await fetch(`${serverUrl}/api/stream/sessions`, { method: "POST" });
+    if (!res.ok) {
+      if (res.status === 404 || res.status === 405) speakChannel.unsupportedServerUrl = serverUrl;
+      throw new Error(`Speak channel failed (${res.status})`);
+    }
+    const data = await res.json();
+    const controller = new AbortController();
+    const events = await fetch(`${serverUrl}${data.eventsUrl}`, { signal: controller.signal });
+    if (!events.ok || !events.body) throw new Error(`Speak channel failed (${events.status})`);
+    await new Promise((resolve, reject) => {
+      readSpeakChannel(events, serverUrl, resolve)
+        .catch(() => {})
+        .finally(() => {
+          reject(new Error("Speak channel closed"));
+          if (speakChannel.controller === controller) resetSpeakChannel("Speak channel closed");
+        });
+    });
+    speakChannel.controller = controller;
+    speakChannel.serverUrl = serverUrl;
+    speakChannel.sessionId = data.sessionId;
+    return data.sessionId;
+  })();
+  try {
+    return await speakChannel.opening;
+  } finally {
+    speakChannel.opening = null;
+  }
+}
+
+async function synthesizeViaChannel(text, serverUrl, voice, speed, prependSilenceMs) {
+  const sessionId = await ensureSpeakChannel(serverUrl);
+  const id = `${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 9)}`;
+  const result = new Promise((resolve, reject) => {
+    speakChannel.waiters.set(id, { resolve, reject });
+  });
+  const res = await fetch(`${serverUrl}/api/stream/sessions/${encodeURIComponent(sessionId)}/segments`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ segments: [{ id, text, voice, speed, prependSilenceMs }] }),
+  });
+  if (!res.ok) {
+    settleSpeakWaiter(id, "reject", new Error(`Speak channel failed (${res.status})`));
+    if (res.status === 404) resetSpeakChannel("Speak channel expired");
+  }
+  return result;
+}
+
+function cancelPendingSpeech() {
+  const ids = Array.from(speakChannel.waiters.keys());
+  if (!ids.length || !speakChannel.sessionId) return;
+  ids.forEach((id) => {
+    const err = new Error("Speak canceled");
+    err.fromChannel = true;
+    settleSpeakWaiter(id, "reject", err);
+  });
+  fetch(`${speakChannel.serverUrl}/api/stream/sessions/${encodeURIComponent(speakChannel.sessionId)}/cancel`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ ids }),
+  }).catch(() => {});
+}
+
 async function synthesize(text, serverUrl, voice, speed, prependSilenceMs) {
+  const baseUrl = normalizeServerUrl(serverUrl);
+  try {
+    return await synthesizeViaChannel(text, baseUrl, voice, speed, prependSilenceMs);
+  } catch (err) {
+    if (err.fromChannel) throw err;
+    // Fall back to a one-shot request when the channel is unavailable.
+  }
   const res = await fetch(`${normalizeServerUrl(serverUrl)}/api/speak`, {
     method: "POST",
     headers: { "Content-Type": "application/json" },
@@ -67,6 +212,74 @@ async function synthesize(text, serverUrl, voice, speed, prependSilenceMs) {
   return { audioUrl: absoluteAudioUrl };
 }
 
+async function refreshChunkAdvice(serverUrl, voice) {
+  const key = `${serverUrl}|${voice}`;
+  if (chunkAdvice.key === key && Date.now() - chunkAdvice.fetchedAt < CHUNK_ADVICE_TTL_MS) return;
+  chunkAdvice.key = key;
+  chunkAdvice.fetchedAt = Date.now();
+  try {
+    const query = voice ? `?voice=${encodeURIComponent(voice)}` : "";
+    const res = await fetch(`${serverUrl}/api/chunking${query}`);
+    if (!res.ok) return;
+    const data = await res.json();
+    const advice = Object.values(data.voices || {})[0];
+    if (advice && chunkAdvice.key === key) chunkAdvice.advice = advice;
+  } catch (_err) {
+    // Servers without the endpoint keep the default sizes.
+  }
+}
+
+function chunkText(text, advice) {
+  // Same segmentation as the web UI: a small first chunk for fast first audio, then chunks that grow
+  // by the server's factor while earlier ones play, up to the steady-state size.
+  const maxChars = Math.max(1, Number(advice.chunkChars) || DEFAULT_CHUNK_ADVICE.chunkChars);
+  const growth = Math.max(1, Number(advice.growth) || DEFAULT_CHUNK_ADVICE.growth);
+  let targetChars = Math.min(maxChars, Math.max(1, Number(advice.firstChunkChars) || DEFAULT_CHUNK_ADVICE.firstChunkChars));
+  const out = [];
+  String(text || "")
+    .split(/\n\s*\n/)
+    .map((p) => p.trim())
+    .filter(Boolean)
+    .forEach((paragraph) => {
+      const sentences = paragraph.match(/[^.!?]+[.!?]+|[^.!?]+$/g) || [paragraph];
+      let bucket = [];
+      let bucketChars = 0;
+      sentences.forEach((raw, i) => {
+        const sentence = raw.trim();
+        bucket.push(sentence);
+        bucketChars += sentence.length + 1;
+        if (bucketChars >= targetChars || i === sentences.length - 1) {
+          const chunk = bucket.join(" ").trim();
+          if (chunk) out.push(chunk);
+          bucket = [];
+          bucketChars = 0;
+          targetChars = Math.min(maxChars, Math.round(targetChars * growth));
+        }
+      });
+    });
+  return out.length ? out : [String(text || "").trim()].filter(Boolean);
+}
+
+async function speakInTab(tabId, text, settings) {
+  const serverUrl = normalizeServerUrl(settings.serverUrl);
+  // Cached advice segments this selection; the refresh only affects the next one.
+  const chunks = chunkText(text, chunkAdvice.key === `${serverUrl}|${settings.voice}` ? chunkAdvice.advice : DEFAULT_CHUNK_ADVICE);
+  refreshChunkAdvice(serverUrl, settings.voice);
+  // Queue every chunk up front; the speak channel renders them back-to-back on the server.
+  const pending = chunks.map((chunk) =>
+    synthesize(chunk, settings.serverUrl, settings.voice, settings.speed, settings.prependSilenceMs)
+  );
+  pending.forEach((promise) => promise.catch(() => {}));
+  await ensureContentScript(tabId);
+  for (const promise of pending) {
+    const { audioUrl } = await promise;
+    await chrome.tabs.sendMessage(tabId, {
+      type: "open_tts_play_audio",
+      audioUrl
+    });
+  }
+}
+
 chrome.runtime.onInstalled.addListener(() => {
   chrome.contextMenus.create({
     id: MENU_ID,
@@ -82,18 +295,7 @@ chrome.contextMenus.onClicked.addListener(async (info, tab) => {
 
   try {
     const settings = await getSettings();
-    const { audioUrl } = await synthesize(
-      text,
-      settings.serverUrl,
-      settings.voice,
-      settings.speed,
-      settings.prependSilenceMs
-    );
-    await ensureContentScript(tab.id);
-    await chrome.tabs.sendMessage(tab.id, {
-      type: "open_tts_play_audio",
-      audioUrl
-    });
+    await speakInTab(tab.id, text, settings);
     await chrome.storage.local.set({
       lastEntry: text,
       lastEntryAt: new Date().toISOString()
@@ -149,6 +351,11 @@ chrome.runtime.onMessage.addListener((message, _sender, sendResponse) => {
         sendResponse({ ok: true, ...merged });
         return;
       }
+      if (message?.type === "open_tts_cancel") {
+        cancelPendingSpeech();
+        sendResponse({ ok: true });
+        return;
+      }
       if (message?.type === "open_tts_speak") {
         const settings = await getSettings();
         const text = (message.text || "").trim();
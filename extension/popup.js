@@ -112,6 +112,11 @@ function stopLocalAudio() {
 
 async function stopEverywhere() {
   stopLocalAudio();
+  try {
+    await chrome.runtime.sendMessage({ type: "open_tts_cancel" });
+  } catch (_err) {
+    // ignore if the background worker is not running
+  }
   const [tab] = await chrome.tabs.query({ active: true, currentWindow: true });
   if (tab?.id) {
     try {
@@ -21,7 +21,8 @@ $files = @(
     "open-tts.py",
     "open-tts.cmd",
     "open-tts-stop.py",
-    "open-tts-stop.cmd"
+    "open-tts-stop.cmd",
+    "open_tts_common.py"
 )
 
 foreach ($file in $files) {
@@ -1,3 +1,9 @@
 import winsound
 
+from open_tts_common import playback_file
+
+# open-tts keeps playing chunks only while it owns this file.
+current_file = playback_file()
+if current_file.parent.exists():
+    current_file.write_text("stopped", encoding="utf-8")
 winsound.PlaySound(None, winsound.SND_PURGE)
@@ -1,15 +1,32 @@
+import hashlib
+import http.client
 import json
 import os
+import queue
+import re
 import sys
-import tempfile
+import threading
 import time
 import urllib.parse
-import urllib.request
+import wave
+from pathlib import Path
+
+from open_tts_common import cache_dir, playback_file
 
 API_URL = os.environ.get("OPEN_TTS_API", "http://localhost:3016/api/speak")
 DEFAULT_VOICE = os.environ.get("OPEN_TTS_VOICE", "")
 DEFAULT_SPEED = os.environ.get("OPEN_TTS_SPEED", "")
 DEFAULT_VOLUME = os.environ.get("OPEN_TTS_VOLUME", "")
+CACHE_MAX_BYTES = int(float(os.environ.get("OPEN_TTS_CACHE_MB", "50")) * 1024 * 1024)
+# The first chunk is short so audio starts quickly; later ones render while earlier ones play.
+FIRST_CHUNK_CHARS = 200
+CHUNK_CHARS = 600
+READ_BYTES = 64 * 1024
+POLL_SECONDS = 0.05
+
+
+CACHE_DIR = cache_dir()
+CURRENT_FILE = playback_file()
 
 
 def _qute_message(text: str) -> None:
@@ -20,24 +37,6 @@ def _qute_message(text: str) -> None:
         f.write(text + "\n")
 
 
-def _play_wav_sync(data: bytes) -> bool:
-    try:
-        import winsound
-    except Exception:
-        return False
-
-    fd, path = tempfile.mkstemp(suffix=".wav", prefix="open-tts-")
-    try:
-        with os.fdopen(fd, "wb") as f:
-            f.write(data)
-        # Small delay to avoid clipping the start of playback on some systems.
-        time.sleep(0.25)
-        winsound.PlaySound(path, winsound.SND_FILENAME)
-        return True
-    except Exception:
-        return False
-
-
 def _parse_args(argv):
     voice = DEFAULT_VOICE
     speed = DEFAULT_SPEED
@@ -63,6 +62,222 @@ def _parse_args(argv):
     return use_page, voice, speed, volume
 
 
+def _split_chunks(text: str) -> list:
+    """Group sentences into chunks; deterministic so a reread maps onto the same cached clips."""
+    sentences = [s for s in re.split(r"(?<=[.!?])\s+", " ".join(text.split())) if s]
+    chunks = []
+    current = ""
+    for sentence in sentences:
+        limit = FIRST_CHUNK_CHARS if not chunks else CHUNK_CHARS
+        while len(sentence) > limit:
+            cut = sentence.rfind(" ", 0, limit)
+            cut = cut if cut > 0 else limit
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:cut])
+            sentence = sentence[cut:].strip()
+            limit = CHUNK_CHARS
+        if current and len(current) + 1 + len(sentence) > limit:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}".strip()
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class ApiClient:
+    """Requests of one run share an HTTP connection for as long as the server keeps it alive."""
+
+    def __init__(self, api_url: str):
+        parsed = urllib.parse.urlsplit(api_url)
+        self.speak_path = parsed.path or "/api/speak"
+        self.base_url = f"{parsed.scheme}://{parsed.netloc}/"
+        connection_class = http.client.HTTPSConnection if parsed.scheme == "https" else http.client.HTTPConnection
+        self.connection = connection_class(parsed.netloc, timeout=60)
+
+    def request(self, method: str, path: str, body: bytes = None, headers: dict = None):
+        reused = self.connection.sock is not None
+        try:
+            self.connection.request(method, path, body=body, headers=headers or {})
+            return self.connection.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            self.connection.close()
+            if not reused:
+                raise
+        # The server dropped the kept-alive connection while it was idle, before answering anything,
+        # so the request was never handled and is safe to resend once on a fresh connection.
+        self.connection.request(method, path, body=body, headers=headers or {})
+        return self.connection.getresponse()
+
+    def speak(self, payload: dict) -> str:
+        body = json.dumps(payload).encode("utf-8")
+        resp = self.request("POST", self.speak_path, body, {"Content-Type": "application/json"})
+        data = resp.read()
+        if resp.status >= 400:
+            try:
+                message = json.loads(data).get("error") or ""
+            except Exception:
+                message = ""
+            raise RuntimeError(f"speak failed ({resp.status}) {message}".strip())
+        return json.loads(data).get("audioUrl", "")
+
+    def download(self, audio_url: str, target: Path) -> None:
+        """Stream the clip to target in blocks instead of buffering it in memory."""
+        full_url = urllib.parse.urljoin(self.base_url, audio_url)
+        parsed = urllib.parse.urlsplit(full_url)
+        path = parsed.path + (f"?{parsed.query}" if parsed.query else "")
+        resp = self.request("GET", path)
+        if resp.status >= 400:
+            resp.read()
+            raise RuntimeError(f"audio fetch failed ({resp.status})")
+        with open(target, "wb") as f:
+            while True:
+                block = resp.read(READ_BYTES)
+                if not block:
+                    break
+                f.write(block)
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class ClipCache:
+    """Small on-disk LRU of rendered clips keyed by (text, voice, speed); mtime is the recency."""
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path(self, text: str, voice: str, speed: str) -> Path:
+        raw = json.dumps([text, voice, speed], ensure_ascii=True)
+        return self.directory / f"{hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]}.wav"
+
+    def lookup(self, path: Path) -> bool:
+        try:
+            os.utime(path)
+            return True
+        except OSError:
+            return False
+
+    def store(self, path: Path, fetch) -> None:
+        tmp_path = path.with_name(f".{path.stem}.{os.getpid()}.tmp")
+        try:
+            fetch(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        self.trim(keep=path)
+
+    def trim(self, keep: Path) -> None:
+        for tmp_path in self.directory.glob(".*.tmp"):
+            # Left behind by runs that were killed mid-download.
+            try:
+                if tmp_path.stat().st_mtime < time.time() - 3600:
+                    tmp_path.unlink()
+            except OSError:
+                pass
+        clips = []
+        for clip in self.directory.glob("*.wav"):
+            try:
+                stat = clip.stat()
+            except OSError:
+                continue
+            clips.append((stat.st_mtime, stat.st_size, clip))
+        total = sum(size for _mtime, size, _clip in clips)
+        for _mtime, size, clip in sorted(clips):
+            if total <= self.max_bytes:
+                break
+            if clip == keep:
+                continue
+            try:
+                clip.unlink()
+                total -= size
+            except OSError:
+                # Still being played by another run.
+                pass
+
+
+def _claim_playback() -> str:
+    token = f"{os.getpid()}-{time.time()}"
+    CURRENT_FILE.write_text(token, encoding="utf-8")
+    return token
+
+
+def _still_current(token: str) -> bool:
+    try:
+        return CURRENT_FILE.read_text(encoding="utf-8") == token
+    except OSError:
+        return False
+
+
+def _wav_seconds(path: Path) -> float:
+    with wave.open(str(path), "rb") as src:
+        return src.getnframes() / float(src.getframerate())
+
+
+def _play_clip(winsound, path: Path, token: str) -> bool:
+    """Play one clip asynchronously and poll, so a newer run or open-tts-stop can cut it off."""
+    winsound.PlaySound(str(path), winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+    deadline = time.monotonic() + _wav_seconds(path)
+    while time.monotonic() < deadline:
+        if not _still_current(token):
+            winsound.PlaySound(None, winsound.SND_PURGE)
+            return False
+        time.sleep(POLL_SECONDS)
+    return True
+
+
+def _speak_chunks(winsound, client: ApiClient, cache: ClipCache, chunks: list, payload: dict) -> int:
+    token = _claim_playback()
+    voice = payload.get("voice", "")
+    speed = payload.get("speed", "")
+    ready = queue.Queue()
+
+    def produce() -> None:
+        # Renders and downloads run ahead of playback, one chunk at a time over the shared connection.
+        for chunk in chunks:
+            if not _still_current(token):
+                break
+            path = cache.path(chunk, voice, speed)
+            try:
+                if not cache.lookup(path):
+                    audio_url = client.speak({**payload, "text": chunk})
+                    cache.store(path, lambda target: client.download(audio_url, target))
+            except Exception as exc:
+                ready.put(exc)
+                return
+            ready.put(path)
+        ready.put(None)
+
+    threading.Thread(target=produce, daemon=True).start()
+    while True:
+        item = ready.get()
+        if item is None:
+            break
+        if isinstance(item, Exception):
+            _qute_message(f"message-error 'Open-TTS: request failed: {item}'")
+            return 1
+        if not _play_clip(winsound, item, token):
+            break
+    return 0
+
+
+def _open_in_tab(client: ApiClient, payload: dict) -> int:
+    # Without winsound the browser plays the clip, so the whole text goes out as one clip.
+    audio_url = client.speak(payload)
+    if not audio_url:
+        _qute_message("message-info 'Open-TTS: sent to server.'")
+        return 0
+    _qute_message(f"open -r {urllib.parse.urljoin(client.base_url, audio_url)}")
+    _qute_message("message-info 'Open-TTS: opened audio in tab.'")
+    return 0
+
+
 def main() -> int:
     use_page, voice, speed, volume = _parse_args(sys.argv[1:])
     text = os.environ.get("QUTE_SELECTED_TEXT", "")
@@ -81,42 +296,23 @@ def main() -> int:
     if volume:
         payload_obj["volume"] = volume
 
-    payload = json.dumps(payload_obj).encode("utf-8")
-    req = urllib.request.Request(API_URL, data=payload, headers={"Content-Type": "application/json"})
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            body = resp.read().decode("utf-8")
-    except Exception as exc:
-        _qute_message(f"message-error 'Open-TTS: request failed: {exc}'")
-        return 1
-
-    try:
-        data = json.loads(body)
-        audio_url = data.get("audioUrl", "")
+        import winsound
     except Exception:
-        audio_url = ""
-
-    if not audio_url:
-        _qute_message("message-info 'Open-TTS: sent to server.'")
-        return 0
-
-    base = API_URL.split("/api/")[0] + "/"
-    full_url = urllib.parse.urljoin(base, audio_url)
+        winsound = None
 
+    client = ApiClient(API_URL)
     try:
-        with urllib.request.urlopen(full_url, timeout=10) as resp:
-            audio_bytes = resp.read()
+        if winsound is None:
+            return _open_in_tab(client, payload_obj)
+        cache = ClipCache(CACHE_DIR, CACHE_MAX_BYTES)
+        _qute_message("message-info 'Open-TTS: playing audio.'")
+        return _speak_chunks(winsound, client, cache, _split_chunks(text), payload_obj)
     except Exception as exc:
-        _qute_message(f"message-error 'Open-TTS: audio fetch failed: {exc}'")
+        _qute_message(f"message-error 'Open-TTS: request failed: {exc}'")
         return 1
-
-    if _play_wav_sync(audio_bytes):
-        _qute_message("message-info 'Open-TTS: playing audio.'")
-        return 0
-
-    _qute_message(f"open -r {full_url}")
-    _qute_message("message-info 'Open-TTS: opened audio in tab.'")
-    return 0
+    finally:
+        client.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,15 @@
+import os
+from pathlib import Path
+
+
+def cache_dir() -> Path:
+    configured = os.environ.get("OPEN_TTS_CACHE_DIR", "")
+    if configured:
+        return Path(configured)
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "open-tts" / "clips"
+
+
+def playback_file() -> Path:
+    # Holds the token of the run that owns playback; a newer run or open-tts-stop replaces it.
+    return cache_dir() / "current"
@@ -0,0 +1,206 @@
+import importlib.util
+import os
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+SCRIPT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SCRIPT_DIR))
+
+
+def load_client(monkeypatch, cache_dir):
+    monkeypatch.setenv("OPEN_TTS_CACHE_DIR", str(cache_dir))
+    spec = importlib.util.spec_from_file_location("open_tts_client", SCRIPT_DIR / "open-tts.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def client_module(monkeypatch, tmp_path):
+    return load_client(monkeypatch, tmp_path / "clips")
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_args):
+        pass
+
+    def do_POST(self):
+        self.server.requests.append(("POST", self.path))
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.reply(b'{"audioUrl": "/api/audio/clip.wav?token=t"}', "application/json")
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path))
+        self.reply(b"RIFF" + b"\0" * 200_000, "audio/wav")
+
+    def reply(self, body, content_type):
+        self.send_response(201 if self.command == "POST" else 200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Simulates an idle timeout: the socket closes without a "Connection: close" header.
+        self.close_connection = self.server.drop_after_response
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.requests = []
+    httpd.drop_after_response = False
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def api_url(httpd):
+    return f"http://127.0.0.1:{httpd.server_address[1]}/api/speak"
+
+
+def test_split_chunks_is_deterministic_and_bounded(client_module):
+    text = "Short opener. " + " ".join(f"Sentence number {i} is here." for i in range(80))
+    chunks = client_module._split_chunks(text)
+    assert chunks == client_module._split_chunks(text)
+    assert len(chunks[0]) <= client_module.FIRST_CHUNK_CHARS
+    assert all(len(chunk) <= client_module.CHUNK_CHARS for chunk in chunks)
+    assert " ".join(chunks) == " ".join(text.split())
+
+
+def test_split_chunks_cuts_overlong_sentences(client_module):
+    chunks = client_module._split_chunks("word " * 400)
+    assert len(chunks[0]) <= client_module.FIRST_CHUNK_CHARS
+    assert all(len(chunk) <= client_module.CHUNK_CHARS for chunk in chunks)
+
+
+def test_clip_cache_evicts_least_recently_used(client_module, tmp_path):
+    cache = client_module.ClipCache(tmp_path / "lru", max_bytes=250)
+    paths = [cache.path(f"text {i}", "voice", "1.0") for i in range(3)]
+    for index, path in enumerate(paths):
+        cache.store(path, lambda target: target.write_bytes(b"x" * 100))
+        os.utime(path, (time.time() - 100 + index, time.time() - 100 + index))
+    assert not paths[0].exists()
+    assert cache.lookup(paths[1])
+    cache.store(cache.path("text 3", "voice", "1.0"), lambda target: target.write_bytes(b"x" * 100))
+    assert paths[1].exists() and not paths[2].exists()
+
+
+def test_clip_cache_keeps_a_clip_larger_than_the_budget(client_module, tmp_path):
+    cache = client_module.ClipCache(tmp_path / "small", max_bytes=10)
+    path = cache.path("big", "voice", "1.0")
+    cache.store(path, lambda target: target.write_bytes(b"x" * 100))
+    assert path.exists()
+
+
+def test_failed_download_leaves_no_partial_clip(client_module, tmp_path):
+    cache = client_module.ClipCache(tmp_path / "partial", max_bytes=1000)
+    path = cache.path("text", "voice", "1.0")
+
+    def fail(target):
+        target.write_bytes(b"half")
+        raise RuntimeError("connection lost")
+
+    with pytest.raises(RuntimeError):
+        cache.store(path, fail)
+    assert list((tmp_path / "partial").iterdir()) == []
+
+
+def test_requests_reuse_a_kept_alive_connection(client_module, server, tmp_path):
+    client = client_module.ApiClient(api_url(server))
+    audio_url = client.speak({"text": "hello"})
+    client.download(audio_url, tmp_path / "a.wav")
+    client.speak({"text": "again"})
+    client.close()
+    assert [method for method, _path in server.requests] == ["POST", "GET", "POST"]
+    assert (tmp_path / "a.wav").stat().st_size == 200_004
+
+
+def test_stale_connection_is_resent_once(client_module, server):
+    server.drop_after_response = True
+    client = client_module.ApiClient(api_url(server))
+    client.speak({"text": "one"})
+    time.sleep(0.1)
+    client.speak({"text": "two"})
+    client.close()
+    assert [method for method, _path in server.requests] == ["POST", "POST"]
+
+
+def test_post_on_a_fresh_connection_is_not_resent(client_module):
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    accepted = []
+
+    def accept_and_drop():
+        while True:
+            try:
+                conn, _addr = listener.accept()
+            except OSError:
+                return
+            accepted.append(conn.recv(65536))
+            conn.close()
+
+    threading.Thread(target=accept_and_drop, daemon=True).start()
+    client = client_module.ApiClient(f"http://127.0.0.1:{listener.getsockname()[1]}/api/speak")
+    with pytest.raises(ConnectionError):
+        client.speak({"text": "only once"})
+    listener.close()
+    assert len(accepted) == 1
+
+
+class FakeWinsound:
+    SND_FILENAME = 1
+    SND_ASYNC = 2
+    SND_NODEFAULT = 4
+    SND_PURGE = 8
+
+    def __init__(self):
+        self.played = []
+
+    def PlaySound(self, sound, flags):
+        if sound is not None:
+            self.played.append(sound)
+
+
+def test_reread_plays_from_the_cache_without_requests(client_module, server, monkeypatch):
+    monkeypatch.setattr(client_module, "_wav_seconds", lambda _path: 0.0)
+    text = "First sentence here. " + "Another sentence follows. " * 30
+    chunks = client_module._split_chunks(text)
+    assert len(chunks) > 1
+    for expected_requests in (2 * len(chunks), 2 * len(chunks)):
+        winsound = FakeWinsound()
+        client = client_module.ApiClient(api_url(server))
+        cache = client_module.ClipCache(client_module.CACHE_DIR, 50 * 1024 * 1024)
+        assert client_module._speak_chunks(winsound, client, cache, chunks, {"text": text}) == 0
+        client.close()
+        assert len(winsound.played) == len(chunks)
+        assert len(server.requests) == expected_requests
+
+
+def test_newer_run_cancels_queued_chunks(client_module, server, monkeypatch):
+    monkeypatch.setattr(client_module, "_wav_seconds", lambda _path: 5.0)
+    monkeypatch.setattr(client_module, "POLL_SECONDS", 0.01)
+    winsound = FakeWinsound()
+    client = client_module.ApiClient(api_url(server))
+    cache = client_module.ClipCache(client_module.CACHE_DIR, 50 * 1024 * 1024)
+    chunks = [f"Chunk {i}." for i in range(4)]
+
+    def stop_soon():
+        time.sleep(0.3)
+        client_module.CURRENT_FILE.write_text("stopped", encoding="utf-8")
+
+    threading.Thread(target=stop_soon, daemon=True).start()
+    started = time.monotonic()
+    client_module._speak_chunks(winsound, client, cache, chunks, {"text": " ".join(chunks)})
+    client.close()
+    assert time.monotonic() - started < 2.0
+    assert len(winsound.played) == 1
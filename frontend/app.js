@@ -32,6 +32,11 @@ const DEFAULT_NARRATOR_VOICE = "en_GB-alan-medium";
 const DEFAULT_MALE_VOICE = "en_US-ryan-high";
 const DEFAULT_FEMALE_VOICE = "en_US-amy-medium";
 const MIN_SYNTH_PREPEND_SILENCE_MS = 350;
+const PREFETCH_AHEAD_ENTRIES = 2;
+const AUDIO_TIMINGS_CACHE_LIMIT = 200;
+const CHUNK_ADVICE_TTL_MS = 30000;
+// Used until the server has answered; roughly the old fixed buckets of 2 and then 4 sentences.
+const DEFAULT_CHUNK_ADVICE = Object.freeze({ firstChunkChars: 120, chunkChars: 240, growth: 2 });
 const DEFAULT_SPEAKER_COLORS = Object.freeze({
   narrator: "#ffffff",
   male: "#8ec5ff",
@@ -163,10 +168,27 @@ const uploadConfigBtn = document.getElementById("uploadConfigBtn");
 const configFileInput = document.getElementById("configFileInput");
 const deleteAllUnpinnedBtn = document.getElementById("deleteAllUnpinnedBtn");
 const deleteAllPinnedBtn = document.getElementById("deleteAllPinnedBtn");
+const exportHistoryBtn = document.getElementById("exportHistoryBtn");
+const exportHistoryZipBtn = document.getElementById("exportHistoryZipBtn");
 let lastClipboardAutopasteMs = 0;
 const warmedVoices = new Set();
+const speakStream = {
+  base: "",
+  sessionId: "",
+  source: null,
+  opening: null,
+  unsupportedBase: "",
+  waiters: new Map(),
+};
 let nextSpeakerId = 1;
 let apiClientIdCache = "";
+let activePrefetchId = "";
+// Server word timings per audio URL; kept in memory only so history storage stays small.
+const audioTimingsByUrl = new Map();
+// Server-advised narrator chunk sizes per voice: { advice, fetchedAt }.
+const chunkAdviceByVoice = new Map();
+// True once the server holds this browser's phonetic dictionary and applies it itself.
+let phoneticServerSynced = false;
 
 function uid() {
   return `${Date.now()}-${Math.random().toString(36).slice(2, 9)}`;
@@ -315,6 +337,8 @@ function stopPlayback(clearQueue = true) {
     state.currentAudio = null;
   }
   if (clearQueue) clearAudioQueue("playback stopped");
+  cancelSpeakStreamSegments();
+  cancelPrefetch();
   state.activePlaybackId = null;
   visualizer.classList.remove("active");
   clearWordHighlights();
@@ -635,6 +659,24 @@ function applyPhoneticDictionary(text) {
   return out;
 }
 
+async function syncPhoneticDictionary() {
+  try {
+    const res = await apiFetch(`${getApiBase()}/api/phonetic`, {
+      method: "PUT",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ entries: normalizePhoneticDictionary(state.settings.phoneticDictionary) }),
+    });
+    phoneticServerSynced = res.ok;
+  } catch (_err) {
+    phoneticServerSynced = false;
+  }
+}
+
+function speechRequestText(text) {
+  // The server normalizes text itself so every client shares cache keys; older servers get it pre-applied.
+  return phoneticServerSynced ? String(text || "") : applyPhoneticDictionary(text);
+}
+
 function renderPhoneticDictionary() {
   if (!phoneticList) return;
   const items = normalizePhoneticDictionary(state.settings.phoneticDictionary);
@@ -970,25 +1012,57 @@ function sleep(ms) {
   return new Promise((resolve) => setTimeout(resolve, ms));
 }
 
-function chunkNarratorText(text) {
+function chunkAdviceFor(voice) {
+  return chunkAdviceByVoice.get(voice)?.advice || DEFAULT_CHUNK_ADVICE;
+}
+
+async function refreshChunkAdvice(voices) {
+  const now = Date.now();
+  const stale = Array.from(new Set(voices.filter(Boolean))).filter(
+    (voice) => now - (chunkAdviceByVoice.get(voice)?.fetchedAt || 0) > CHUNK_ADVICE_TTL_MS
+  );
+  if (!stale.length) return;
+  // Mark as fetched up front so concurrent playbacks do not repeat the request.
+  stale.forEach((voice) => chunkAdviceByVoice.set(voice, { advice: chunkAdviceFor(voice), fetchedAt: now }));
+  try {
+    const query = stale.map((voice) => `voice=${encodeURIComponent(voice)}`).join("&");
+    const res = await apiFetch(`${getApiBase()}/api/chunking?${query}`);
+    if (!res.ok) return;
+    const data = await res.json();
+    Object.entries(data.voices || {}).forEach(([voice, advice]) => {
+      chunkAdviceByVoice.set(voice, { advice, fetchedAt: now });
+    });
+  } catch (_err) {
+    // Older servers have no advice endpoint; the defaults still work.
+  }
+}
+
+function chunkNarratorText(text, advice = DEFAULT_CHUNK_ADVICE, leading = true) {
   const paragraphs = String(text || "")
     .split(/\n\s*\n/)
     .map((p) => p.trim())
     .filter(Boolean);
   const out = [];
+  const maxChars = Math.max(1, Number(advice.chunkChars) || DEFAULT_CHUNK_ADVICE.chunkChars);
+  const growth = Math.max(1, Number(advice.growth) || DEFAULT_CHUNK_ADVICE.growth);
+  // The first chunk is sized for fast first audio; each later one renders while the previous plays,
+  // so it can grow by the server's growth factor up to the steady-state size.
+  let targetChars = Math.min(maxChars, Math.max(1, Number(advice.firstChunkChars) || DEFAULT_CHUNK_ADVICE.firstChunkChars));
+  if (!leading) targetChars = Math.min(maxChars, Math.round(targetChars * growth));
   paragraphs.forEach((paragraph) => {
     const sentences = paragraph.match(/[^.!?]+[.!?]+|[^.!?]+$/g) || [paragraph];
-    // Keep startup latency low: synthesize/play the first couple of sentences first.
     let bucket = [];
-    let targetSize = 2;
+    let bucketChars = 0;
     for (let i = 0; i < sentences.length; i += 1) {
-      bucket.push(sentences[i].trim());
-      if (bucket.length >= targetSize || i === sentences.length - 1) {
+      const sentence = sentences[i].trim();
+      bucket.push(sentence);
+      bucketChars += sentence.length + 1;
+      if (bucketChars >= targetChars || i === sentences.length - 1) {
         const chunk = bucket.join(" ").trim();
         if (chunk) out.push(chunk);
         bucket = [];
-        // After the first chunk, use larger batches for better total throughput.
-        targetSize = 4;
+        bucketChars = 0;
+        targetChars = Math.min(maxChars, Math.round(targetChars * growth));
       }
     }
   });
@@ -1037,9 +1111,10 @@ function detectQuoteTarget(beforeText) {
 }
 
 function pushNarratorChunks(segments, text) {
-  const chunks = chunkNarratorText(text);
+  const voice = resolveNarratorVoice();
+  const chunks = chunkNarratorText(text, chunkAdviceFor(voice), segments.length === 0);
   chunks.forEach((chunk) => {
-    if (chunk && chunk.trim()) segments.push({ text: chunk.trim(), voice: resolveNarratorVoice(), role: "narrator", quoted: false });
+    if (chunk && chunk.trim()) segments.push({ text: chunk.trim(), voice, role: "narrator", quoted: false });
   });
 }
 
@@ -1172,6 +1247,42 @@ function wordify(text) {
   return text.split(/(\s+)/).filter(Boolean);
 }
 
+function rememberAudioTimings(url, timings) {
+  if (!url || !timings || !Array.isArray(timings.words)) return;
+  audioTimingsByUrl.delete(url);
+  audioTimingsByUrl.set(url, timings);
+  while (audioTimingsByUrl.size > AUDIO_TIMINGS_CACHE_LIMIT) {
+    audioTimingsByUrl.delete(audioTimingsByUrl.keys().next().value);
+  }
+}
+
+function timedWordIndex(url, tokens, currentMs) {
+  // Map a playback position to an index into wordify(text) using the server's word timings.
+  const spoken = audioTimingsByUrl.get(url)?.words || [];
+  if (!spoken.length) return -1;
+  let lo = 0;
+  let hi = spoken.length - 1;
+  let found = 0;
+  while (lo <= hi) {
+    const mid = (lo + hi) >> 1;
+    if (spoken[mid].startMs <= currentMs) {
+      found = mid;
+      lo = mid + 1;
+    } else {
+      hi = mid - 1;
+    }
+  }
+  const wordPositions = [];
+  tokens.forEach((token, idx) => {
+    if (token.trim()) wordPositions.push(idx);
+  });
+  if (!wordPositions.length) return -1;
+  // Phonetic replacements can change the spoken word count; scale when the counts differ.
+  const scaled =
+    spoken.length === wordPositions.length ? found : Math.floor((found * wordPositions.length) / spoken.length);
+  return wordPositions[Math.min(wordPositions.length - 1, scaled)];
+}
+
 function entryDisplayText(entry) {
   const segments = parseVoiceSegments(entry?.text || "");
   if (!segments.length) return String(entry?.text || "");
@@ -1431,6 +1542,8 @@ async function fetchVoices() {
   }));
   saveSettings();
   warmConfiguredVoices();
+  refreshChunkAdvice([resolveNarratorVoice()]);
+  syncPhoneticDictionary();
 }
 
 function renderVoiceOptions() {
@@ -1460,13 +1573,22 @@ function renderModels() {
       const status = model.installed ? "Installed" : "Not installed";
       const buttonLabel = model.installed ? "Uninstall" : "Install";
       const disabled = model.isDefault ? "disabled" : "";
+      const hasInt8 = (model.variants || []).includes("int8");
+      // Quantized copies are generated on the server from an installed Piper model.
+      const int8Button =
+        model.installed && (model.quantizable || hasInt8)
+          ? `<button type="button" data-model-action="${hasInt8 ? "uninstall" : "install"}" data-model-id="${escapeHtml(`${model.id}@int8`)}">${hasInt8 ? "Remove int8" : "Add int8"}</button>`
+          : "";
       return `
       <div class="model-item">
         <div>
           <div>${escapeHtml(model.label)}</div>
-          <small>${escapeHtml(model.id)} - ${status}${model.isDefault ? " (default)" : ""}</small>
+          <small>${escapeHtml(model.id)} - ${status}${model.isDefault ? " (default)" : ""}${hasInt8 ? " + int8" : ""}</small>
+        </div>
+        <div class="model-actions">
+          ${int8Button}
+          <button type="button" data-model-action="${model.installed ? "uninstall" : "install"}" data-model-id="${escapeHtml(model.id)}" ${disabled}>${buttonLabel}</button>
         </div>
-        <button type="button" data-model-action="${model.installed ? "uninstall" : "install"}" data-model-id="${escapeHtml(model.id)}" ${disabled}>${buttonLabel}</button>
       </div>`;
     })
     .join("");
@@ -1641,7 +1763,7 @@ async function synthesize(entry) {
 async function synthesizeText(text, entry, voiceOverride) {
   let lastError = null;
   let chosenVoice = (voiceOverride || entry.voice || state.settings.voice || "").trim();
-  const normalizedText = applyPhoneticDictionary(text);
+  const normalizedText = speechRequestText(text);
   const prependSilenceMs = Math.max(MIN_SYNTH_PREPEND_SILENCE_MS, normalizePrependSilenceMs(state.settings.prependSilenceMs));
   for (let attempt = 0; attempt < 2; attempt += 1) {
     const res = await apiFetch(`${getApiBase()}/api/speak`, {
@@ -1652,15 +1774,18 @@ async function synthesizeText(text, entry, voiceOverride) {
         voice: chosenVoice,
         speed: entry.speed,
         prependSilenceMs,
+        timings: true,
       }),
     });
 
     if (res.ok) {
       const data = await res.json();
       const absoluteUrl = absoluteAudioUrl(data.audioUrl);
+      rememberAudioTimings(absoluteUrl, data.timings);
       if (!voiceOverride || voiceOverride === entry.voice) {
         entry.audioUrl = absoluteUrl;
         entry.voice = data.voice || entry.voice;
+        if (entry.pinned) pinEntryAudio(entry);
       }
       return absoluteUrl;
     }
@@ -1677,6 +1802,165 @@ async function synthesizeText(text, entry, voiceOverride) {
   throw lastError || new Error("Speak request failed");
 }
 
+function settleSpeakStreamWaiter(id, method, value) {
+  const waiter = speakStream.waiters.get(id);
+  if (!waiter) return;
+  speakStream.waiters.delete(id);
+  waiter[method](value);
+}
+
+function closeSpeakStream(reason = "speak stream closed") {
+  if (speakStream.source) speakStream.source.close();
+  speakStream.source = null;
+  speakStream.sessionId = "";
+  Array.from(speakStream.waiters.keys()).forEach((id) => settleSpeakStreamWaiter(id, "reject", new Error(reason)));
+}
+
+async function ensureSpeakStream() {
+  const base = getApiBase();
+  if (typeof EventSource === "undefined" || speakStream.unsupportedBase === base) {
+    throw new Error("speak stream unavailable");
+  }
+  if (speakStream.source && speakStream.base === base && speakStream.source.readyState !== EventSource.CLOSED) {
+    return speakStream.sessionId;
+  }
+  if (speakStream.opening) return speakStream.opening;
+
+  speakStream.opening = (async () => {
+    closeSpeakStream();
+    const res = await apiFetch(`${base}/api/stream/sessions`, { method: "POST" });
+    if (!res.ok) {
+      if (res.status === 404 || res.status === 405) speakStream.unsupportedBase = base;
+      throw new Error(`Speak stream failed (${res.status})`);
+    }
+    const data = await res.json();
+    const source = new EventSource(`${base}${data.eventsUrl}`);
+    source.addEventListener("audio", (ev) => {
+      const payload = JSON.parse(ev.data);
+      const url = absoluteAudioUrl(payload.audioUrl);
+      rememberAudioTimings(url, payload.timings);
+      settleSpeakStreamWaiter(payload.id, "resolve", { url, voice: payload.voice });
+    });
+    source.addEventListener("failed", (ev) => {
+      const payload = JSON.parse(ev.data);
+      settleSpeakStreamWaiter(payload.id, "reject", new Error(payload.error || "Speak request failed"));
+    });
+    source.addEventListener("canceled", (ev) => {
+      const payload = JSON.parse(ev.data);
+      settleSpeakStreamWaiter(payload.id, "reject", new Error("segment canceled"));
+    });
+    source.addEventListener("error", () => {
+      // EventSource reconnects on its own; a CLOSED state means the session is gone.
+      if (source.readyState === EventSource.CLOSED && speakStream.source === source) {
+        closeSpeakStream("speak stream disconnected");
+      }
+    });
+    await new Promise((resolve, reject) => {
+      source.addEventListener("ready", resolve, { once: true });
+      source.addEventListener("error", () => reject(new Error("speak stream connection failed")), { once: true });
+    });
+    speakStream.source = source;
+    speakStream.base = base;
+    speakStream.sessionId = data.sessionId;
+    return data.sessionId;
+  })();
+  try {
+    return await speakStream.opening;
+  } finally {
+    speakStream.opening = null;
+  }
+}
+
+async function streamSynthesizeSegments(entry, segments) {
+  const sessionId = await ensureSpeakStream();
+  const prependSilenceMs = Math.max(MIN_SYNTH_PREPEND_SILENCE_MS, normalizePrependSilenceMs(state.settings.prependSilenceMs));
+  const payload = segments.map((segment) => ({
+    id: `${entry.id}-${uid()}`,
+    text: speechRequestText(segment.text),
+    voice: segment.voice,
+    speed: entry.speed,
+    prependSilenceMs,
+  }));
+  const promises = payload.map(
+    (item) =>
+      new Promise((resolve, reject) => {
+        speakStream.waiters.set(item.id, { resolve, reject });
+      })
+  );
+  // Segments that get canceled are never awaited; keep their rejections quiet.
+  promises.forEach((promise) => promise.catch(() => {}));
+  const res = await apiFetch(`${getApiBase()}/api/stream/sessions/${encodeURIComponent(sessionId)}/segments`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ segments: payload, timings: true }),
+  });
+  if (!res.ok) {
+    payload.forEach((item) => settleSpeakStreamWaiter(item.id, "reject", new Error(`Speak stream failed (${res.status})`)));
+    if (res.status === 404) closeSpeakStream("speak stream expired");
+    throw new Error(`Speak stream failed (${res.status})`);
+  }
+  return { ids: payload.map((item) => item.id), promises };
+}
+
+function upcomingPrefetchSegments(id) {
+  const start = indexById(id);
+  if (start < 0) return [];
+  const prependSilenceMs = Math.max(MIN_SYNTH_PREPEND_SILENCE_MS, normalizePrependSilenceMs(state.settings.prependSilenceMs));
+  const out = [];
+  state.history.slice(start + 1, start + 1 + PREFETCH_AHEAD_ENTRIES).forEach((entry) => {
+    const segments = parseVoiceSegments(entry.text);
+    const shouldUseSegments =
+      segments.length > 1 || (segments[0] && segments[0].voice && segments[0].voice !== entry.voice);
+    if (!shouldUseSegments && entry.audioUrl) return;
+    // Mirror the exact text/voice/speed playback will request so the server cache key matches.
+    const parts = shouldUseSegments
+      ? segments.map((segment) => ({ text: segment.text, voice: segment.voice }))
+      : [{ text: entry.text, voice: (entry.voice || state.settings.voice || "").trim() }];
+    parts.forEach((part) => {
+      out.push({ text: speechRequestText(part.text), voice: part.voice, speed: entry.speed, prependSilenceMs });
+    });
+  });
+  return out;
+}
+
+async function prefetchUpcomingEntries(id) {
+  const segments = upcomingPrefetchSegments(id);
+  if (!segments.length) {
+    cancelPrefetch();
+    return;
+  }
+  try {
+    const res = await apiFetch(`${getApiBase()}/api/prefetch`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ segments }),
+    });
+    if (!res.ok) return;
+    const data = await res.json();
+    activePrefetchId = data.prefetchId || "";
+  } catch (_err) {
+    // Prefetch is an optimization only.
+  }
+}
+
+function cancelPrefetch() {
+  if (!activePrefetchId) return;
+  const prefetchId = activePrefetchId;
+  activePrefetchId = "";
+  apiFetch(`${getApiBase()}/api/prefetch/${encodeURIComponent(prefetchId)}`, { method: "DELETE" }).catch(() => {});
+}
+
+function cancelSpeakStreamSegments(ids = null) {
+  const pendingIds = (ids || Array.from(speakStream.waiters.keys())).filter((id) => speakStream.waiters.has(id));
+  if (!pendingIds.length || !speakStream.sessionId) return;
+  pendingIds.forEach((id) => settleSpeakStreamWaiter(id, "reject", new Error("segment canceled")));
+  apiFetch(`${getApiBase()}/api/stream/sessions/${encodeURIComponent(speakStream.sessionId)}/cancel`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ ids: pendingIds }),
+  }).catch(() => {});
+}
+
 function clearWordHighlights() {
   state.history.forEach((item) => {
     delete item.wordIndex;
@@ -1705,6 +1989,9 @@ async function playEntryNow(id) {
   const isCanceled = () => playbackToken !== state.playbackToken;
 
   setLoading(true);
+  prefetchUpcomingEntries(id);
+  // Uses cached advice for this playback (no extra round-trip); refreshed for the next one.
+  refreshChunkAdvice([resolveNarratorVoice()]);
   try {
     const segments = parseVoiceSegments(entry.text);
     const shouldUseSegments =
@@ -1714,12 +2001,30 @@ async function playEntryNow(id) {
       state.segmentedPlaybackActive = true;
       entry.segmentAudioSegments = new Array(segments.length);
 
+      // Queue every segment on the persistent speak stream so the server renders them back-to-back.
+      let streamed = null;
+      try {
+        streamed = await streamSynthesizeSegments(entry, segments);
+      } catch (_err) {
+        streamed = null;
+      }
+
       const synthPromises = new Array(segments.length);
       const ensureSegmentSynthesis = (index) => {
         if (index < 0 || index >= segments.length) return Promise.resolve("");
         if (synthPromises[index]) return synthPromises[index];
         const segment = segments[index];
-        synthPromises[index] = synthesizeText(segment.text, entry, segment.voice).then((segmentUrl) => {
+        const direct = () => synthesizeText(segment.text, entry, segment.voice);
+        const pending = streamed
+          ? streamed.promises[index].then(
+              (result) => result.url,
+              (err) => {
+                if (isCanceled()) throw err;
+                return direct();
+              }
+            )
+          : direct();
+        synthPromises[index] = pending.then((segmentUrl) => {
           entry.segmentAudioSegments[index] = { url: segmentUrl, voice: segment.voice, text: segment.text };
           saveHistory();
           render();
@@ -1759,10 +2064,11 @@ async function playEntryNow(id) {
         });
         audio.addEventListener("timeupdate", () => {
           if (!lineWords.length || !totalWords) return;
-          const localIdx = Math.min(
-            lineWords.length - 1,
-            Math.floor((audio.currentTime + interval * 0.35) / interval)
-          );
+          const timedIdx = timedWordIndex(segmentUrl, lineWords, audio.currentTime * 1000);
+          const localIdx =
+            timedIdx >= 0
+              ? timedIdx
+              : Math.min(lineWords.length - 1, Math.floor((audio.currentTime + interval * 0.35) / interval));
           entry.wordIndex = Math.min(totalWords - 1, consumedWords + localIdx);
           render();
         });
@@ -1789,6 +2095,7 @@ async function playEntryNow(id) {
           }
         }
       }
+      if (streamed) cancelSpeakStreamSegments(streamed.ids);
       visualizer.classList.remove("active");
       state.currentAudio = null;
       state.activePlaybackId = null;
@@ -1821,7 +2128,11 @@ async function playEntryNow(id) {
 
     audio.addEventListener("timeupdate", () => {
       if (!words.length) return;
-      const idx = Math.min(words.length - 1, Math.floor((audio.currentTime + interval * 0.35) / interval));
+      const timedIdx = timedWordIndex(entry.audioUrl, words, audio.currentTime * 1000);
+      const idx =
+        timedIdx >= 0
+          ? timedIdx
+          : Math.min(words.length - 1, Math.floor((audio.currentTime + interval * 0.35) / interval));
       entry.wordIndex = idx;
       render();
     });
@@ -1936,6 +2247,17 @@ function togglePin(id) {
   entry.pinned = !entry.pinned;
   saveHistory();
   render();
+  if (entry.pinned) pinEntryAudio(entry);
+}
+
+function pinEntryAudio(entry) {
+  // Servers with an ephemeral audio ring only keep pinned clips on disk.
+  const audioRef = parseAudioReference(entry.audioUrl);
+  if (!audioRef.filename || !audioRef.token) return;
+  apiFetch(
+    `${getApiBase()}/api/audio/${encodeURIComponent(audioRef.filename)}/pin?token=${encodeURIComponent(audioRef.token)}`,
+    { method: "POST" }
+  ).catch(() => {});
 }
 
 function deleteEntry(id) {
@@ -1949,6 +2271,63 @@ function deleteEntry(id) {
   render();
 }
 
+async function exportHistory(mode) {
+  // One request and one encode for the whole history; entries never synthesized have no audio to export.
+  const entries = state.history.filter((entry) => {
+    const ref = parseAudioReference(entry.audioUrl);
+    return ref.filename && ref.token;
+  });
+  if (!entries.length) {
+    alert("No generated audio to export yet.");
+    return;
+  }
+  const format = mode === "zip" ? "wav" : normalizeDownloadFormat(state.settings.downloadFormat);
+  const options = { mode, format, gapMs: 500, chapters: true };
+
+  setLoading(true);
+  try {
+    // Exporting by history id lets entries older than the audio URL lifetime through; the server
+    // only knows ids for history this client has synced.
+    let selection = { ids: entries.map((entry) => entry.id) };
+    const synced = await apiFetch(`${getApiBase()}/api/history`, {
+      method: "PUT",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(state.history),
+    }).catch(() => null);
+    if (!synced || !synced.ok) {
+      selection = {
+        audio: entries.map((entry) => {
+          const ref = parseAudioReference(entry.audioUrl);
+          return { name: ref.filename, token: ref.token, title: entryDisplayText(entry) };
+        }),
+      };
+    }
+    const response = await apiFetch(`${getApiBase()}/api/export`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ ...selection, ...options }),
+    });
+    if (!response.ok) {
+      const body = await response.json().catch(() => ({}));
+      throw new Error(body.error || `Export failed (${response.status})`);
+    }
+
+    const blob = await response.blob();
+    const objectUrl = URL.createObjectURL(blob);
+    const a = document.createElement("a");
+    a.href = objectUrl;
+    a.download = `open-tts-history.${mode === "zip" ? "zip" : format}`;
+    document.body.appendChild(a);
+    a.click();
+    a.remove();
+    URL.revokeObjectURL(objectUrl);
+  } catch (err) {
+    alert(`Could not export history: ${err.message}`);
+  } finally {
+    setLoading(false);
+  }
+}
+
 function deleteAllByPinnedState(shouldDeletePinned) {
   const targetCount = state.history.filter((item) => Boolean(item.pinned) === shouldDeletePinned).length;
   if (!targetCount) return;
@@ -2232,6 +2611,8 @@ function bindEvents() {
   deleteAllPinnedBtn.addEventListener("click", () => {
     deleteAllByPinnedState(true);
   });
+  exportHistoryBtn.addEventListener("click", () => exportHistory("concat"));
+  exportHistoryZipBtn.addEventListener("click", () => exportHistory("zip"));
 
   speedInput.addEventListener("input", updateSpeedLabel);
   refreshModelsBtn.addEventListener("click", async () => {
@@ -2333,6 +2714,7 @@ function bindEvents() {
       state.settings.phoneticDictionary = list;
       persistLocalSettings();
       renderPhoneticDictionary();
+      syncPhoneticDictionary();
     }
     if (phoneticWordInput) phoneticWordInput.value = "";
     if (phoneticReplacementInput) phoneticReplacementInput.value = "";
@@ -2357,6 +2739,7 @@ function bindEvents() {
         state.settings.phoneticDictionary = list;
         persistLocalSettings();
         renderPhoneticDictionary();
+        syncPhoneticDictionary();
       }
       return;
     }